@@ -4,7 +4,7 @@ import asyncio
 from logging.config import fileConfig
 
 from alembic import context
-from sqlalchemy import pool
+from sqlalchemy import event, make_url, pool
 from sqlalchemy.engine import Connection
 from sqlalchemy.ext.asyncio import async_engine_from_config
 
@@ -44,8 +44,16 @@ def run_migrations_offline() -> None:
 
 
 def do_run_migrations(connection: Connection) -> None:
-    """Run migrations with the given connection."""
-    context.configure(connection=connection, target_metadata=target_metadata)
+    """Run migrations with the given connection.
+
+    The whole upgrade runs inside a single transaction, so the DDL of every
+    pending revision is committed once instead of once per statement.
+    """
+    context.configure(
+        connection=connection,
+        target_metadata=target_metadata,
+        transactional_ddl=True,
+    )
 
     with context.begin_transaction():
         context.run_migrations()
@@ -53,12 +61,30 @@ def do_run_migrations(connection: Connection) -> None:
 
 async def run_async_migrations() -> None:
     """Run migrations in 'online' mode with async engine."""
+    connect_args = {}
+    if make_url(config.get_main_option("sqlalchemy.url")).get_driver_name() == "asyncpg":
+        # DDL invalidates asyncpg's cached prepared statements mid-run; don't cache them
+        connect_args = {"statement_cache_size": 0, "prepared_statement_cache_size": 0}
+
     connectable = async_engine_from_config(
         config.get_section(config.config_ini_section, {}),
         prefix="sqlalchemy.",
         poolclass=pool.NullPool,
+        connect_args=connect_args,
     )
 
+    if connectable.dialect.name == "sqlite":
+        # pysqlite/aiosqlite only open a transaction before DML, so each CREATE/ALTER
+        # would otherwise autocommit (and fsync) on its own. Take over BEGIN so the
+        # migration DDL is batched into one transaction.
+        @event.listens_for(connectable.sync_engine, "connect")
+        def _disable_driver_transactions(dbapi_connection, connection_record) -> None:
+            dbapi_connection.isolation_level = None
+
+        @event.listens_for(connectable.sync_engine, "begin")
+        def _emit_begin(conn) -> None:
+            conn.exec_driver_sql("BEGIN")
+
     async with connectable.connect() as connection:
         await connection.run_sync(do_run_migrations)
 
@@ -19,7 +19,11 @@ depends_on: Union[str, Sequence[str], None] = None
 
 
 def upgrade() -> None:
-    # Use batch mode for SQLite compatibility
+    is_postgresql = op.get_context().dialect.name == "postgresql"
+
+    # Use batch mode for SQLite compatibility. Batch operations are collected and
+    # applied on exit, so SQLite rebuilds each table once (not once per op), while
+    # other backends keep recreate="auto" and get plain ALTER TABLE statements.
     with op.batch_alter_table("hypervisors") as batch_op:
         # Add new Proxmox-specific columns
         batch_op.add_column(
@@ -54,13 +58,36 @@ def upgrade() -> None:
             ["id"],
         )
 
-        # Create index on vmid for faster lookups
-        batch_op.create_index("ix_virtual_machines_vmid", ["vmid"])
+        # Create index on vmid for faster lookups (Postgres builds it concurrently below)
+        if not is_postgresql:
+            batch_op.create_index("ix_virtual_machines_vmid", ["vmid"])
+
+    if is_postgresql:
+        # CONCURRENTLY avoids locking out writes on a populated table, but can't run
+        # inside the migration transaction
+        with op.get_context().autocommit_block():
+            op.create_index(
+                "ix_virtual_machines_vmid",
+                "virtual_machines",
+                ["vmid"],
+                postgresql_concurrently=True,
+            )
 
 
 def downgrade() -> None:
+    is_postgresql = op.get_context().dialect.name == "postgresql"
+
+    if is_postgresql:
+        with op.get_context().autocommit_block():
+            op.drop_index(
+                "ix_virtual_machines_vmid",
+                table_name="virtual_machines",
+                postgresql_concurrently=True,
+            )
+
     with op.batch_alter_table("virtual_machines") as batch_op:
-        batch_op.drop_index("ix_virtual_machines_vmid")
+        if not is_postgresql:
+            batch_op.drop_index("ix_virtual_machines_vmid")
         batch_op.drop_constraint("fk_virtual_machines_host_id", type_="foreignkey")
         batch_op.drop_column("disk_gb")
         batch_op.drop_column("tags")
@@ -0,0 +1,28 @@
+"""Placeholder for a dropped session lookup index.
+
+The per-request "id = ? AND expires_at > ?" lookup is one primary key seek,
+and on SQLite the WITHOUT ROWID key (007) holds expires_at too, so an
+(id, expires_at) index only added write cost. The revision is kept so the
+chain stays intact.
+
+Revision ID: 003_session_lookup_index
+Revises: 002_proxmox_support
+Create Date: 2026-10-14 00:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+# revision identifiers, used by Alembic.
+revision: str = "003_session_lookup_index"
+down_revision: Union[str, None] = "002_proxmox_support"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    pass
+
+
+def downgrade() -> None:
+    pass
@@ -0,0 +1,25 @@
+"""Add index for expired session cleanup.
+
+Revision ID: 004_session_expiry_index
+Revises: 003_session_lookup_index
+Create Date: 2026-10-14 00:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "004_session_expiry_index"
+down_revision: Union[str, None] = "003_session_lookup_index"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index("ix_sessions_expires_at", "sessions", ["expires_at"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_sessions_expires_at", table_name="sessions")
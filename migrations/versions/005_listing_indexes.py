@@ -0,0 +1,48 @@
+"""Add indexes for host, VM and audit log listing.
+
+Revision ID: 005_listing_indexes
+Revises: 004_session_expiry_index
+Create Date: 2026-10-14 00:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "005_listing_indexes"
+down_revision: Union[str, None] = "004_session_expiry_index"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (index name, table, columns)
+INDEXES = [
+    ("ix_hosts_location_status_last_seen", "hosts", ["location_id", "status", "last_seen"]),
+    ("ix_hosts_status_last_seen", "hosts", ["status", "last_seen"]),
+    ("ix_virtual_machines_hypervisor_state", "virtual_machines", ["hypervisor_id", "state"]),
+    ("ix_audit_log_timestamp", "audit_log", ["timestamp"]),
+    ("ix_audit_log_user_timestamp", "audit_log", ["user_id", "timestamp"]),
+]
+
+
+def upgrade() -> None:
+    if op.get_context().dialect.name == "postgresql":
+        # CONCURRENTLY avoids locking out writes on populated tables, but can't run
+        # inside the migration transaction
+        with op.get_context().autocommit_block():
+            for name, table, columns in INDEXES:
+                op.create_index(name, table, columns, postgresql_concurrently=True)
+    else:
+        for name, table, columns in INDEXES:
+            op.create_index(name, table, columns)
+
+
+def downgrade() -> None:
+    if op.get_context().dialect.name == "postgresql":
+        with op.get_context().autocommit_block():
+            for name, table, _ in reversed(INDEXES):
+                op.drop_index(name, table_name=table, postgresql_concurrently=True)
+    else:
+        for name, table, _ in reversed(INDEXES):
+            op.drop_index(name, table_name=table)
@@ -0,0 +1,108 @@
+"""Move VM MAC addresses and tags into child tables.
+
+Revision ID: 006_vm_mac_and_tag_tables
+Revises: 005_listing_indexes
+Create Date: 2026-10-14 00:00:00.000000
+
+"""
+
+import json
+import re
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "006_vm_mac_and_tag_tables"
+down_revision: Union[str, None] = "005_listing_indexes"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TAG_SPLIT_RE = re.compile(r"[;,\s]+")
+
+
+def upgrade() -> None:
+    mac_table = op.create_table(
+        "vm_mac_addresses",
+        sa.Column("id", sa.Integer, primary_key=True, autoincrement=True),
+        sa.Column(
+            "vm_id",
+            sa.Integer,
+            sa.ForeignKey("virtual_machines.id", ondelete="CASCADE"),
+            nullable=False,
+        ),
+        sa.Column("mac_address", sa.String(17), nullable=False),
+    )
+    op.create_index("ix_vm_mac_addresses_vm_id", "vm_mac_addresses", ["vm_id"])
+    op.create_index("ix_vm_mac_addresses_mac_address", "vm_mac_addresses", ["mac_address"])
+
+    tag_table = op.create_table(
+        "vm_tags",
+        sa.Column(
+            "vm_id",
+            sa.Integer,
+            sa.ForeignKey("virtual_machines.id", ondelete="CASCADE"),
+            primary_key=True,
+        ),
+        sa.Column("tag", sa.String(100), primary_key=True),
+    )
+    op.create_index("ix_vm_tags_tag", "vm_tags", ["tag"])
+
+    # Parse the old JSON/delimited columns once
+    bind = op.get_bind()
+    rows = bind.execute(sa.text("SELECT id, mac_addresses, tags FROM virtual_machines")).all()
+    mac_rows = []
+    tag_rows = []
+    for vm_id, mac_json, tags in rows:
+        try:
+            macs = json.loads(mac_json) if mac_json else []
+        except ValueError:
+            macs = []
+        mac_rows.extend({"vm_id": vm_id, "mac_address": mac} for mac in macs)
+
+        unique_tags = dict.fromkeys(tag for tag in TAG_SPLIT_RE.split(tags or "") if tag)
+        tag_rows.extend({"vm_id": vm_id, "tag": tag} for tag in unique_tags)
+
+    if mac_rows:
+        op.bulk_insert(mac_table, mac_rows)
+    if tag_rows:
+        op.bulk_insert(tag_table, tag_rows)
+
+    with op.batch_alter_table("virtual_machines") as batch_op:
+        batch_op.drop_column("tags")
+        batch_op.drop_column("mac_addresses")
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("virtual_machines") as batch_op:
+        batch_op.add_column(sa.Column("mac_addresses", sa.Text, nullable=True))
+        batch_op.add_column(sa.Column("tags", sa.Text, nullable=True))
+
+    bind = op.get_bind()
+    macs_by_vm: dict[int, list[str]] = {}
+    for vm_id, mac in bind.execute(
+        sa.text("SELECT vm_id, mac_address FROM vm_mac_addresses ORDER BY id")
+    ):
+        macs_by_vm.setdefault(vm_id, []).append(mac)
+    tags_by_vm: dict[int, list[str]] = {}
+    for vm_id, tag in bind.execute(sa.text("SELECT vm_id, tag FROM vm_tags ORDER BY tag")):
+        tags_by_vm.setdefault(vm_id, []).append(tag)
+
+    for vm_id in macs_by_vm.keys() | tags_by_vm.keys():
+        bind.execute(
+            sa.text(
+                "UPDATE virtual_machines SET mac_addresses = :macs, tags = :tags WHERE id = :id"
+            ),
+            {
+                "id": vm_id,
+                "macs": json.dumps(macs_by_vm[vm_id]) if vm_id in macs_by_vm else None,
+                "tags": ";".join(tags_by_vm[vm_id]) if vm_id in tags_by_vm else None,
+            },
+        )
+
+    op.drop_index("ix_vm_tags_tag", table_name="vm_tags")
+    op.drop_table("vm_tags")
+    op.drop_index("ix_vm_mac_addresses_mac_address", table_name="vm_mac_addresses")
+    op.drop_index("ix_vm_mac_addresses_vm_id", table_name="vm_mac_addresses")
+    op.drop_table("vm_mac_addresses")
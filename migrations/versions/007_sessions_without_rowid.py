@@ -0,0 +1,39 @@
+"""Store sessions as a WITHOUT ROWID table on SQLite.
+
+Revision ID: 007_sessions_without_rowid
+Revises: 006_vm_mac_and_tag_tables
+Create Date: 2026-10-14 00:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "007_sessions_without_rowid"
+down_revision: Union[str, None] = "006_vm_mac_and_tag_tables"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Rowid storage is SQLite-specific; other databases need no change
+    if op.get_context().dialect.name != "sqlite":
+        return
+
+    # SQLite can't convert a table in place, so copy it into a rebuilt one
+    with op.batch_alter_table(
+        "sessions", recreate="always", table_kwargs={"sqlite_with_rowid": False}
+    ):
+        pass
+
+
+def downgrade() -> None:
+    if op.get_context().dialect.name != "sqlite":
+        return
+
+    with op.batch_alter_table(
+        "sessions", recreate="always", table_kwargs={"sqlite_with_rowid": True}
+    ):
+        pass
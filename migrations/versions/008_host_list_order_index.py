@@ -0,0 +1,45 @@
+"""Add an index matching the full host list order.
+
+Revision ID: 008_host_list_order_index
+Revises: 007_sessions_without_rowid
+Create Date: 2026-10-14 00:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "008_host_list_order_index"
+down_revision: Union[str, None] = "007_sessions_without_rowid"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    if op.get_context().dialect.name == "postgresql":
+        # CONCURRENTLY can't run inside the migration transaction
+        with op.get_context().autocommit_block():
+            op.create_index(
+                "ix_hosts_list_order_pg",
+                "hosts",
+                [sa.text("last_seen DESC NULLS LAST"), sa.text("hostname NULLS LAST"), "id"],
+                postgresql_concurrently=True,
+            )
+    else:
+        # SQLite rejects NULLS placement in an index, but DESC already sorts NULLs last
+        op.create_index(
+            "ix_hosts_list_order", "hosts", [sa.text("last_seen DESC"), "hostname", "id"]
+        )
+
+
+def downgrade() -> None:
+    if op.get_context().dialect.name == "postgresql":
+        with op.get_context().autocommit_block():
+            op.drop_index(
+                "ix_hosts_list_order_pg", table_name="hosts", postgresql_concurrently=True
+            )
+    else:
+        op.drop_index("ix_hosts_list_order", table_name="hosts")
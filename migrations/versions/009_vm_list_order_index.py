@@ -0,0 +1,43 @@
+"""Add an index matching the VM list order.
+
+Revision ID: 009_vm_list_order_index
+Revises: 008_host_list_order_index
+Create Date: 2026-10-14 00:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "009_vm_list_order_index"
+down_revision: Union[str, None] = "008_host_list_order_index"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    if op.get_context().dialect.name == "postgresql":
+        # CONCURRENTLY can't run inside the migration transaction
+        with op.get_context().autocommit_block():
+            op.create_index(
+                "ix_virtual_machines_name_id",
+                "virtual_machines",
+                ["name", "id"],
+                postgresql_concurrently=True,
+            )
+    else:
+        op.create_index("ix_virtual_machines_name_id", "virtual_machines", ["name", "id"])
+
+
+def downgrade() -> None:
+    if op.get_context().dialect.name == "postgresql":
+        with op.get_context().autocommit_block():
+            op.drop_index(
+                "ix_virtual_machines_name_id",
+                table_name="virtual_machines",
+                postgresql_concurrently=True,
+            )
+    else:
+        op.drop_index("ix_virtual_machines_name_id", table_name="virtual_machines")
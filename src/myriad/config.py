@@ -1,10 +1,11 @@
 """Configuration loading from TOML files."""
 
+import tomllib
+from functools import cached_property, lru_cache
 from pathlib import Path
 from typing import Any
 
-import toml
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, TypeAdapter
 from pydantic_settings import BaseSettings
 
 
@@ -20,6 +21,14 @@ class DatabaseConfig(BaseModel):
     """Database configuration."""
 
     url: str = "sqlite+aiosqlite:///./myriad.db"
+    query_cache_size: int = 1200  # Compiled SQL statement cache entries per engine
+
+    # Connection pool (server databases only; SQLite keeps SQLAlchemy's default pool)
+    pool_size: int = 20
+    max_overflow: int = 40
+    pool_timeout: int = 30  # Seconds to wait for a free connection
+    pool_recycle: int = 1800  # Seconds before a connection is replaced
+    pool_pre_ping: bool = True
 
 
 class LocationConfig(BaseModel):
@@ -132,60 +141,95 @@ class Settings(BaseSettings):
     # Session configuration
     session_secret_key: str = "change-me-in-production"
     session_expire_hours: int = 24
+    session_cleanup_interval_minutes: int = Field(default=5, gt=0)
+
+    # Password hashing (bcrypt work factor, 2^rounds iterations)
+    bcrypt_rounds: int = Field(default=12, ge=4, le=31)
 
     # Paths
     config_dir: Path = Path("config")
     templates_dir: Path = Path("templates")
     static_dir: Path = Path("static")
+    # Compiled template cache; None uses a per-user directory under the system temp dir
+    templates_cache_dir: Path | None = None
 
     model_config = {"extra": "ignore"}
 
+    @cached_property
+    def session_max_age_seconds(self) -> int:
+        """Session cookie lifetime in seconds."""
+        return self.session_expire_hours * 3600
+
+    @cached_property
+    def integrations_summary(self) -> dict[str, int]:
+        """Configured integration counts shown on the dashboard."""
+        return {
+            "opnsense": len(self.integrations.opnsense),
+            "unifi": len(self.integrations.unifi),
+        }
+
+
+# Validate whole TOML sections in one pydantic-core call instead of one per entry
+_LOCATION_LIST = TypeAdapter(list[LocationConfig])
+_HYPERVISOR_LIST = TypeAdapter(list[HypervisorConfig])
+_OPNSENSE_CONFIG_LIST = TypeAdapter(list[OPNsenseIntegrationConfig])
+_UNIFI_CONFIG_LIST = TypeAdapter(list[UnifiIntegrationConfig])
+_PROXMOX_CONFIG_LIST = TypeAdapter(list[ProxmoxIntegrationConfig])
+_OPNSENSE_CREDENTIALS_MAP = TypeAdapter(dict[str, OPNsenseCredentials])
+_UNIFI_CREDENTIALS_MAP = TypeAdapter(dict[str, UnifiCredentials])
+_SSH_KEY_MAP = TypeAdapter(dict[str, SSHKeyConfig])
+_PROXMOX_CREDENTIALS_MAP = TypeAdapter(dict[str, ProxmoxCredentials])
+
+
+def _mtime_ns(path: Path) -> int | None:
+    """Get a file's modification time in nanoseconds, or None if it doesn't exist."""
+    try:
+        return path.stat().st_mtime_ns
+    except FileNotFoundError:
+        return None
+
+
+@lru_cache(maxsize=8)
+def _parse_toml_file(path_str: str, mtime_ns: int) -> dict[str, Any]:
+    """Parse a TOML file, cached by path and modification time."""
+    with open(path_str, "rb") as f:
+        return tomllib.load(f)
+
 
 def load_toml_file(path: Path) -> dict[str, Any]:
-    """Load a TOML file, returning empty dict if not found."""
-    if path.exists():
-        return toml.load(path)
-    return {}
+    """Load a TOML file, returning empty dict if not found.
+
+    Parsed files are cached until their modification time changes. The returned
+    dict is a shallow copy, so top-level keys may be popped but nested values
+    must not be mutated.
+    """
+    return _read_toml_file(path, _mtime_ns(path))
+
+
+def _read_toml_file(path: Path, mtime_ns: int | None) -> dict[str, Any]:
+    """Load a TOML file whose mtime the caller already has (None if missing)."""
+    if mtime_ns is None:
+        return {}
+    return dict(_parse_toml_file(str(path), mtime_ns))
 
 
 def parse_secrets(secrets_data: dict[str, Any]) -> SecretsConfig:
     """Parse secrets data into SecretsConfig."""
-    opnsense_creds = {}
-    unifi_creds = {}
-    ssh_keys = {}
-    proxmox_creds = {}
-
-    # Parse OPNsense credentials
-    if "opnsense" in secrets_data:
-        for key, value in secrets_data["opnsense"].items():
-            opnsense_creds[key] = OPNsenseCredentials(**value)
-
-    # Parse Unifi credentials
-    if "unifi" in secrets_data:
-        for key, value in secrets_data["unifi"].items():
-            unifi_creds[key] = UnifiCredentials(**value)
-
-    # Parse SSH keys
-    if "ssh" in secrets_data:
-        for key, value in secrets_data["ssh"].items():
-            ssh_keys[key] = SSHKeyConfig(**value)
-
-    # Parse Proxmox credentials
-    if "proxmox" in secrets_data:
-        for key, value in secrets_data["proxmox"].items():
-            proxmox_creds[key] = ProxmoxCredentials(**value)
-
-    return SecretsConfig(
-        opnsense=opnsense_creds,
-        unifi=unifi_creds,
-        ssh=ssh_keys,
-        proxmox=proxmox_creds,
+    # Credentials are validated per section; skip re-walking them in SecretsConfig
+    return SecretsConfig.model_construct(
+        opnsense=_OPNSENSE_CREDENTIALS_MAP.validate_python(secrets_data.get("opnsense", {})),
+        unifi=_UNIFI_CREDENTIALS_MAP.validate_python(secrets_data.get("unifi", {})),
+        ssh=_SSH_KEY_MAP.validate_python(secrets_data.get("ssh", {})),
+        proxmox=_PROXMOX_CREDENTIALS_MAP.validate_python(secrets_data.get("proxmox", {})),
     )
 
 
 def load_settings(config_dir: Path | None = None) -> Settings:
     """Load settings from TOML configuration files.
 
+    Results are cached until myriad.toml or secrets.toml changes on disk; call
+    invalidate_settings_cache() to force a reload.
+
     Args:
         config_dir: Path to configuration directory. Defaults to ./config
 
@@ -198,24 +242,36 @@ def load_settings(config_dir: Path | None = None) -> Settings:
     config_path = config_dir / "myriad.toml"
     secrets_path = config_dir / "secrets.toml"
 
-    config_data = load_toml_file(config_path)
-    secrets_data = load_toml_file(secrets_path)
+    return _load_settings_cached(config_dir, _mtime_ns(config_path), _mtime_ns(secrets_path))
+
+
+@lru_cache(maxsize=8)
+def _load_settings_cached(
+    config_dir: Path,
+    config_mtime_ns: int | None,
+    secrets_mtime_ns: int | None,
+) -> Settings:
+    """Build Settings for a config directory, cached by the files' modification times."""
+    config_path = config_dir / "myriad.toml"
+    secrets_path = config_dir / "secrets.toml"
+
+    # Reuse the mtimes from the cache key rather than stat()ing each file again
+    config_data = _read_toml_file(config_path, config_mtime_ns)
+    secrets_data = _read_toml_file(secrets_path, secrets_mtime_ns)
 
-    # Parse integrations if present
+    # Parse integrations if present (entries are validated individually)
     integrations_data = config_data.pop("integrations", {})
-    integrations = IntegrationsConfig(
-        opnsense=[
-            OPNsenseIntegrationConfig(**item) for item in integrations_data.get("opnsense", [])
-        ],
-        unifi=[UnifiIntegrationConfig(**item) for item in integrations_data.get("unifi", [])],
-        proxmox=[ProxmoxIntegrationConfig(**item) for item in integrations_data.get("proxmox", [])],
+    integrations = IntegrationsConfig.model_construct(
+        opnsense=_OPNSENSE_CONFIG_LIST.validate_python(integrations_data.get("opnsense", [])),
+        unifi=_UNIFI_CONFIG_LIST.validate_python(integrations_data.get("unifi", [])),
+        proxmox=_PROXMOX_CONFIG_LIST.validate_python(integrations_data.get("proxmox", [])),
     )
 
     # Parse locations if present
-    locations = [LocationConfig(**loc) for loc in config_data.pop("locations", [])]
+    locations = _LOCATION_LIST.validate_python(config_data.pop("locations", []))
 
     # Parse hypervisors if present
-    hypervisors = [HypervisorConfig(**hv) for hv in config_data.pop("hypervisors", [])]
+    hypervisors = _HYPERVISOR_LIST.validate_python(config_data.pop("hypervisors", []))
 
     # Parse secrets
     secrets = parse_secrets(secrets_data)
@@ -230,6 +286,12 @@ def load_settings(config_dir: Path | None = None) -> Settings:
     )
 
 
+def invalidate_settings_cache() -> None:
+    """Drop cached TOML files and Settings so the next load re-reads from disk."""
+    _parse_toml_file.cache_clear()
+    _load_settings_cached.cache_clear()
+
+
 # Global settings instance
 _settings: Settings | None = None
 
@@ -243,7 +305,13 @@ def get_settings() -> Settings:
 
 
 def init_settings(config_dir: Path | None = None) -> Settings:
-    """Initialize settings from a specific config directory."""
+    """Initialize settings from a specific config directory.
+
+    Always re-reads the files, and keeps a private copy so that overrides
+    applied to the app's settings (e.g. --debug) don't leak into the cache
+    shared by later load_settings() calls.
+    """
     global _settings
-    _settings = load_settings(config_dir)
+    invalidate_settings_cache()
+    _settings = load_settings(config_dir).model_copy(deep=True)
     return _settings
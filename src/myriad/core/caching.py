@@ -0,0 +1,148 @@
+"""Conditional GET support for cacheable read-only endpoints."""
+
+import hashlib
+from datetime import UTC, datetime
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Protocol
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.requests import Request
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+# Cache-Control values endpoints opt in with. Tables revalidate on every
+# request so a refresh right after a sync never shows stale rows; the small
+# JSON endpoints tolerate a few seconds of staleness.
+CACHE_REVALIDATE = "private, no-cache"
+CACHE_SHORT = "private, max-age=5"
+
+
+def make_etag(body: bytes) -> str:
+    """Build a strong ETag from the response body."""
+    return f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+
+
+def etag_matches(etag: str, if_none_match: str) -> bool:
+    """Check an ETag against an If-None-Match header (weak comparison)."""
+    candidates = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    return "*" in candidates or etag in candidates
+
+
+class Timestamped(Protocol):
+    """A row carrying TimestampMixin's updated_at."""
+
+    updated_at: datetime
+
+
+def _as_utc(value: datetime) -> datetime:
+    """Treat naive database timestamps as UTC (what utc_now() stores)."""
+    return value.replace(tzinfo=UTC) if value.tzinfo is None else value.astimezone(UTC)
+
+
+def latest_update(*rows: Timestamped | None) -> datetime:
+    """Most recent updated_at among the rows a page renders."""
+    return max(_as_utc(row.updated_at) for row in rows if row is not None)
+
+
+def http_date(value: datetime) -> str:
+    """Format a timestamp for a Last-Modified header."""
+    return format_datetime(_as_utc(value), usegmt=True)
+
+
+def timestamp_etag(*rows: Timestamped | None) -> str:
+    """Build a strong ETag from the full-precision updated_at of a page's rows.
+
+    Sent next to Last-Modified, whose whole seconds can't tell apart two edits
+    made within the same second.
+    """
+    stamps = ",".join("" if row is None else _as_utc(row.updated_at).isoformat() for row in rows)
+    return make_etag(stamps.encode())
+
+
+def not_modified(request: Request, etag: str, last_modified: datetime) -> bool:
+    """Check a page's validators against the request's conditional headers.
+
+    If-None-Match takes precedence; If-Modified-Since is only consulted for
+    clients that didn't send one.
+    """
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match:
+        return etag_matches(etag, if_none_match)
+    return not_modified_since(request, last_modified)
+
+
+def not_modified_since(request: Request, last_modified: datetime) -> bool:
+    """Check If-Modified-Since against a page's last modification time.
+
+    Per RFC 9110 the header is ignored when If-None-Match is present, and
+    HTTP dates only carry whole seconds.
+    """
+    header = request.headers.get("if-modified-since")
+    if not header or "if-none-match" in request.headers:
+        return False
+    try:
+        since = parsedate_to_datetime(header)
+    except (TypeError, ValueError):
+        return False
+    return _as_utc(last_modified).replace(microsecond=0) <= _as_utc(since)
+
+
+class ConditionalGetMiddleware:
+    """Add ETags to cacheable GET responses and answer 304 when they match.
+
+    Only successful GET responses that already carry a Cache-Control header
+    (and no ETag or Last-Modified validator of their own) are buffered, so
+    endpoints opt in by setting one of the CACHE_* values. A 304 saves the
+    transfer and the HTMX swap.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["method"] != "GET":
+            await self.app(scope, receive, send)
+            return
+
+        if_none_match = Headers(scope=scope).get("if-none-match")
+        start_message: Message | None = None
+        chunks: list[bytes] = []
+
+        async def send_with_etag(message: Message) -> None:
+            nonlocal start_message
+            if message["type"] == "http.response.start":
+                headers = Headers(raw=message["headers"])
+                if (
+                    message["status"] == 200
+                    and "cache-control" in headers
+                    and "etag" not in headers
+                    and "last-modified" not in headers
+                ):
+                    start_message = message
+                    return
+                await send(message)
+                return
+
+            if start_message is None or message["type"] != "http.response.body":
+                await send(message)
+                return
+
+            chunks.append(message.get("body", b""))
+            if message.get("more_body", False):
+                return
+
+            body = b"".join(chunks)
+            etag = make_etag(body)
+            headers = MutableHeaders(scope=start_message)
+            headers["ETag"] = etag
+
+            if if_none_match and etag_matches(etag, if_none_match):
+                del headers["content-length"]
+                del headers["content-type"]
+                await send({**start_message, "status": 304})
+                await send({"type": "http.response.body", "body": b""})
+                return
+
+            await send(start_message)
+            await send({"type": "http.response.body", "body": body})
+
+        await self.app(scope, receive, send_with_etag)
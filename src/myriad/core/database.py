@@ -2,9 +2,18 @@
 
 from collections.abc import AsyncGenerator
 from contextlib import asynccontextmanager
-
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from functools import cache
+
+from sqlalchemy import event, make_url
+from sqlalchemy.engine.interfaces import DBAPIConnection
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
 from sqlalchemy.orm import DeclarativeBase
+from sqlalchemy.pool import ConnectionPoolEntry
 
 from myriad.config import get_settings
 
@@ -15,34 +24,64 @@ class Base(DeclarativeBase):
     pass
 
 
-# Engine and session factory (initialized on startup)
-_engine = None
-_async_session_factory = None
-
-
-def get_engine():
-    """Get the database engine, creating it if necessary."""
-    global _engine
-    if _engine is None:
-        settings = get_settings()
-        _engine = create_async_engine(
-            settings.database.url,
-            echo=settings.server.debug,
-        )
-    return _engine
-
-
+# Applied to every new SQLite connection. WAL lets readers proceed during writes and,
+# with synchronous=NORMAL, avoids an fsync per commit; the rest keep temp tables and
+# hot pages in memory.
+SQLITE_PRAGMAS = {
+    "journal_mode": "WAL",
+    "synchronous": "NORMAL",
+    "temp_store": "MEMORY",
+    "cache_size": -16000,  # KiB (16 MB)
+    "mmap_size": 268435456,  # 256 MB
+}
+
+
+def _set_sqlite_pragmas(
+    dbapi_connection: DBAPIConnection, connection_record: ConnectionPoolEntry
+) -> None:
+    """Tune a freshly opened SQLite connection."""
+    cursor = dbapi_connection.cursor()
+    for name, value in SQLITE_PRAGMAS.items():
+        cursor.execute(f"PRAGMA {name}={value}")
+    cursor.close()
+
+
+@cache
+def get_engine() -> AsyncEngine:
+    """Get the database engine, creating it on first use."""
+    settings = get_settings()
+    db_config = settings.database
+    is_sqlite = make_url(db_config.url).get_backend_name() == "sqlite"
+
+    pool_kwargs = {}
+    if not is_sqlite:
+        pool_kwargs = {
+            "pool_size": db_config.pool_size,
+            "max_overflow": db_config.max_overflow,
+            "pool_timeout": db_config.pool_timeout,
+            "pool_recycle": db_config.pool_recycle,
+            "pool_pre_ping": db_config.pool_pre_ping,
+        }
+
+    engine = create_async_engine(
+        db_config.url,
+        echo=settings.server.debug,
+        query_cache_size=db_config.query_cache_size,
+        **pool_kwargs,
+    )
+    if is_sqlite:
+        event.listen(engine.sync_engine, "connect", _set_sqlite_pragmas)
+    return engine
+
+
+@cache
 def get_session_factory() -> async_sessionmaker[AsyncSession]:
-    """Get the session factory, creating it if necessary."""
-    global _async_session_factory
-    if _async_session_factory is None:
-        engine = get_engine()
-        _async_session_factory = async_sessionmaker(
-            engine,
-            class_=AsyncSession,
-            expire_on_commit=False,
-        )
-    return _async_session_factory
+    """Get the session factory, creating it on first use."""
+    return async_sessionmaker(
+        get_engine(),
+        class_=AsyncSession,
+        expire_on_commit=False,
+    )
 
 
 async def get_session() -> AsyncGenerator[AsyncSession, None]:
@@ -79,8 +118,7 @@ async def init_db() -> None:
 
 async def close_db() -> None:
     """Close database connections."""
-    global _engine, _async_session_factory
-    if _engine is not None:
-        await _engine.dispose()
-        _engine = None
-        _async_session_factory = None
+    if get_engine.cache_info().currsize:
+        await get_engine().dispose()
+    get_session_factory.cache_clear()
+    get_engine.cache_clear()
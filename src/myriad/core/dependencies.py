@@ -1,15 +1,14 @@
 """FastAPI dependencies for authentication and common resources."""
 
-from collections.abc import AsyncGenerator
 from typing import Annotated
 
 from fastapi import Cookie, Depends, HTTPException, Request, status
 from fastapi.templating import Jinja2Templates
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncSession
 
 from myriad.config import Settings, get_settings
-from myriad.core.database import get_session
-from myriad.core.security import get_session_with_user
+from myriad.core.database import get_engine, get_session, get_session_context
+from myriad.core.security import any_user_exists, get_session_with_user
 from myriad.core.templates import get_templates
 from myriad.models import User
 from myriad.services import HostService, LocationService, ProxmoxService, SyncService
@@ -21,8 +20,16 @@ AppSettings = Annotated[Settings, Depends(get_settings)]
 
 # Template dependency
 def get_jinja_templates(settings: AppSettings) -> Jinja2Templates:
-    """Get Jinja2 templates instance from settings."""
-    return get_templates(str(settings.templates_dir))
+    """Get Jinja2 templates instance from settings.
+
+    Templates are only re-checked on disk in debug mode.
+    """
+    cache_dir = settings.templates_cache_dir
+    return get_templates(
+        str(settings.templates_dir),
+        auto_reload=settings.server.debug,
+        bytecode_cache_dir=str(cache_dir) if cache_dir else None,
+    )
 
 
 Templates = Annotated[Jinja2Templates, Depends(get_jinja_templates)]
@@ -55,23 +62,37 @@ SyncServiceDep = Annotated[SyncService, Depends(get_sync_service)]
 ProxmoxServiceDep = Annotated[ProxmoxService, Depends(get_proxmox_service)]
 
 
+# Marks request.state.auth_user as not yet looked up (None means "not authenticated")
+_AUTH_NOT_LOADED = object()
+
+
 async def get_current_user_optional(
     request: Request,
-    db: DbSession,
     session_id: Annotated[str | None, Cookie(alias="session")] = None,
 ) -> User | None:
-    """Get the current user if authenticated, None otherwise."""
+    """Get the current user if authenticated, None otherwise.
+
+    A database session is only opened when a session cookie is present, so
+    anonymous requests never check out a connection. The result is cached on
+    request.state so any other lookup during the same request reuses it.
+    """
     if not session_id:
         return None
 
-    result = await get_session_with_user(db, session_id)
+    cached = getattr(request.state, "auth_user", _AUTH_NOT_LOADED)
+    if cached is not _AUTH_NOT_LOADED:
+        return cached
+
+    user = None
+    async with get_session_context() as db:
+        result = await get_session_with_user(db, session_id)
     if result:
         session, user = result
         # Store session in request state for potential logout
         request.state.session = session
-        return user
 
-    return None
+    request.state.auth_user = user
+    return user
 
 
 async def get_current_user(
@@ -109,7 +130,36 @@ def require_auth_redirect(
 AuthenticatedUser = Annotated[User, Depends(require_auth_redirect)]
 
 
-async def get_db_session() -> AsyncGenerator[AsyncSession, None]:
-    """Alias for get_session for explicit naming."""
-    async for session in get_session():
-        yield session
+async def is_setup_complete(request: Request, db: AsyncSession | AsyncConnection) -> bool:
+    """Whether the first user has been created.
+
+    Once a user exists setup can't become necessary again, so the result is
+    remembered on app.state and later calls don't touch the database.
+    """
+    state = request.app.state
+    if state.setup_complete:
+        return True
+
+    if not await any_user_exists(db):
+        return False
+    state.setup_complete = True
+    return True
+
+
+async def ensure_setup_complete(request: Request) -> None:
+    """Redirect to setup until the first user has been created.
+
+    Applied to the app's page routers (not auth or static files).
+    """
+    if request.app.state.setup_complete:
+        return
+
+    # A bare connection is enough, no ORM session
+    async with get_engine().connect() as conn:
+        users_exist = await is_setup_complete(request, conn)
+
+    if not users_exist:
+        raise HTTPException(
+            status_code=status.HTTP_303_SEE_OTHER,
+            headers={"Location": "/auth/setup"},
+        )
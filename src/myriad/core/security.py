@@ -1,27 +1,116 @@
 """Security utilities for password hashing and session management."""
 
+import asyncio
+import os
 import secrets
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
+from functools import cache
+from typing import TypeVar
 
-from passlib.context import CryptContext
-from sqlalchemy import delete, select
-from sqlalchemy.ext.asyncio import AsyncSession
+import bcrypt
+from sqlalchemy import delete, func, lambda_stmt, select
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncSession
+from sqlalchemy.orm import contains_eager, defer
 
 from myriad.config import get_settings
-from myriad.models import Session, User
+from myriad.models import Session, User, utc_now
 
-# Password hashing context
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# bcrypt only uses the first 72 bytes of a password
+BCRYPT_MAX_PASSWORD_BYTES = 72
 
+# Repeat logins within this window don't rewrite User.last_login
+LAST_LOGIN_RESOLUTION = timedelta(minutes=1)
 
-def hash_password(password: str) -> str:
-    """Hash a password using bcrypt."""
-    return pwd_context.hash(password)
+# Expired sessions removed per DELETE statement during cleanup
+SESSION_CLEANUP_BATCH_SIZE = 1000
 
+T = TypeVar("T")
 
-def verify_password(plain_password: str, hashed_password: str) -> bool:
-    """Verify a password against its hash."""
-    return pwd_context.verify(plain_password, hashed_password)
+
+@cache
+def _bcrypt_executor() -> ThreadPoolExecutor:
+    """Thread pool reserved for bcrypt, one thread per CPU.
+
+    bcrypt is CPU-bound, so more threads than cores wouldn't add throughput, and
+    keeping it off the loop's default executor means a burst of logins can't
+    hold up other blocking work there (such as DNS lookups).
+    """
+    return ThreadPoolExecutor(max_workers=os.cpu_count() or 1, thread_name_prefix="bcrypt")
+
+
+async def _run_bcrypt(func: Callable[..., T], *args) -> T:
+    """Run a blocking bcrypt call in the bcrypt thread pool."""
+    return await asyncio.get_running_loop().run_in_executor(_bcrypt_executor(), func, *args)
+
+
+def _encode_password(password: str) -> bytes:
+    """Encode a password for bcrypt, truncating to the bytes it actually uses."""
+    return password.encode("utf-8")[:BCRYPT_MAX_PASSWORD_BYTES]
+
+
+def _hash_password_sync(password: str) -> str:
+    """Hash a password with a fresh salt at the configured cost (blocking)."""
+    salt = bcrypt.gensalt(rounds=get_settings().bcrypt_rounds)
+    return bcrypt.hashpw(_encode_password(password), salt).decode("ascii")
+
+
+def _verify_password_sync(plain_password: str, hashed_password: str) -> bool:
+    """Check a password against a bcrypt hash (blocking)."""
+    try:
+        return bcrypt.checkpw(_encode_password(plain_password), hashed_password.encode("ascii"))
+    except ValueError:
+        # Malformed or non-bcrypt hash
+        return False
+
+
+def password_needs_rehash(hashed_password: str) -> bool:
+    """Check whether a hash was made with a different cost than configured."""
+    # bcrypt hashes look like $2b$12$<salt+hash>
+    try:
+        rounds = int(hashed_password.split("$")[2])
+    except (IndexError, ValueError):
+        return True
+    return rounds != get_settings().bcrypt_rounds
+
+
+@cache
+def _dummy_password_hash() -> str:
+    """Hash that failed lookups are verified against, computed once per process."""
+    return _hash_password_sync(secrets.token_hex(16))
+
+
+def _verify_dummy_password_sync(plain_password: str) -> None:
+    """Spend a full bcrypt verify on a password that can't match anything (blocking)."""
+    _verify_password_sync(plain_password, _dummy_password_hash())
+
+
+async def hash_password(password: str) -> str:
+    """Hash a password using bcrypt.
+
+    bcrypt is deliberately slow, so it runs in the bcrypt thread pool rather
+    than blocking the event loop.
+    """
+    return await _run_bcrypt(_hash_password_sync, password)
+
+
+async def verify_password(plain_password: str, hashed_password: str) -> bool:
+    """Verify a password against its hash (in a worker thread, like hash_password).
+
+    Hashes created by the previous passlib backend use the same $2b$ format and
+    verify unchanged.
+    """
+    return await _run_bcrypt(_verify_password_sync, plain_password, hashed_password)
+
+
+async def warm_up_password_hashing() -> None:
+    """Compute the dummy password hash at startup.
+
+    This also starts a bcrypt pool thread before the first login, so that request
+    doesn't pay the start-up latency on top of the hash itself.
+    """
+    await _run_bcrypt(_dummy_password_hash)
 
 
 def generate_session_id() -> str:
@@ -37,12 +126,13 @@ async def create_session(
 ) -> Session:
     """Create a new session for a user."""
     settings = get_settings()
+    now = datetime.utcnow()
 
     session = Session(
         id=generate_session_id(),
         user_id=user.id,
-        created_at=datetime.utcnow(),
-        expires_at=datetime.utcnow() + timedelta(hours=settings.session_expire_hours),
+        created_at=now,
+        expires_at=now + timedelta(hours=settings.session_expire_hours),
         ip_address=ip_address,
         user_agent=user_agent,
     )
@@ -53,31 +143,34 @@ async def create_session(
     return session
 
 
-async def get_session(db: AsyncSession, session_id: str) -> Session | None:
-    """Get a session by ID, returning None if expired or not found."""
-    result = await db.execute(
-        select(Session).where(
-            Session.id == session_id,
-            Session.expires_at > datetime.utcnow(),
-        )
-    )
-    return result.scalar_one_or_none()
-
-
 async def get_session_with_user(db: AsyncSession, session_id: str) -> tuple[Session, User] | None:
-    """Get a session and its associated user."""
+    """Get a live session and its active user in one query.
+
+    Returns None if the session is expired, unknown, or belongs to an inactive user.
+    """
+    # Runs on every authenticated request; as a lambda statement its construction
+    # and cache key are computed once, with session_id tracked as a bound parameter
     result = await db.execute(
-        select(Session, User)
-        .join(User)
-        .where(
-            Session.id == session_id,
-            Session.expires_at > datetime.utcnow(),
-            User.is_active == True,  # noqa: E712
+        lambda_stmt(
+            lambda: (
+                select(Session)
+                .join(Session.user)
+                # Populate Session.user from the joined columns instead of a second query;
+                # the user agent is only informational and can be long, so leave it behind
+                .options(contains_eager(Session.user), defer(Session.user_agent))
+                .where(
+                    Session.id == session_id,
+                    # Compared against the database clock (in UTC, like expires_at), so no
+                    # timestamp is built per request
+                    Session.expires_at > utc_now(),
+                    User.is_active.is_(True),
+                )
+            )
         )
     )
-    row = result.first()
-    if row:
-        return row.tuple()
+    session = result.scalar_one_or_none()
+    if session:
+        return session, session.user
     return None
 
 
@@ -93,10 +186,39 @@ async def delete_user_sessions(db: AsyncSession, user_id: int) -> int:
     return result.rowcount
 
 
-async def cleanup_expired_sessions(db: AsyncSession) -> int:
-    """Remove all expired sessions."""
-    result = await db.execute(delete(Session).where(Session.expires_at <= datetime.utcnow()))
-    return result.rowcount
+async def cleanup_expired_sessions(
+    db: AsyncSession, batch_size: int = SESSION_CLEANUP_BATCH_SIZE
+) -> int:
+    """Remove all expired sessions.
+
+    Deletes in batches and commits after each one, so a large backlog never
+    holds row locks on the whole table and session lookups stay responsive
+    while cleanup runs. Anything else pending on db is committed with the
+    first batch.
+
+    Args:
+        db: Database session
+        batch_size: Maximum rows deleted per statement (and per transaction)
+
+    Returns:
+        Total number of sessions removed
+    """
+    total = 0
+    while True:
+        # Rows already locked by another cleanup are skipped (ignored on SQLite)
+        expired_ids = (
+            select(Session.id)
+            .where(Session.expires_at <= utc_now())
+            .limit(batch_size)
+            .with_for_update(skip_locked=True)
+            .scalar_subquery()
+        )
+        result = await db.execute(delete(Session).where(Session.id.in_(expired_ids)))
+        # Release this batch's locks before taking the next batch's
+        await db.commit()
+        total += result.rowcount
+        if result.rowcount < batch_size:
+            return total
 
 
 async def authenticate_user(db: AsyncSession, username: str, password: str) -> User | None:
@@ -106,12 +228,25 @@ async def authenticate_user(db: AsyncSession, username: str, password: str) -> U
     )
     user = result.scalar_one_or_none()
 
-    if user and verify_password(password, user.password_hash):
-        # Update last login
-        user.last_login = datetime.utcnow()
-        return user
+    if user is None:
+        # Do the same bcrypt work as a real check so unknown usernames can't be
+        # told apart by response time
+        await _run_bcrypt(_verify_dummy_password_sync, password)
+        return None
 
-    return None
+    if not await verify_password(password, user.password_hash):
+        return None
+
+    # Keep stored hashes at the configured cost, since this is the only time the
+    # plain password is available
+    if password_needs_rehash(user.password_hash):
+        user.password_hash = await hash_password(password)
+
+    # Update last login (skipped for rapid repeat logins to avoid a write each time)
+    now = datetime.utcnow()
+    if user.last_login is None or now - user.last_login >= LAST_LOGIN_RESOLUTION:
+        user.last_login = now
+    return user
 
 
 async def create_user(
@@ -123,7 +258,7 @@ async def create_user(
     """Create a new user."""
     user = User(
         username=username,
-        password_hash=hash_password(password),
+        password_hash=await hash_password(password),
         display_name=display_name,
     )
     db.add(user)
@@ -139,7 +274,14 @@ async def get_user_by_username(db: AsyncSession, username: str) -> User | None:
 
 async def get_user_count(db: AsyncSession) -> int:
     """Get the total number of users."""
-    from sqlalchemy import func
-
     result = await db.execute(select(func.count(User.id)))
     return result.scalar_one()
+
+
+async def any_user_exists(db: AsyncSession | AsyncConnection) -> bool:
+    """Check whether at least one user exists (stops at the first row).
+
+    Accepts a plain connection as well, for callers that don't need an ORM session.
+    """
+    result = await db.execute(select(User.id).limit(1))
+    return result.first() is not None
@@ -1,14 +1,37 @@
 """Shared Jinja2 templates utility."""
 
-from functools import lru_cache
+import os
 
 from fastapi.templating import Jinja2Templates
+from jinja2 import FileSystemBytecodeCache
 
+# Templates instances by (resolved directory, auto_reload, bytecode cache directory)
+_TEMPLATE_CACHE: dict[tuple[str, bool, str | None], Jinja2Templates] = {}
 
-@lru_cache(maxsize=1)
-def get_templates(templates_dir: str) -> Jinja2Templates:
+
+def get_templates(
+    templates_dir: str,
+    auto_reload: bool = True,
+    bytecode_cache_dir: str | None = None,
+) -> Jinja2Templates:
     """Get cached Jinja2 templates instance.
 
-    Uses LRU cache to avoid creating multiple instances for the same directory.
+    Instances are cached per resolved directory, so spellings like "templates" and
+    "./templates" share one environment and its compiled templates. With
+    auto_reload off the environment skips the per-render source mtime check.
+
+    Compiled templates are also written to a bytecode cache on disk, so a
+    restarted worker loads them instead of parsing every template again. Without
+    bytecode_cache_dir, Jinja uses a private per-user directory under the
+    system temp dir.
     """
-    return Jinja2Templates(directory=templates_dir)
+    key = (os.path.realpath(templates_dir), auto_reload, bytecode_cache_dir)
+    templates = _TEMPLATE_CACHE.get(key)
+    if templates is None:
+        templates = Jinja2Templates(directory=templates_dir)
+        templates.env.auto_reload = auto_reload
+        if bytecode_cache_dir:
+            os.makedirs(bytecode_cache_dir, exist_ok=True)
+        templates.env.bytecode_cache = FileSystemBytecodeCache(bytecode_cache_dir)
+        _TEMPLATE_CACHE[key] = templates
+    return templates
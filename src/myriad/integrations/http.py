@@ -0,0 +1,83 @@
+"""Shared HTTP client construction for integration clients."""
+
+import asyncio
+from typing import Any
+
+import httpx
+import orjson
+
+# Enough keepalive connections for concurrent per-resource fetches against one API
+HTTP_LIMITS = httpx.Limits(max_connections=64, max_keepalive_connections=32, keepalive_expiry=60.0)
+HTTP_TIMEOUT = httpx.Timeout(30.0, connect=5.0)
+
+# Long-lived clients by (event loop, base_url, verify, headers, auth), see
+# shared_http_client(). Pooled connections belong to the loop that opened them.
+_shared_clients: dict[tuple, httpx.AsyncClient] = {}
+
+
+def create_http_client(*, base_url: str, verify: bool, **kwargs) -> httpx.AsyncClient:
+    """Create an HTTP/2-capable client with pooled connections.
+
+    Args:
+        base_url: Base URL for all requests
+        verify: Whether to verify the server's TLS certificate
+        **kwargs: Extra httpx.AsyncClient options (auth, headers, ...)
+
+    Returns:
+        Configured async HTTP client
+    """
+    # A custom transport ignores the client's own verify/http2/limits, so they
+    # have to be set here. retries=1 re-attempts connections that fail to open.
+    transport = httpx.AsyncHTTPTransport(
+        verify=verify,
+        http2=True,
+        limits=HTTP_LIMITS,
+        retries=1,
+    )
+    return httpx.AsyncClient(
+        base_url=base_url,
+        transport=transport,
+        timeout=HTTP_TIMEOUT,
+        **kwargs,
+    )
+
+
+def shared_http_client(
+    *,
+    base_url: str,
+    verify: bool,
+    headers: dict[str, str] | None = None,
+    auth: tuple[str, str] | None = None,
+) -> httpx.AsyncClient:
+    """Get the long-lived client for an API endpoint and credentials.
+
+    Repeated syncs of the same instance reuse its pooled keepalive connections
+    instead of opening new TLS sessions each time. Clients are per event loop,
+    so a later asyncio.run() (a CLI command, another app lifespan) never gets
+    a pool from a closed loop. They stay open until close_shared_http_clients()
+    runs at shutdown.
+    """
+    loop = asyncio.get_running_loop()
+    # A closed loop's clients can't be used or closed any more, so just drop them
+    for stale in [key for key in _shared_clients if key[0].is_closed()]:
+        del _shared_clients[stale]
+
+    key = (loop, base_url, verify, tuple(sorted((headers or {}).items())), auth)
+    client = _shared_clients.get(key)
+    if client is None or client.is_closed:
+        client = create_http_client(base_url=base_url, verify=verify, headers=headers, auth=auth)
+        _shared_clients[key] = client
+    return client
+
+
+async def close_shared_http_clients() -> None:
+    """Close every client shared_http_client() handed out on the running loop."""
+    loop = asyncio.get_running_loop()
+    keys = [key for key in _shared_clients if key[0] is loop]
+    clients = [_shared_clients.pop(key) for key in keys]
+    await asyncio.gather(*(client.aclose() for client in clients))
+
+
+def parse_json(response: httpx.Response) -> Any:
+    """Decode a JSON response body with orjson (faster than response.json())."""
+    return orjson.loads(response.content)
@@ -1,5 +1,6 @@
 """OPNsense API client for DHCP lease discovery."""
 
+import asyncio
 import logging
 from dataclasses import dataclass
 from datetime import datetime
@@ -7,11 +8,16 @@ from datetime import datetime
 import httpx
 
 from myriad.config import OPNsenseCredentials, OPNsenseIntegrationConfig
+from myriad.integrations.http import parse_json, shared_http_client
 
 logger = logging.getLogger(__name__)
 
+# Lowercase and turn dashes/dots into colons in a single pass
+_MAC_TRANS = str.maketrans("-.ABCDEFGHIJKLMNOPQRSTUVWXYZ", "::abcdefghijklmnopqrstuvwxyz")
 
-@dataclass
+
+# slots=True drops the per-instance __dict__; syncs hold one of these per lease
+@dataclass(slots=True)
 class DHCPLease:
     """Represents a DHCP lease from OPNsense."""
 
@@ -38,19 +44,16 @@ class OPNsenseClient:
 
     async def __aenter__(self) -> "OPNsenseClient":
         """Enter async context."""
-        self._client = httpx.AsyncClient(
+        self._client = shared_http_client(
             base_url=self.config.base_url,
-            auth=(self.credentials.api_key, self.credentials.api_secret),
             verify=self.config.verify_ssl,
-            timeout=30.0,
+            auth=(self.credentials.api_key, self.credentials.api_secret),
         )
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
-        """Exit async context."""
-        if self._client:
-            await self._client.aclose()
-            self._client = None
+        """Exit async context (the shared connection pool stays open)."""
+        self._client = None
 
     @property
     def client(self) -> httpx.AsyncClient:
@@ -73,7 +76,7 @@ class OPNsenseClient:
         try:
             response = await self.client.get("/api/dhcpv4/leases/searchLease")
             response.raise_for_status()
-            data = response.json()
+            data = parse_json(response)
 
             leases = []
             for row in data.get("rows", []):
@@ -91,7 +94,7 @@ class OPNsenseClient:
         try:
             response = await self.client.get("/api/dhcpv4/reservations/searchReservation")
             response.raise_for_status()
-            data = response.json()
+            data = parse_json(response)
 
             leases = []
             for row in data.get("rows", []):
@@ -106,19 +109,15 @@ class OPNsenseClient:
 
     async def get_all_hosts(self) -> list[DHCPLease]:
         """Get all hosts (both dynamic leases and static mappings)."""
-        dynamic_leases = await self.get_dhcp_leases()
-        static_mappings = await self.get_static_mappings()
-
-        # Create a dict keyed by MAC to deduplicate (static takes precedence)
-        hosts_by_mac: dict[str, DHCPLease] = {}
-
-        for lease in dynamic_leases:
-            mac = self._normalize_mac(lease.mac_address)
-            hosts_by_mac[mac] = lease
+        # The two endpoints are independent, so fetch them concurrently
+        dynamic_leases, static_mappings = await asyncio.gather(
+            self.get_dhcp_leases(), self.get_static_mappings()
+        )
 
-        for mapping in static_mappings:
-            mac = self._normalize_mac(mapping.mac_address)
-            hosts_by_mac[mac] = mapping  # Static overwrites dynamic
+        # Key by MAC to deduplicate (parsed leases are already normalized);
+        # static mappings overwrite dynamic leases
+        hosts_by_mac = {lease.mac_address: lease for lease in dynamic_leases}
+        hosts_by_mac.update((mapping.mac_address, mapping) for mapping in static_mappings)
 
         return list(hosts_by_mac.values())
 
@@ -130,27 +129,13 @@ class OPNsenseClient:
         if not mac or not ip:
             return None
 
-        # Parse timestamps
-        starts = None
-        ends = None
-        if row.get("starts"):
-            try:
-                starts = datetime.fromisoformat(row["starts"].replace("Z", "+00:00"))
-            except (ValueError, AttributeError):
-                pass
-        if row.get("ends"):
-            try:
-                ends = datetime.fromisoformat(row["ends"].replace("Z", "+00:00"))
-            except (ValueError, AttributeError):
-                pass
-
         return DHCPLease(
             mac_address=self._normalize_mac(mac),
             ip_address=ip,
             hostname=row.get("hostname") or row.get("client-hostname"),
             is_static=False,
-            starts=starts,
-            ends=ends,
+            starts=self._parse_timestamp(row.get("starts")),
+            ends=self._parse_timestamp(row.get("ends")),
         )
 
     def _parse_static_mapping(self, row: dict) -> DHCPLease | None:
@@ -169,10 +154,25 @@ class OPNsenseClient:
             description=row.get("descr"),
         )
 
+    @staticmethod
+    def _parse_timestamp(value: str | None) -> datetime | None:
+        """Parse an ISO 8601 lease timestamp, returning None if missing or invalid."""
+        if not value:
+            return None
+        try:
+            # fromisoformat accepts a trailing "Z" since Python 3.11
+            return datetime.fromisoformat(value)
+        except (ValueError, TypeError):
+            return None
+
     @staticmethod
     def _normalize_mac(mac: str) -> str:
         """Normalize MAC address to lowercase with colons."""
-        mac = mac.lower().replace("-", ":").replace(".", ":")
+        mac = mac.translate(_MAC_TRANS)
+        # Most leases are already aa:bb:cc:dd:ee:ff
+        if len(mac) == 17 and mac.count(":") == 5:
+            return mac
+
         # Handle cases like aa:bb:cc:dd:ee:ff or aabb.ccdd.eeff
         parts = mac.split(":")
         if len(parts) == 3:
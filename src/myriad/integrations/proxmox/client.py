@@ -1,15 +1,35 @@
 """Proxmox VE API client for VM discovery and management."""
 
+import asyncio
+import hashlib
 import logging
 import re
 from dataclasses import dataclass, field
+from functools import lru_cache
 
 import httpx
 
 from myriad.config import ProxmoxCredentials, ProxmoxIntegrationConfig
+from myriad.integrations.http import parse_json, shared_http_client
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on per-VM config requests in flight at once
+MAX_CONCURRENT_CONFIG_FETCHES = 16
+
+# Network config patterns, compiled once rather than on every VM
+_HWADDR_RE = re.compile(r"hwaddr=([A-Fa-f0-9:]+)")
+_MACADDR_RE = re.compile(r"macaddr=([A-Fa-f0-9:]+)", re.IGNORECASE)
+_MAC17_RE = re.compile(r"^[A-Fa-f0-9:]{17}$")
+
+# Lowercase and turn dashes into colons in a single pass
+_MAC_TRANS = str.maketrans("-ABCDEFGHIJKLMNOPQRSTUVWXYZ", ":abcdefghijklmnopqrstuvwxyz")
+# Strip all separators
+_MAC_STRIP = str.maketrans("", "", ":.")
+
+# Proxmox separates tags with semicolons (older versions also allow commas/spaces)
+_TAG_SPLIT_RE = re.compile(r"[;,\s]+")
+
 
 @dataclass
 class ProxmoxNode:
@@ -23,9 +43,13 @@ class ProxmoxNode:
     uptime: int | None = None
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ProxmoxVM:
-    """Represents a VM or container from Proxmox."""
+    """Represents a VM or container from Proxmox.
+
+    A sync builds one per guest, so instances are slotted and immutable;
+    use dataclasses.replace() to derive a changed copy.
+    """
 
     vmid: int
     name: str
@@ -45,13 +69,24 @@ class ProxmoxVM:
     @property
     def uuid(self) -> str:
         """Generate a consistent UUID-like identifier from node and vmid."""
-        # Proxmox doesn't expose a true UUID, so we generate a deterministic one
-        # Format: 00000000-0000-vmid-node-hash
-        import hashlib
+        return _vm_uuid(self.node, self.vmid)
+
+    @property
+    def tag_list(self) -> list[str]:
+        """Tags as a de-duplicated list, in the order Proxmox returned them."""
+        if not self.tags:
+            return []
+        return list(dict.fromkeys(tag for tag in _TAG_SPLIT_RE.split(self.tags) if tag))
 
-        node_hash = hashlib.md5(self.node.encode()).hexdigest()[:12]
-        vmid_padded = f"{self.vmid:08d}"
-        return f"00000000-0000-{vmid_padded[:4]}-{vmid_padded[4:]}-{node_hash}"
+
+@lru_cache(maxsize=1024)
+def _vm_uuid(node: str, vmid: int) -> str:
+    """Derive the UUID for a VM, computed once per (node, vmid)."""
+    # Proxmox doesn't expose a true UUID, so we generate a deterministic one
+    # Format: 00000000-0000-vmid-node-hash
+    node_hash = hashlib.md5(node.encode()).hexdigest()[:12]
+    vmid_padded = f"{vmid:08d}"
+    return f"00000000-0000-{vmid_padded[:4]}-{vmid_padded[4:]}-{node_hash}"
 
 
 class ProxmoxClient:
@@ -71,19 +106,16 @@ class ProxmoxClient:
         # Build authorization header
         auth_header = f"PVEAPIToken={self.credentials.token_id}={self.credentials.token_secret}"
 
-        self._client = httpx.AsyncClient(
+        self._client = shared_http_client(
             base_url=f"{self.config.base_url}/api2/json",
-            headers={"Authorization": auth_header},
             verify=self.config.verify_ssl,
-            timeout=30.0,
+            headers={"Authorization": auth_header},
         )
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
-        """Exit async context."""
-        if self._client:
-            await self._client.aclose()
-            self._client = None
+        """Exit async context (the shared connection pool stays open)."""
+        self._client = None
 
     @property
     def client(self) -> httpx.AsyncClient:
@@ -106,7 +138,7 @@ class ProxmoxClient:
         try:
             response = await self.client.get("/version")
             response.raise_for_status()
-            data = response.json()
+            data = parse_json(response)
             return data.get("data", {}).get("version")
         except Exception as e:
             logger.error(f"Failed to get Proxmox version: {e}")
@@ -117,7 +149,7 @@ class ProxmoxClient:
         try:
             response = await self.client.get("/nodes")
             response.raise_for_status()
-            data = response.json()
+            data = parse_json(response)
 
             nodes = []
             for node_data in data.get("data", []):
@@ -140,14 +172,14 @@ class ProxmoxClient:
         """Get all VMs and containers from the cluster.
 
         Uses /cluster/resources for efficient listing, then fetches config
-        for each VM to get MAC addresses.
+        for each VM (concurrently) to get MAC addresses.
         """
         try:
             response = await self.client.get("/cluster/resources", params={"type": "vm"})
             response.raise_for_status()
-            data = response.json()
+            data = parse_json(response)
 
-            vms = []
+            vm_list = []
             for vm_data in data.get("data", []):
                 # Skip templates unless explicitly wanted
                 if vm_data.get("template", 0) == 1:
@@ -157,18 +189,29 @@ class ProxmoxClient:
                 if self.config.node and vm_data.get("node") != self.config.node:
                     continue
 
-                vm_type = vm_data.get("type", "qemu")
-                node = vm_data.get("node", "")
-                vmid = vm_data.get("vmid", 0)
+                vm_list.append(vm_data)
 
-                # Fetch config to get MAC addresses
-                mac_addresses = await self._get_vm_mac_addresses(node, vmid, vm_type)
+            # Fetch configs concurrently to get MAC addresses (bounded to spare the API)
+            semaphore = asyncio.Semaphore(MAX_CONCURRENT_CONFIG_FETCHES)
 
+            async def fetch_macs(vm_data: dict) -> list[str]:
+                async with semaphore:
+                    return await self._get_vm_mac_addresses(
+                        vm_data.get("node", ""),
+                        vm_data.get("vmid", 0),
+                        vm_data.get("type", "qemu"),
+                    )
+
+            all_macs = await asyncio.gather(*(fetch_macs(vm_data) for vm_data in vm_list))
+
+            vms = []
+            for vm_data, mac_addresses in zip(vm_list, all_macs, strict=True):
+                vmid = vm_data.get("vmid", 0)
                 vm = ProxmoxVM(
                     vmid=vmid,
                     name=vm_data.get("name", f"vm-{vmid}"),
-                    node=node,
-                    vm_type=vm_type,
+                    node=vm_data.get("node", ""),
+                    vm_type=vm_data.get("type", "qemu"),
                     status=vm_data.get("status", "unknown"),
                     cpu=vm_data.get("cpu"),
                     memory=vm_data.get("mem"),
@@ -199,7 +242,7 @@ class ProxmoxClient:
                 logger.debug(f"Could not fetch config for {vm_type}/{vmid}: {response.status_code}")
                 return []
 
-            config = response.json().get("data", {})
+            config = parse_json(response).get("data", {})
             return self._extract_mac_addresses(config, vm_type)
 
         except Exception as e:
@@ -229,14 +272,14 @@ class ProxmoxClient:
         """Parse MAC address from network config string."""
         if vm_type == "lxc":
             # LXC: "name=eth0,hwaddr=BC:24:11:XX:XX:XX,bridge=vmbr0"
-            match = re.search(r"hwaddr=([A-Fa-f0-9:]+)", net_config)
+            match = _HWADDR_RE.search(net_config)
             if match:
                 return match.group(1)
         else:
             # QEMU: "virtio=BC:24:11:XX:XX:XX,bridge=vmbr0"
             # Also handles: "model=virtio,macaddr=XX:XX:XX:XX:XX:XX"
             # Try macaddr= first (newer format)
-            match = re.search(r"macaddr=([A-Fa-f0-9:]+)", net_config, re.IGNORECASE)
+            match = _MACADDR_RE.search(net_config)
             if match:
                 return match.group(1)
 
@@ -247,7 +290,7 @@ class ProxmoxClient:
                 if "=" in first_part:
                     _, mac_candidate = first_part.split("=", 1)
                     # Check if it looks like a MAC address
-                    if re.match(r"^[A-Fa-f0-9:]{17}$", mac_candidate):
+                    if _MAC17_RE.match(mac_candidate):
                         return mac_candidate
 
         return None
@@ -258,7 +301,7 @@ class ProxmoxClient:
             endpoint = f"/nodes/{node}/{vm_type}/{vmid}/snapshot"
             response = await self.client.get(endpoint)
             response.raise_for_status()
-            data = response.json()
+            data = parse_json(response)
 
             snapshots = []
             for snap in data.get("data", []):
@@ -282,13 +325,13 @@ class ProxmoxClient:
     @staticmethod
     def _normalize_mac(mac: str) -> str:
         """Normalize MAC address to lowercase with colons."""
-        mac = mac.lower().replace("-", ":")
+        mac = mac.translate(_MAC_TRANS)
         # Already in correct format if it has colons and is 17 chars
         if len(mac) == 17 and mac.count(":") == 5:
             return mac
 
         # Handle other formats
-        clean = mac.replace(":", "").replace(".", "")
+        clean = mac.translate(_MAC_STRIP)
         if len(clean) == 12:
             return ":".join(clean[i : i + 2] for i in range(0, 12, 2))
 
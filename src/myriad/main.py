@@ -1,16 +1,20 @@
 """FastAPI application factory and CLI entry point."""
 
+import asyncio
 import logging
+import sys
 from contextlib import asynccontextmanager
 from pathlib import Path
 
-from fastapi import FastAPI, Request
-from fastapi.responses import RedirectResponse
+from fastapi import Depends, FastAPI
 from fastapi.staticfiles import StaticFiles
 
 from myriad.config import init_settings
+from myriad.core.caching import ConditionalGetMiddleware
 from myriad.core.database import close_db, get_session_context, init_db
-from myriad.core.security import get_user_count
+from myriad.core.dependencies import ensure_setup_complete
+from myriad.core.security import cleanup_expired_sessions, warm_up_password_hashing
+from myriad.integrations.http import close_shared_http_clients
 from myriad.routers import auth_router, dashboard_router, hosts_router, vms_router
 from myriad.services import LocationService
 
@@ -22,6 +26,19 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+async def purge_expired_sessions(interval_seconds: float) -> None:
+    """Periodically delete expired sessions until cancelled."""
+    while True:
+        await asyncio.sleep(interval_seconds)
+        try:
+            async with get_session_context() as db:
+                removed = await cleanup_expired_sessions(db)
+            if removed:
+                logger.info(f"Removed {removed} expired sessions")
+        except Exception as e:
+            logger.error(f"Expired session cleanup failed: {e}")
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Application lifespan manager."""
@@ -31,6 +48,8 @@ async def lifespan(app: FastAPI):
     await init_db()
     logger.info("Database initialized")
 
+    await warm_up_password_hashing()
+
     # Ensure locations from config exist in DB
     settings = app.state.settings
     async with get_session_context() as db:
@@ -39,9 +58,19 @@ async def lifespan(app: FastAPI):
             await location_service.ensure_from_config(loc.id, loc.name, loc.network_cidr)
         logger.info(f"Ensured {len(settings.locations)} locations from config")
 
+    session_cleanup = asyncio.create_task(
+        purge_expired_sessions(settings.session_cleanup_interval_minutes * 60)
+    )
+
     yield
 
     # Cleanup
+    session_cleanup.cancel()
+    try:
+        await session_cleanup
+    except asyncio.CancelledError:
+        pass
+    await close_shared_http_clients()
     await close_db()
     logger.info("Myriad shutdown complete")
 
@@ -69,34 +98,23 @@ def create_app(config_dir: Path | None = None) -> FastAPI:
     # Store settings in app state
     app.state.settings = settings
 
+    # Set by ensure_setup_complete once it first sees a user
+    app.state.setup_complete = False
+
+    # ETags for endpoints that opt in with a Cache-Control header
+    app.add_middleware(ConditionalGetMiddleware)
+
     # Mount static files
     static_path = settings.static_dir
     if static_path.exists():
         app.mount("/static", StaticFiles(directory=str(static_path)), name="static")
 
-    # Include routers
+    # Include routers (everything but auth redirects to setup until a user exists)
+    setup_required = [Depends(ensure_setup_complete)]
     app.include_router(auth_router)
-    app.include_router(dashboard_router)
-    app.include_router(hosts_router)
-    app.include_router(vms_router)
-
-    # Middleware to check for setup
-    @app.middleware("http")
-    async def check_setup_middleware(request: Request, call_next):
-        """Redirect to setup if no users exist."""
-        # Skip for static files and auth routes
-        path = request.url.path
-        if path.startswith("/static") or path.startswith("/auth") or path == "/check-setup":
-            return await call_next(request)
-
-        # Check if any users exist
-        async with get_session_context() as db:
-            user_count = await get_user_count(db)
-
-        if user_count == 0:
-            return RedirectResponse(url="/auth/setup", status_code=303)
-
-        return await call_next(request)
+    app.include_router(dashboard_router, dependencies=setup_required)
+    app.include_router(hosts_router, dependencies=setup_required)
+    app.include_router(vms_router, dependencies=setup_required)
 
     return app
 
@@ -129,11 +147,15 @@ def cli():
     if args.debug:
         app.state.settings.server.debug = True
 
+    # Ask for the uvicorn[standard] fast paths explicitly, so a missing uvloop or
+    # httptools fails at startup instead of silently falling back
     uvicorn.run(
         app,
         host=args.host,
         port=args.port,
         reload=args.reload,
+        loop="uvloop" if sys.platform != "win32" else "asyncio",
+        http="httptools",
     )
 
 
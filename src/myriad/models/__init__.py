@@ -1,14 +1,16 @@
 """SQLAlchemy ORM models."""
 
-from myriad.models.base import Base, TimestampMixin
+from myriad.models.base import Base, TimestampMixin, utc_now
 from myriad.models.host import DiscoverySource, Host, HostStatus, HostType
 from myriad.models.hypervisor import (
     Hypervisor,
     HypervisorStatus,
     HypervisorType,
     VirtualMachine,
+    VMMacAddress,
     VMSnapshot,
     VMState,
+    VMTag,
     VMType,
 )
 from myriad.models.integration import AuditLog, Integration, IntegrationStatus, IntegrationType
@@ -18,6 +20,7 @@ from myriad.models.user import Session, User
 __all__ = [
     "Base",
     "TimestampMixin",
+    "utc_now",
     "Location",
     "Host",
     "HostType",
@@ -27,7 +30,9 @@ __all__ = [
     "HypervisorStatus",
     "HypervisorType",
     "VirtualMachine",
+    "VMMacAddress",
     "VMSnapshot",
+    "VMTag",
     "VMState",
     "VMType",
     "Integration",
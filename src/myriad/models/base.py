@@ -1,27 +1,68 @@
 """Base model with common fields."""
 
 from datetime import datetime
+from enum import Enum
 
-from sqlalchemy import DateTime, func
+from sqlalchemy import DateTime
+from sqlalchemy import Enum as SAEnum
+from sqlalchemy.ext.compiler import compiles
 from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.sql.functions import FunctionElement
 
 from myriad.core.database import Base
 
 
+class utc_now(FunctionElement):
+    """The database's current time as a naive UTC timestamp.
+
+    Matches values written from datetime.utcnow(). PostgreSQL's now() cast to
+    timestamp without time zone is in the session's TimeZone instead, so it
+    is converted explicitly there; SQLite's CURRENT_TIMESTAMP is already UTC.
+    """
+
+    type = DateTime()
+    inherit_cache = True
+
+
+@compiles(utc_now)
+def _compile_utc_now(element, compiler, **kw) -> str:
+    return "CURRENT_TIMESTAMP"
+
+
+@compiles(utc_now, "postgresql")
+def _compile_utc_now_postgresql(element, compiler, **kw) -> str:
+    return "timezone('UTC', now())"
+
+
 class TimestampMixin:
     """Mixin for created_at and updated_at timestamps."""
 
     created_at: Mapped[datetime] = mapped_column(
         DateTime,
-        default=func.now(),
+        default=utc_now(),
         nullable=False,
     )
     updated_at: Mapped[datetime] = mapped_column(
         DateTime,
-        default=func.now(),
-        onupdate=func.now(),
+        default=utc_now(),
+        onupdate=utc_now(),
         nullable=False,
     )
 
 
-__all__ = ["Base", "TimestampMixin"]
+def str_enum(enum_class: type[Enum], length: int = 20) -> SAEnum:
+    """Column type for a str Enum, stored as its value in a VARCHAR.
+
+    Storage is unchanged from String(length), but values round-trip as enum
+    members and unknown strings are rejected before they reach the database.
+    """
+    return SAEnum(
+        enum_class,
+        native_enum=False,
+        length=length,
+        validate_strings=True,
+        values_callable=lambda members: [member.value for member in members],
+    )
+
+
+__all__ = ["Base", "TimestampMixin", "str_enum", "utc_now"]
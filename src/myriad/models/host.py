@@ -3,10 +3,10 @@
 from datetime import datetime
 from enum import Enum
 
-from sqlalchemy import DateTime, ForeignKey, Integer, String, Text
+from sqlalchemy import DateTime, ForeignKey, Index, Integer, String, Text, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from myriad.models.base import Base, TimestampMixin
+from myriad.models.base import Base, TimestampMixin, str_enum
 
 
 class HostType(str, Enum):
@@ -46,6 +46,24 @@ class Host(Base, TimestampMixin):
     """Discovered or manually added host device."""
 
     __tablename__ = "hosts"
+    __table_args__ = (
+        # Host list filters by location and/or status, newest first
+        Index("ix_hosts_location_status_last_seen", "location_id", "status", "last_seen"),
+        Index("ix_hosts_status_last_seen", "status", "last_seen"),
+        # Full unfiltered list order (HOST_LIST_ORDER), so the default page reads the
+        # index instead of sorting the table. SQLite can't declare NULLS placement: its
+        # DESC sorts NULLs last and its ASC sorts them first, and the SQLite list order
+        # follows both. PostgreSQL's index spells out hostname NULLS LAST instead.
+        Index("ix_hosts_list_order", text("last_seen DESC"), "hostname", "id").ddl_if(
+            dialect="sqlite"
+        ),
+        Index(
+            "ix_hosts_list_order_pg",
+            text("last_seen DESC NULLS LAST"),
+            text("hostname NULLS LAST"),
+            "id",
+        ).ddl_if(dialect="postgresql"),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     mac_address: Mapped[str] = mapped_column(String(17), unique=True, nullable=False, index=True)
@@ -54,13 +72,13 @@ class Host(Base, TimestampMixin):
     ip_address: Mapped[str | None] = mapped_column(String(45), nullable=True)
 
     host_type: Mapped[HostType] = mapped_column(
-        String(20), default=HostType.UNKNOWN, nullable=False
+        str_enum(HostType), default=HostType.UNKNOWN, nullable=False
     )
     status: Mapped[HostStatus] = mapped_column(
-        String(20), default=HostStatus.UNKNOWN, nullable=False
+        str_enum(HostStatus), default=HostStatus.UNKNOWN, nullable=False
     )
     discovery_source: Mapped[DiscoverySource] = mapped_column(
-        String(20), default=DiscoverySource.MANUAL, nullable=False
+        str_enum(DiscoverySource), default=DiscoverySource.MANUAL, nullable=False
     )
 
     # Location reference
@@ -93,8 +111,7 @@ class Host(Base, TimestampMixin):
     )
 
     def __repr__(self) -> str:
-        name = self.display_name or self.hostname or self.mac_address
-        return f"<Host {self.id}: {name}>"
+        return f"<Host {self.id}: {self.effective_name}>"
 
     @property
     def effective_name(self) -> str:
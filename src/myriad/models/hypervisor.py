@@ -3,10 +3,11 @@
 from datetime import datetime
 from enum import Enum
 
-from sqlalchemy import DateTime, ForeignKey, Integer, String, Text
+from sqlalchemy import DateTime, ForeignKey, Index, Integer, String, Text
+from sqlalchemy.ext.associationproxy import AssociationProxy, association_proxy
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from myriad.models.base import Base, TimestampMixin
+from myriad.models.base import Base, TimestampMixin, str_enum
 
 
 class HypervisorType(str, Enum):
@@ -55,7 +56,7 @@ class Hypervisor(Base, TimestampMixin):
 
     # Hypervisor type
     hypervisor_type: Mapped[HypervisorType] = mapped_column(
-        String(20), default=HypervisorType.PROXMOX, nullable=False
+        str_enum(HypervisorType), default=HypervisorType.PROXMOX, nullable=False
     )
 
     # API connection info (Proxmox)
@@ -72,7 +73,7 @@ class Hypervisor(Base, TimestampMixin):
 
     # Status
     status: Mapped[HypervisorStatus] = mapped_column(
-        String(20), default=HypervisorStatus.UNKNOWN, nullable=False
+        str_enum(HypervisorStatus), default=HypervisorStatus.UNKNOWN, nullable=False
     )
     last_sync: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
     last_error: Mapped[str | None] = mapped_column(Text, nullable=True)
@@ -96,6 +97,13 @@ class VirtualMachine(Base, TimestampMixin):
     """Virtual machine managed by a hypervisor."""
 
     __tablename__ = "virtual_machines"
+    __table_args__ = (
+        # VM list filters by hypervisor and state; sync loads a hypervisor's VMs
+        Index("ix_virtual_machines_hypervisor_state", "hypervisor_id", "state"),
+        # Full VM list order (VM_LIST_ORDER), so list pages read the index instead of
+        # sorting the table
+        Index("ix_virtual_machines_name_id", "name", "id"),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     uuid: Mapped[str] = mapped_column(String(36), unique=True, nullable=False, index=True)
@@ -103,7 +111,7 @@ class VirtualMachine(Base, TimestampMixin):
 
     # Proxmox-specific identifiers
     vmid: Mapped[int | None] = mapped_column(Integer, nullable=True, index=True)
-    vm_type: Mapped[VMType | None] = mapped_column(String(10), nullable=True)
+    vm_type: Mapped[VMType | None] = mapped_column(str_enum(VMType, length=10), nullable=True)
 
     # Hypervisor reference
     hypervisor_id: Mapped[str] = mapped_column(
@@ -116,22 +124,18 @@ class VirtualMachine(Base, TimestampMixin):
     host: Mapped["Host | None"] = relationship("Host", back_populates="virtual_machine")  # noqa: F821
 
     # State
-    state: Mapped[VMState] = mapped_column(String(20), default=VMState.UNKNOWN, nullable=False)
+    state: Mapped[VMState] = mapped_column(
+        str_enum(VMState), default=VMState.UNKNOWN, nullable=False
+    )
 
     # Resources
     vcpus: Mapped[int | None] = mapped_column(Integer, nullable=True)
     memory_mb: Mapped[int | None] = mapped_column(Integer, nullable=True)
     disk_gb: Mapped[float | None] = mapped_column(Integer, nullable=True)  # Total disk size
 
-    # Network - JSON array of MAC addresses
-    mac_addresses: Mapped[str | None] = mapped_column(Text, nullable=True)
-
     # Runtime info
     uptime_seconds: Mapped[int | None] = mapped_column(Integer, nullable=True)
 
-    # Metadata
-    tags: Mapped[str | None] = mapped_column(Text, nullable=True)  # Comma-separated
-
     # Tracking
     last_state_change: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
 
@@ -143,6 +147,29 @@ class VirtualMachine(Base, TimestampMixin):
         "VMSnapshot", back_populates="virtual_machine", cascade="all, delete-orphan"
     )
 
+    # Network interfaces and tags live in child tables so they can be indexed and
+    # joined; the proxies expose them as plain lists of strings
+    macs: Mapped[list["VMMacAddress"]] = relationship(
+        "VMMacAddress",
+        back_populates="virtual_machine",
+        cascade="all, delete-orphan",
+        lazy="selectin",
+        order_by="VMMacAddress.id",
+    )
+    tag_entries: Mapped[list["VMTag"]] = relationship(
+        "VMTag",
+        back_populates="virtual_machine",
+        cascade="all, delete-orphan",
+        lazy="selectin",
+        order_by="VMTag.tag",
+    )
+    mac_addresses: AssociationProxy[list[str]] = association_proxy(
+        "macs", "mac_address", creator=lambda mac: VMMacAddress(mac_address=mac)
+    )
+    tags: AssociationProxy[list[str]] = association_proxy(
+        "tag_entries", "tag", creator=lambda tag: VMTag(tag=tag)
+    )
+
     def __repr__(self) -> str:
         vm_type_str = f" ({self.vm_type})" if self.vm_type else ""
         return f"<VirtualMachine {self.vmid or self.uuid}: {self.name}{vm_type_str}>"
@@ -169,3 +196,38 @@ class VMSnapshot(Base, TimestampMixin):
 
     def __repr__(self) -> str:
         return f"<VMSnapshot {self.id}: {self.name}>"
+
+
+class VMMacAddress(Base):
+    """MAC address of a VM network interface."""
+
+    __tablename__ = "vm_mac_addresses"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    vm_id: Mapped[int] = mapped_column(
+        Integer, ForeignKey("virtual_machines.id", ondelete="CASCADE"), nullable=False, index=True
+    )
+    virtual_machine: Mapped[VirtualMachine] = relationship("VirtualMachine", back_populates="macs")
+
+    # Not unique: a cloned VM can briefly share a MAC with its source
+    mac_address: Mapped[str] = mapped_column(String(17), nullable=False, index=True)
+
+    def __repr__(self) -> str:
+        return f"<VMMacAddress {self.mac_address} for VM {self.vm_id}>"
+
+
+class VMTag(Base):
+    """Tag attached to a VM."""
+
+    __tablename__ = "vm_tags"
+
+    vm_id: Mapped[int] = mapped_column(
+        Integer, ForeignKey("virtual_machines.id", ondelete="CASCADE"), primary_key=True
+    )
+    tag: Mapped[str] = mapped_column(String(100), primary_key=True, index=True)
+    virtual_machine: Mapped[VirtualMachine] = relationship(
+        "VirtualMachine", back_populates="tag_entries"
+    )
+
+    def __repr__(self) -> str:
+        return f"<VMTag {self.tag} for VM {self.vm_id}>"
@@ -3,10 +3,10 @@
 from datetime import datetime
 from enum import Enum
 
-from sqlalchemy import DateTime, Integer, String, Text
+from sqlalchemy import DateTime, Index, Integer, String, Text
 from sqlalchemy.orm import Mapped, mapped_column
 
-from myriad.models.base import Base, TimestampMixin
+from myriad.models.base import Base, TimestampMixin, str_enum
 
 
 class IntegrationType(str, Enum):
@@ -31,7 +31,9 @@ class Integration(Base, TimestampMixin):
     __tablename__ = "integrations"
 
     id: Mapped[str] = mapped_column(String(50), primary_key=True)
-    integration_type: Mapped[IntegrationType] = mapped_column(String(20), nullable=False)
+    integration_type: Mapped[IntegrationType] = mapped_column(
+        str_enum(IntegrationType), nullable=False
+    )
     name: Mapped[str] = mapped_column(String(100), nullable=False)
 
     # Connection info
@@ -40,7 +42,7 @@ class Integration(Base, TimestampMixin):
 
     # Status
     status: Mapped[IntegrationStatus] = mapped_column(
-        String(20), default=IntegrationStatus.UNKNOWN, nullable=False
+        str_enum(IntegrationStatus), default=IntegrationStatus.UNKNOWN, nullable=False
     )
     last_sync: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
     last_error: Mapped[str | None] = mapped_column(Text, nullable=True)
@@ -56,6 +58,11 @@ class AuditLog(Base):
     """Audit log for tracking actions."""
 
     __tablename__ = "audit_log"
+    __table_args__ = (
+        # Audit queries are time-range scoped, optionally per user
+        Index("ix_audit_log_timestamp", "timestamp"),
+        Index("ix_audit_log_user_timestamp", "user_id", "timestamp"),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     timestamp: Mapped[datetime] = mapped_column(DateTime, nullable=False)
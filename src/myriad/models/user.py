@@ -2,7 +2,7 @@
 
 from datetime import datetime
 
-from sqlalchemy import DateTime, ForeignKey, Integer, String
+from sqlalchemy import DateTime, ForeignKey, Index, Integer, String
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from myriad.models.base import Base, TimestampMixin
@@ -37,6 +37,13 @@ class Session(Base):
     """User session for cookie-based auth."""
 
     __tablename__ = "sessions"
+    __table_args__ = (
+        # Lets expired-session cleanup find its rows without a table scan
+        Index("ix_sessions_expires_at", "expires_at"),
+        # On SQLite, store rows in the primary key B-tree so the per-request lookup
+        # by id doesn't go through a separate index to reach the row
+        {"sqlite_with_rowid": False},
+    )
 
     id: Mapped[str] = mapped_column(String(64), primary_key=True)
     user_id: Mapped[int] = mapped_column(Integer, ForeignKey("users.id"), nullable=False)
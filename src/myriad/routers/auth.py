@@ -5,24 +5,36 @@ from fastapi.responses import HTMLResponse, RedirectResponse
 from pydantic import ValidationError
 from starlette.responses import Response as StarletteResponse
 
+from myriad.config import Settings
 from myriad.core.dependencies import (
     AppSettings,
     CurrentUserOptional,
     DbSession,
     Templates,
+    is_setup_complete,
 )
 from myriad.core.security import (
     authenticate_user,
     create_session,
     create_user,
     delete_session,
-    get_user_count,
 )
 from myriad.schemas.auth import SetupRequest
 
 router = APIRouter(prefix="/auth", tags=["auth"])
 
 
+def _set_session_cookie(response: StarletteResponse, session_id: str, settings: Settings) -> None:
+    """Attach the session cookie set after login and setup."""
+    response.set_cookie(
+        key="session",
+        value=session_id,
+        httponly=True,
+        samesite="lax",
+        max_age=settings.session_max_age_seconds,
+    )
+
+
 @router.get("/login", response_class=HTMLResponse)
 async def login_page(
     request: Request,
@@ -70,13 +82,7 @@ async def login(
 
     # Set cookie and redirect
     response = RedirectResponse(url="/", status_code=303)
-    response.set_cookie(
-        key="session",
-        value=session.id,
-        httponly=True,
-        samesite="lax",
-        max_age=settings.session_expire_hours * 3600,
-    )
+    _set_session_cookie(response, session.id, settings)
 
     return response
 
@@ -107,8 +113,7 @@ async def setup_page(
 ) -> StarletteResponse:
     """Display the initial setup page (create first user)."""
     # Check if any users exist
-    user_count = await get_user_count(db)
-    if user_count > 0:
+    if await is_setup_complete(request, db):
         return RedirectResponse(url="/auth/login", status_code=303)
 
     return templates.TemplateResponse(
@@ -130,8 +135,7 @@ async def setup(
 ) -> StarletteResponse:
     """Handle initial setup form submission."""
     # Check if any users exist
-    user_count = await get_user_count(db)
-    if user_count > 0:
+    if await is_setup_complete(request, db):
         return RedirectResponse(url="/auth/login", status_code=303)
 
     # Validate using Pydantic schema
@@ -153,6 +157,7 @@ async def setup(
 
     # Create user
     user = await create_user(db, setup_data.username, setup_data.password, setup_data.display_name)
+    request.app.state.setup_complete = True
 
     # Create session
     session = await create_session(
@@ -164,12 +169,6 @@ async def setup(
 
     # Set cookie and redirect
     response = RedirectResponse(url="/", status_code=303)
-    response.set_cookie(
-        key="session",
-        value=session.id,
-        httponly=True,
-        samesite="lax",
-        max_age=settings.session_expire_hours * 3600,
-    )
+    _set_session_cookie(response, session.id, settings)
 
     return response
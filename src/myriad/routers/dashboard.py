@@ -10,8 +10,8 @@ from myriad.core.dependencies import (
     DbSession,
     HostServiceDep,
     Templates,
+    is_setup_complete,
 )
-from myriad.core.security import get_user_count
 
 router = APIRouter(tags=["dashboard"])
 
@@ -34,18 +34,14 @@ async def dashboard(
             "user": user,
             "stats": stats,
             "locations": settings.locations,
-            "integrations": {
-                "opnsense": len(settings.integrations.opnsense),
-                "unifi": len(settings.integrations.unifi),
-            },
+            "integrations": settings.integrations_summary,
         },
     )
 
 
 @router.get("/check-setup")
-async def check_setup(db: DbSession) -> RedirectResponse:
+async def check_setup(request: Request, db: DbSession) -> RedirectResponse:
     """Check if initial setup is needed."""
-    user_count = await get_user_count(db)
-    if user_count == 0:
+    if not await is_setup_complete(request, db):
         return RedirectResponse(url="/auth/setup", status_code=303)
     return RedirectResponse(url="/auth/login", status_code=303)
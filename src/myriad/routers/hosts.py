@@ -1,9 +1,18 @@
 """Hosts router for managing discovered hosts."""
 
-from fastapi import APIRouter, HTTPException, Query, Request
+from typing import Annotated
+
+from fastapi import APIRouter, Form, HTTPException, Query, Request
 from fastapi.responses import HTMLResponse
 from starlette.responses import Response
 
+from myriad.core.caching import (
+    CACHE_REVALIDATE,
+    http_date,
+    latest_update,
+    not_modified,
+    timestamp_etag,
+)
 from myriad.core.dependencies import (
     AuthenticatedUser,
     HostServiceDep,
@@ -12,7 +21,9 @@ from myriad.core.dependencies import (
     Templates,
 )
 from myriad.models import HostStatus
-from myriad.schemas import HostCreate, HostResponse, HostSyncResult, HostUpdate
+from myriad.schemas import HostCreate, HostEditForm, HostResponse, HostSyncResult, HostUpdate
+from myriad.services.host_service import HOST_LIST_ORDER
+from myriad.services.pagination import page_cursors
 
 router = APIRouter(prefix="/hosts", tags=["hosts"])
 
@@ -28,17 +39,25 @@ async def hosts_page(
     status: HostStatus | None = None,
     page: int = Query(1, ge=1),
     page_size: int = Query(50, ge=10, le=100),
+    after: str | None = None,
+    before: str | None = None,
 ) -> Response:
     """Display the hosts list page."""
     offset = (page - 1) * page_size
-    hosts, total = await host_service.get_all(
-        location_id=location,
-        status=status,
-        limit=page_size,
-        offset=offset,
-    )
+    try:
+        hosts, total = await host_service.get_all(
+            location_id=location,
+            status=status,
+            limit=page_size,
+            offset=offset,
+            after=after,
+            before=before,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
+    prev_cursor, next_cursor = page_cursors(hosts, HOST_LIST_ORDER)
 
-    locations = await location_service.get_all()
+    locations = await location_service.get_all_cached()
     total_pages = (total + page_size - 1) // page_size
 
     return templates.TemplateResponse(
@@ -54,6 +73,8 @@ async def hosts_page(
             "page_size": page_size,
             "total": total,
             "total_pages": total_pages,
+            "prev_cursor": prev_cursor,
+            "next_cursor": next_cursor,
         },
     )
 
@@ -68,15 +89,23 @@ async def hosts_table(
     status: HostStatus | None = None,
     page: int = Query(1, ge=1),
     page_size: int = Query(50, ge=10, le=100),
+    after: str | None = None,
+    before: str | None = None,
 ) -> Response:
     """Get just the hosts table (for HTMX partial updates)."""
     offset = (page - 1) * page_size
-    hosts, total = await host_service.get_all(
-        location_id=location,
-        status=status,
-        limit=page_size,
-        offset=offset,
-    )
+    try:
+        hosts, total = await host_service.get_all(
+            location_id=location,
+            status=status,
+            limit=page_size,
+            offset=offset,
+            after=after,
+            before=before,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
+    prev_cursor, next_cursor = page_cursors(hosts, HOST_LIST_ORDER)
 
     total_pages = (total + page_size - 1) // page_size
 
@@ -89,7 +118,10 @@ async def hosts_table(
             "page_size": page_size,
             "total": total,
             "total_pages": total_pages,
+            "prev_cursor": prev_cursor,
+            "next_cursor": next_cursor,
         },
+        headers={"Cache-Control": CACHE_REVALIDATE},
     )
 
 
@@ -107,6 +139,16 @@ async def host_detail(
     if not host:
         raise HTTPException(status_code=404, detail="Host not found")
 
+    last_modified = latest_update(host, host.location, user)
+    etag = timestamp_etag(host, host.location, user)
+    headers = {
+        "Cache-Control": CACHE_REVALIDATE,
+        "ETag": etag,
+        "Last-Modified": http_date(last_modified),
+    }
+    if not_modified(request, etag, last_modified):
+        return Response(status_code=304, headers=headers)
+
     return templates.TemplateResponse(
         "hosts/detail.html",
         {
@@ -114,6 +156,7 @@ async def host_detail(
             "user": user,
             "host": host,
         },
+        headers=headers,
     )
 
 
@@ -121,6 +164,7 @@ async def host_detail(
 async def host_edit(
     request: Request,
     host_id: int,
+    form: Annotated[HostEditForm, Form()],
     user: AuthenticatedUser,
     templates: Templates,
     host_service: HostServiceDep,
@@ -131,16 +175,7 @@ async def host_edit(
     if not host:
         raise HTTPException(status_code=404, detail="Host not found")
 
-    form_data = await request.form()
-
-    update_data = HostUpdate(
-        display_name=form_data.get("display_name") or None,
-        host_type=form_data.get("host_type") or None,
-        location_id=form_data.get("location_id") or None,
-        notes=form_data.get("notes") or None,
-    )
-
-    host = await host_service.update(host, update_data)
+    host = await host_service.update(host, HostUpdate(**form.model_dump()))
 
     return templates.TemplateResponse(
         "hosts/_detail_card.html",
@@ -202,12 +237,10 @@ async def create_host_api(
     host_service: HostServiceDep,
 ) -> HostResponse:
     """Create a new host (JSON API)."""
-    # Check for duplicate MAC
-    existing = await host_service.get_by_mac(data.mac_address)
-    if existing:
+    host = await host_service.create(data)
+    if not host:
         raise HTTPException(status_code=409, detail="Host with this MAC address already exists")
 
-    host = await host_service.create(data)
     return HostResponse.model_validate(host)
 
 
@@ -4,15 +4,26 @@ from fastapi import APIRouter, HTTPException, Query, Request
 from fastapi.responses import HTMLResponse
 from starlette.responses import Response
 
+from myriad.core.caching import (
+    CACHE_REVALIDATE,
+    CACHE_SHORT,
+    http_date,
+    latest_update,
+    not_modified,
+    timestamp_etag,
+)
 from myriad.core.dependencies import AuthenticatedUser, ProxmoxServiceDep, Templates
 from myriad.models import VMState, VMType
 from myriad.schemas.vm import (
+    HYPERVISOR_LIST_ADAPTER,
+    VM_SYNC_LIST_ADAPTER,
     HypervisorResponse,
     VMDetailResponse,
-    VMSnapshotResponse,
     VMStatsResponse,
     VMSyncResult,
 )
+from myriad.services.pagination import page_cursors
+from myriad.services.proxmox_service import VM_LIST_ORDER
 
 router = APIRouter(prefix="/vms", tags=["vms"])
 
@@ -28,16 +39,24 @@ async def vms_page(
     vm_type: VMType | None = None,
     page: int = Query(1, ge=1),
     page_size: int = Query(50, ge=10, le=100),
+    after: str | None = None,
+    before: str | None = None,
 ) -> Response:
     """Display the VMs list page."""
     offset = (page - 1) * page_size
-    vms, total = await proxmox_service.get_all_vms(
-        hypervisor_id=hypervisor,
-        state=state,
-        vm_type=vm_type,
-        limit=page_size,
-        offset=offset,
-    )
+    try:
+        vms, total = await proxmox_service.get_all_vms(
+            hypervisor_id=hypervisor,
+            state=state,
+            vm_type=vm_type,
+            limit=page_size,
+            offset=offset,
+            after=after,
+            before=before,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
+    prev_cursor, next_cursor = page_cursors(vms, VM_LIST_ORDER)
 
     hypervisors = await proxmox_service.get_hypervisors()
     stats = await proxmox_service.get_vm_stats()
@@ -58,6 +77,8 @@ async def vms_page(
             "page_size": page_size,
             "total": total,
             "total_pages": total_pages,
+            "prev_cursor": prev_cursor,
+            "next_cursor": next_cursor,
         },
     )
 
@@ -73,16 +94,24 @@ async def vms_table(
     vm_type: VMType | None = None,
     page: int = Query(1, ge=1),
     page_size: int = Query(50, ge=10, le=100),
+    after: str | None = None,
+    before: str | None = None,
 ) -> Response:
     """Get just the VMs table (for HTMX partial updates)."""
     offset = (page - 1) * page_size
-    vms, total = await proxmox_service.get_all_vms(
-        hypervisor_id=hypervisor,
-        state=state,
-        vm_type=vm_type,
-        limit=page_size,
-        offset=offset,
-    )
+    try:
+        vms, total = await proxmox_service.get_all_vms(
+            hypervisor_id=hypervisor,
+            state=state,
+            vm_type=vm_type,
+            limit=page_size,
+            offset=offset,
+            after=after,
+            before=before,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
+    prev_cursor, next_cursor = page_cursors(vms, VM_LIST_ORDER)
 
     total_pages = (total + page_size - 1) // page_size
 
@@ -95,7 +124,10 @@ async def vms_table(
             "page_size": page_size,
             "total": total,
             "total_pages": total_pages,
+            "prev_cursor": prev_cursor,
+            "next_cursor": next_cursor,
         },
+        headers={"Cache-Control": CACHE_REVALIDATE},
     )
 
 
@@ -113,6 +145,16 @@ async def vm_detail(
     if not vm:
         raise HTTPException(status_code=404, detail="VM not found")
 
+    last_modified = latest_update(vm, vm.hypervisor, vm.host, *vm.snapshots, user)
+    etag = timestamp_etag(vm, vm.hypervisor, vm.host, *vm.snapshots, user)
+    headers = {
+        "Cache-Control": CACHE_REVALIDATE,
+        "ETag": etag,
+        "Last-Modified": http_date(last_modified),
+    }
+    if not_modified(request, etag, last_modified):
+        return Response(status_code=304, headers=headers)
+
     return templates.TemplateResponse(
         "vms/detail.html",
         {
@@ -120,6 +162,7 @@ async def vm_detail(
             "user": user,
             "vm": vm,
         },
+        headers=headers,
     )
 
 
@@ -135,16 +178,7 @@ async def sync_vms(
     """Trigger a VM sync from a Proxmox integration."""
     try:
         result = await proxmox_service.sync_proxmox(integration_id)
-        return VMSyncResult(
-            hypervisor_id=result.hypervisor_id,
-            vms_created=result.vms_created,
-            vms_updated=result.vms_updated,
-            vms_removed=result.vms_removed,
-            hosts_linked=result.hosts_linked,
-            snapshots_synced=result.snapshots_synced,
-            timestamp=result.timestamp,
-            error=result.error,
-        )
+        return VMSyncResult.model_validate(result)
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e)) from e
     except ConnectionError as e:
@@ -158,79 +192,45 @@ async def sync_all_vms(
 ) -> list[VMSyncResult]:
     """Trigger a sync from all configured Proxmox integrations."""
     results = await proxmox_service.sync_all_proxmox()
-    return [
-        VMSyncResult(
-            hypervisor_id=r.hypervisor_id,
-            vms_created=r.vms_created,
-            vms_updated=r.vms_updated,
-            vms_removed=r.vms_removed,
-            hosts_linked=r.hosts_linked,
-            snapshots_synced=r.snapshots_synced,
-            timestamp=r.timestamp,
-            error=r.error,
-        )
-        for r in results
-    ]
-
-
-@router.get("/api/{vm_id}", response_model=VMDetailResponse)
-async def get_vm_api(
-    vm_id: int,
-    user: AuthenticatedUser,
-    proxmox_service: ProxmoxServiceDep,
-) -> VMDetailResponse:
-    """Get VM by ID (JSON API)."""
-    vm = await proxmox_service.get_vm_by_id(vm_id)
-
-    if not vm:
-        raise HTTPException(status_code=404, detail="VM not found")
-
-    # Convert to response with relationships
-    hypervisor_resp = None
-    if vm.hypervisor:
-        hypervisor_resp = HypervisorResponse.model_validate(vm.hypervisor)
-
-    snapshots_resp = [VMSnapshotResponse.model_validate(s) for s in vm.snapshots]
-
-    return VMDetailResponse(
-        id=vm.id,
-        uuid=vm.uuid,
-        name=vm.name,
-        vmid=vm.vmid,
-        vm_type=vm.vm_type,
-        hypervisor_id=vm.hypervisor_id,
-        host_id=vm.host_id,
-        state=vm.state,
-        vcpus=vm.vcpus,
-        memory_mb=vm.memory_mb,
-        disk_gb=vm.disk_gb,
-        mac_addresses=vm.mac_addresses,
-        uptime_seconds=vm.uptime_seconds,
-        tags=vm.tags,
-        last_state_change=vm.last_state_change,
-        description=vm.description,
-        created_at=vm.created_at,
-        updated_at=vm.updated_at,
-        hypervisor=hypervisor_resp,
-        snapshots=snapshots_resp,
-    )
+    return VM_SYNC_LIST_ADAPTER.validate_python(results)
 
 
+# Declared before /api/{vm_id} so these literal paths match first
 @router.get("/api/stats", response_model=VMStatsResponse)
 async def get_vm_stats(
+    response: Response,
     user: AuthenticatedUser,
     proxmox_service: ProxmoxServiceDep,
 ) -> VMStatsResponse:
     """Get VM statistics."""
+    response.headers["Cache-Control"] = CACHE_SHORT
     stats = await proxmox_service.get_vm_stats()
     return VMStatsResponse(**stats)
 
 
 @router.get("/api/hypervisors", response_model=list[HypervisorResponse])
 async def get_hypervisors(
+    response: Response,
     user: AuthenticatedUser,
     proxmox_service: ProxmoxServiceDep,
 ) -> list[HypervisorResponse]:
     """Get all hypervisors."""
+    response.headers["Cache-Control"] = CACHE_SHORT
     hypervisors = await proxmox_service.get_hypervisors()
-    return [HypervisorResponse.model_validate(h) for h in hypervisors]
+    return HYPERVISOR_LIST_ADAPTER.validate_python(hypervisors)
+
+
+@router.get("/api/{vm_id}", response_model=VMDetailResponse)
+async def get_vm_api(
+    vm_id: int,
+    user: AuthenticatedUser,
+    proxmox_service: ProxmoxServiceDep,
+) -> VMDetailResponse:
+    """Get VM by ID (JSON API)."""
+    vm = await proxmox_service.get_vm_by_id(vm_id)
+
+    if not vm:
+        raise HTTPException(status_code=404, detail="VM not found")
+
+    # One pass over the row builds the nested hypervisor and snapshots too
+    return VMDetailResponse.model_validate(vm)
@@ -3,6 +3,7 @@
 from myriad.schemas.auth import LoginRequest, SetupRequest, UserCreate, UserResponse
 from myriad.schemas.host import (
     HostCreate,
+    HostEditForm,
     HostListResponse,
     HostResponse,
     HostSyncResult,
@@ -10,6 +11,9 @@ from myriad.schemas.host import (
 )
 from myriad.schemas.location import LocationCreate, LocationResponse, LocationUpdate
 from myriad.schemas.vm import (
+    HYPERVISOR_LIST_ADAPTER,
+    VM_SNAPSHOT_LIST_ADAPTER,
+    VM_SYNC_LIST_ADAPTER,
     HypervisorResponse,
     VMDetailResponse,
     VMListResponse,
@@ -26,6 +30,7 @@ __all__ = [
     "SetupRequest",
     "HostCreate",
     "HostUpdate",
+    "HostEditForm",
     "HostResponse",
     "HostListResponse",
     "HostSyncResult",
@@ -39,4 +44,7 @@ __all__ = [
     "VMSnapshotResponse",
     "VMStatsResponse",
     "VMSyncResult",
+    "HYPERVISOR_LIST_ADAPTER",
+    "VM_SNAPSHOT_LIST_ADAPTER",
+    "VM_SYNC_LIST_ADAPTER",
 ]
@@ -1,7 +1,14 @@
 """Authentication schemas."""
 
+from typing import Annotated
+
 from pydantic import BaseModel, Field, model_validator
 
+from myriad.schemas.base import RESPONSE_CONFIG
+
+# Shared by account creation and setup; pydantic-core compiles the pattern once
+Username = Annotated[str, Field(min_length=3, max_length=50, pattern=r"^[a-zA-Z0-9_]+$")]
+
 
 class LoginRequest(BaseModel):
     """Login form data."""
@@ -13,7 +20,7 @@ class LoginRequest(BaseModel):
 class UserCreate(BaseModel):
     """User creation data."""
 
-    username: str = Field(..., min_length=3, max_length=50, pattern=r"^[a-zA-Z0-9_]+$")
+    username: Username
     password: str = Field(..., min_length=8)
     display_name: str | None = Field(None, max_length=100)
 
@@ -26,13 +33,13 @@ class UserResponse(BaseModel):
     display_name: str | None
     is_active: bool
 
-    model_config = {"from_attributes": True}
+    model_config = RESPONSE_CONFIG
 
 
 class SetupRequest(BaseModel):
     """Initial setup form data."""
 
-    username: str = Field(..., min_length=3, max_length=50, pattern=r"^[a-zA-Z0-9_]+$")
+    username: Username
     password: str = Field(..., min_length=8)
     password_confirm: str = Field(..., min_length=8)
     display_name: str | None = Field(None, max_length=100)
@@ -0,0 +1,7 @@
+"""Shared schema configuration."""
+
+from pydantic import ConfigDict
+
+# Response models are read-only snapshots of ORM rows: frozen once built, and
+# their core schemas are compiled on first use rather than at import time.
+RESPONSE_CONFIG = ConfigDict(from_attributes=True, frozen=True, defer_build=True)
@@ -1,16 +1,21 @@
 """Host schemas for validation and responses."""
 
 from datetime import datetime
+from typing import Annotated
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, StringConstraints, field_validator
 
 from myriad.models import DiscoverySource, HostStatus, HostType
+from myriad.schemas.base import RESPONSE_CONFIG
+
+# Normalized form stored on Host rows (see HostService._normalize_mac)
+MacAddress = Annotated[str, StringConstraints(pattern=r"^([0-9a-fA-F]{2}:){5}[0-9a-fA-F]{2}$")]
 
 
 class HostBase(BaseModel):
     """Base host fields."""
 
-    mac_address: str = Field(..., pattern=r"^([0-9a-fA-F]{2}:){5}[0-9a-fA-F]{2}$")
+    mac_address: MacAddress
     hostname: str | None = None
     display_name: str | None = None
     ip_address: str | None = None
@@ -35,6 +40,21 @@ class HostUpdate(BaseModel):
     notes: str | None = None
 
 
+class HostEditForm(BaseModel):
+    """Host edit form fields from the detail page (blank inputs become None)."""
+
+    display_name: str | None = None
+    host_type: HostType | None = None
+    location_id: str | None = None
+    notes: str | None = None
+
+    @field_validator("*", mode="before")
+    @classmethod
+    def blank_to_none(cls, value: object) -> object:
+        """Treat empty form inputs as not set."""
+        return value or None
+
+
 class HostResponse(HostBase):
     """Host response data."""
 
@@ -51,7 +71,7 @@ class HostResponse(HostBase):
     created_at: datetime
     updated_at: datetime
 
-    model_config = {"from_attributes": True}
+    model_config = RESPONSE_CONFIG
 
     @property
     def effective_name(self) -> str:
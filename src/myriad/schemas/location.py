@@ -1,14 +1,19 @@
 """Location schemas for validation and responses."""
 
 from datetime import datetime
+from typing import Annotated
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, StringConstraints
+
+from myriad.schemas.base import RESPONSE_CONFIG
+
+LocationId = Annotated[str, StringConstraints(min_length=1, max_length=50, pattern=r"^[a-z0-9-]+$")]
 
 
 class LocationBase(BaseModel):
     """Base location fields."""
 
-    id: str = Field(..., min_length=1, max_length=50, pattern=r"^[a-z0-9-]+$")
+    id: LocationId
     name: str = Field(..., min_length=1, max_length=100)
     network_cidr: str | None = None
     description: str | None = None
@@ -35,4 +40,4 @@ class LocationResponse(LocationBase):
     updated_at: datetime
     host_count: int = 0
 
-    model_config = {"from_attributes": True}
+    model_config = RESPONSE_CONFIG
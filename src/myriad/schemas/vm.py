@@ -1,11 +1,11 @@
 """VM schemas for validation and responses."""
 
-import json
 from datetime import datetime
 
-from pydantic import BaseModel, ConfigDict, computed_field
+from pydantic import BaseModel, ConfigDict, TypeAdapter, computed_field
 
 from myriad.models import HypervisorStatus, HypervisorType, VMState, VMType
+from myriad.schemas.base import RESPONSE_CONFIG
 
 
 class HypervisorResponse(BaseModel):
@@ -24,7 +24,7 @@ class HypervisorResponse(BaseModel):
     created_at: datetime
     updated_at: datetime
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = RESPONSE_CONFIG
 
 
 class VMResponse(BaseModel):
@@ -41,26 +41,21 @@ class VMResponse(BaseModel):
     vcpus: int | None
     memory_mb: int | None
     disk_gb: float | None
-    mac_addresses: str | None  # JSON string
+    mac_addresses: list[str] = []
     uptime_seconds: int | None
-    tags: str | None
+    tags: list[str] = []
     last_state_change: datetime | None
     description: str | None
     created_at: datetime
     updated_at: datetime
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = RESPONSE_CONFIG
 
     @computed_field
     @property
     def mac_list(self) -> list[str]:
-        """Parse MAC addresses from JSON string."""
-        if not self.mac_addresses:
-            return []
-        try:
-            return json.loads(self.mac_addresses)
-        except (json.JSONDecodeError, TypeError):
-            return []
+        """MAC addresses (kept alongside mac_addresses for existing API clients)."""
+        return self.mac_addresses
 
     @computed_field
     @property
@@ -77,17 +72,14 @@ class VMResponse(BaseModel):
         if self.uptime_seconds is None:
             return None
 
-        seconds = self.uptime_seconds
-        days = seconds // 86400
-        hours = (seconds % 86400) // 3600
-        minutes = (seconds % 3600) // 60
+        days, seconds = divmod(self.uptime_seconds, 86400)
+        hours, seconds = divmod(seconds, 3600)
 
-        if days > 0:
+        if days:
             return f"{days}d {hours}h"
-        elif hours > 0:
-            return f"{hours}h {minutes}m"
-        else:
-            return f"{minutes}m"
+        if hours:
+            return f"{hours}h {seconds // 60}m"
+        return f"{seconds // 60}m"
 
 
 class VMDetailResponse(VMResponse):
@@ -107,7 +99,7 @@ class VMSnapshotResponse(BaseModel):
     parent_snapshot_name: str | None
     created_at: datetime
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = RESPONSE_CONFIG
 
 
 class VMListResponse(BaseModel):
@@ -132,6 +124,8 @@ class VMSyncResult(BaseModel):
     timestamp: datetime
     error: str | None = None
 
+    model_config = ConfigDict(from_attributes=True)
+
 
 class VMStatsResponse(BaseModel):
     """VM statistics response."""
@@ -145,3 +139,8 @@ class VMStatsResponse(BaseModel):
 
 # Update forward references
 VMDetailResponse.model_rebuild()
+
+# Validate whole lists in one pydantic-core call instead of one model_validate per item
+HYPERVISOR_LIST_ADAPTER = TypeAdapter(list[HypervisorResponse])
+VM_SNAPSHOT_LIST_ADAPTER = TypeAdapter(list[VMSnapshotResponse])
+VM_SYNC_LIST_ADAPTER = TypeAdapter(list[VMSyncResult])
@@ -1,20 +1,56 @@
 """Host service for managing discovered hosts."""
 
 import logging
+import re
 from datetime import datetime
+from functools import lru_cache
 
-from sqlalchemy import func, select
+from sqlalchemy import Boolean, and_, case, func, literal_column, select
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import defer, raiseload, selectinload
 
-from myriad.models import DiscoverySource, Host, HostStatus
+from myriad.config import get_settings
+from myriad.models import DiscoverySource, Host, HostStatus, utc_now
 from myriad.schemas import HostCreate, HostUpdate
+from myriad.services.pagination import SortKey, paginate
 
 logger = logging.getLogger(__name__)
 
+# A row version written by this INSERT has no deleting transaction yet; one
+# touched by ON CONFLICT DO UPDATE carries ours in xmax.
+_PG_INSERTED = literal_column("(xmax = 0)", Boolean).label("inserted")
+
+# MAC normalization, compiled once for the discovery hot path
+_MAC_PAIRS_RE = re.compile(r"[0-9a-f]{2}(?:[:.-][0-9a-f]{2}){5}")
+_MAC_HEX_RE = re.compile(r"[0-9a-f]{12}")
+_MAC_TO_COLONS = str.maketrans("-.", "::")
+_MAC_STRIP_SEPARATORS = str.maketrans("", "", ":-.")
+
+# Host list ordering: most recently seen first, id breaks ties for cursors.
+# NULL hostnames go where each dialect's list-order index keeps them, so a
+# cursor page stays an index seek: SQLite's index can't declare a placement
+# and stores them first.
+HOST_LIST_ORDER = (
+    SortKey(Host.last_seen, descending=True, nulls_last=True),
+    SortKey(Host.hostname),
+    SortKey(Host.id),
+)
+# NULLS LAST is PostgreSQL's default for ascending order, which the list always used
+_HOST_LIST_ORDER_PG = (
+    HOST_LIST_ORDER[0],
+    SortKey(Host.hostname, nulls_last=True),
+    HOST_LIST_ORDER[2],
+)
+
 
 class HostService:
     """Service for host CRUD operations."""
 
+    # Built per request and per sync, so skip the per-instance __dict__
+    __slots__ = ("db",)
+
     def __init__(self, db: AsyncSession):
         self.db = db
 
@@ -24,9 +60,19 @@ class HostService:
         status: HostStatus | None = None,
         limit: int = 100,
         offset: int = 0,
+        after: str | None = None,
+        before: str | None = None,
     ) -> tuple[list[Host], int]:
-        """Get all hosts with optional filtering."""
-        query = select(Host)
+        """Get all hosts with optional filtering.
+
+        Pages are selected by an after/before cursor (see HOST_LIST_ORDER) when
+        given, otherwise by offset. Free-text notes are deferred, as list
+        views don't show them.
+
+        Raises:
+            ValueError: If a cursor is malformed
+        """
+        query = select(Host).options(defer(Host.notes), *self._relationship_loads())
 
         if location_id:
             query = query.where(Host.location_id == location_id)
@@ -44,17 +90,25 @@ class HostService:
         total = total_result.scalar_one()
 
         # Get paginated results
-        query = query.order_by(Host.last_seen.desc().nullslast(), Host.hostname)
-        query = query.limit(limit).offset(offset)
+        keys = (
+            _HOST_LIST_ORDER_PG
+            if self.db.get_bind().dialect.name == "postgresql"
+            else HOST_LIST_ORDER
+        )
+        query, backwards = paginate(query, keys, limit, offset, after, before)
 
         result = await self.db.execute(query)
         hosts = list(result.scalars().all())
+        if backwards:
+            hosts.reverse()
 
         return hosts, total
 
     async def get_by_id(self, host_id: int) -> Host | None:
         """Get a host by ID."""
-        result = await self.db.execute(select(Host).where(Host.id == host_id))
+        result = await self.db.execute(
+            select(Host).where(Host.id == host_id).options(*self._relationship_loads())
+        )
         return result.scalar_one_or_none()
 
     async def get_by_mac(self, mac_address: str) -> Host | None:
@@ -63,32 +117,57 @@ class HostService:
         result = await self.db.execute(select(Host).where(Host.mac_address == normalized_mac))
         return result.scalar_one_or_none()
 
-    async def create(self, data: HostCreate) -> Host:
-        """Create a new host."""
-        host = Host(
-            mac_address=self._normalize_mac(data.mac_address),
-            hostname=data.hostname,
-            display_name=data.display_name,
-            ip_address=data.ip_address,
-            host_type=data.host_type,
-            location_id=data.location_id,
-            notes=data.notes,
-            discovery_source=DiscoverySource.MANUAL,
-            first_seen=datetime.utcnow(),
-            last_seen=datetime.utcnow(),
+    async def create(self, data: HostCreate) -> Host | None:
+        """Create a new host.
+
+        The insert skips MACs that already exist (ON CONFLICT DO NOTHING), so
+        there's no separate lookup and no race between checking and inserting.
+
+        Returns:
+            The new host, or None if a host with this MAC address already exists
+        """
+        now = datetime.utcnow()
+        stmt = (
+            self._dialect_insert()(Host)
+            .values(
+                mac_address=self._normalize_mac(data.mac_address),
+                hostname=data.hostname,
+                display_name=data.display_name,
+                ip_address=data.ip_address,
+                host_type=data.host_type,
+                location_id=data.location_id,
+                notes=data.notes,
+                discovery_source=DiscoverySource.MANUAL,
+                first_seen=now,
+                last_seen=now,
+            )
+            .on_conflict_do_nothing(index_elements=[Host.mac_address])
+            .returning(Host)
         )
-        self.db.add(host)
-        await self.db.flush()
-        return host
+        result = await self.db.execute(stmt)
+        return result.scalar_one_or_none()
 
     async def update(self, host: Host, data: HostUpdate) -> Host:
-        """Update an existing host."""
-        update_data = data.model_dump(exclude_unset=True)
+        """Update an existing host.
+
+        Only fields set on data that differ from the host are written; the
+        fields are all scalars, so they're copied straight across rather than
+        through model_dump(). A no-op update issues no statements.
+        """
+        changed = {
+            field for field in data.model_fields_set if getattr(host, field) != getattr(data, field)
+        }
+        if not changed:
+            return host
 
-        for field, value in update_data.items():
-            setattr(host, field, value)
+        for field in changed:
+            setattr(host, field, getattr(data, field))
 
         await self.db.flush()
+
+        # Changing the FK doesn't update an already-loaded relationship
+        if "location_id" in changed:
+            await self.db.refresh(host, ["location"])
         return host
 
     async def delete(self, host: Host) -> None:
@@ -105,66 +184,174 @@ class HostService:
         is_static: bool = False,
         lease_expires: datetime | None = None,
         location_id: str | None = None,
+        *,
+        now: datetime | None = None,
     ) -> tuple[Host, bool]:
         """Create or update a host from discovery.
 
+        One INSERT ... ON CONFLICT ... RETURNING decides between insert and
+        update, so there's no lookup first and no race between the two. Pass
+        now to stamp several calls from one sync with the same time.
+
+        On PostgreSQL, created comes from the row's xmax in the same
+        statement. SQLite has no insert marker, so there a shared now costs
+        one primary-key lookup first; without it, first_seen equal to this
+        call's own timestamp can only mean the row was just inserted.
+
         Returns (host, created) where created is True if a new host was created.
         """
-        normalized_mac = self._normalize_mac(mac_address)
-        existing = await self.get_by_mac(normalized_mac)
+        mac = self._normalize_mac(mac_address)
+        postgresql = self.db.get_bind().dialect.name == "postgresql"
+        existed = None
+        if now is not None and not postgresql:
+            existed = await self.db.scalar(select(Host.id).where(Host.mac_address == mac))
+        now = now or datetime.utcnow()
+        row = self._discovery_row(
+            mac,
+            ip_address,
+            hostname,
+            source,
+            is_static,
+            lease_expires,
+            location_id,
+            now,
+        )
+        stmt = (
+            self._discovery_upsert(row)
+            .returning(Host, *([_PG_INSERTED] if postgresql else []))
+            # Refresh the host if this session already has it loaded
+            .execution_options(populate_existing=True)
+        )
+        result = await self.db.execute(stmt)
+        if postgresql:
+            host, created = result.one()
+            return host, created
+        host = result.scalar_one()
+        if existed is not None:
+            return host, False
+        # The conflict update leaves first_seen alone, so only a new row has ours
+        return host, host.first_seen == now
+
+    async def bulk_upsert_from_discovery(
+        self,
+        records: list[dict],
+        source: DiscoverySource,
+        location_id: str | None = None,
+        *,
+        now: datetime | None = None,
+    ) -> tuple[int, int]:
+        """Create or update many discovered hosts in a single statement.
+
+        Each record holds the upsert_from_discovery() fields: mac_address,
+        ip_address, hostname, is_static and lease_expires. The same merge rules
+        apply, but as one executemany INSERT ... ON CONFLICT instead of a
+        statement per host. Every row is stamped with the same now (default:
+        the current UTC time).
+
+        Returns (created, updated) counts.
+        """
+        now = now or datetime.utcnow()
+
+        # Last record wins if a MAC appears twice (e.g. lease and static mapping)
+        rows_by_mac: dict[str, dict] = {}
+        for record in records:
+            mac = self._normalize_mac(record["mac_address"])
+            rows_by_mac[mac] = self._discovery_row(
+                mac,
+                record["ip_address"],
+                record.get("hostname"),
+                source,
+                record.get("is_static", False),
+                record.get("lease_expires"),
+                location_id,
+                now,
+            )
+
+        if not rows_by_mac:
+            return 0, 0
+
+        existing_result = await self.db.execute(
+            select(Host.mac_address).where(Host.mac_address.in_(list(rows_by_mac)))
+        )
+        updated = len(existing_result.scalars().all())
 
-        now = datetime.utcnow()
+        await self.db.execute(self._discovery_upsert(), list(rows_by_mac.values()))
 
-        if existing:
-            # Update existing host
-            existing.ip_address = ip_address
-            existing.is_static_lease = is_static
-            existing.lease_expires = lease_expires
-            existing.last_seen = now
-            existing.status = HostStatus.ONLINE
-
-            # Only update hostname if we have one and don't have a display_name
-            if hostname and not existing.display_name:
-                existing.hostname = hostname
-
-            # Only update location if not manually set
-            if location_id and not existing.location_id:
-                existing.location_id = location_id
-
-            await self.db.flush()
-            return existing, False
-
-        # Create new host
-        host = Host(
-            mac_address=normalized_mac,
-            hostname=hostname,
-            ip_address=ip_address,
-            discovery_source=source,
-            is_static_lease=is_static,
-            lease_expires=lease_expires,
-            location_id=location_id,
-            status=HostStatus.ONLINE,
-            first_seen=now,
-            last_seen=now,
-        )
-        self.db.add(host)
-        await self.db.flush()
-        return host, True
+        return len(rows_by_mac) - updated, updated
 
-    async def get_stats(self) -> dict:
-        """Get host statistics."""
-        total_result = await self.db.execute(select(func.count(Host.id)))
-        total = total_result.scalar_one()
+    @staticmethod
+    def _discovery_row(
+        mac_address: str,
+        ip_address: str,
+        hostname: str | None,
+        source: DiscoverySource,
+        is_static: bool,
+        lease_expires: datetime | None,
+        location_id: str | None,
+        now: datetime,
+    ) -> dict:
+        """Column values for a discovered host, as inserted when it's new."""
+        return {
+            "mac_address": mac_address,
+            "hostname": hostname,
+            "ip_address": ip_address,
+            "discovery_source": source,
+            "is_static_lease": is_static,
+            "lease_expires": lease_expires,
+            "location_id": location_id,
+            "status": HostStatus.ONLINE,
+            "first_seen": now,
+            "last_seen": now,
+        }
 
-        online_result = await self.db.execute(
-            select(func.count(Host.id)).where(Host.status == HostStatus.ONLINE)
+    def _discovery_upsert(self, values: dict | None = None):
+        """INSERT ... ON CONFLICT (mac_address) applying the discovery merge rules."""
+        stmt = self._dialect_insert()(Host)
+        if values is not None:
+            stmt = stmt.values(values)
+        excluded = stmt.excluded
+        return stmt.on_conflict_do_update(
+            index_elements=[Host.mac_address],
+            set_={
+                "ip_address": excluded.ip_address,
+                "is_static_lease": excluded.is_static_lease,
+                "lease_expires": excluded.lease_expires,
+                "last_seen": excluded.last_seen,
+                "status": excluded.status,
+                # Only update hostname if we have one and don't have a display_name;
+                # empty strings (e.g. a static mapping without a name) count as unset
+                "hostname": case(
+                    (
+                        and_(
+                            func.nullif(excluded.hostname, "").is_not(None),
+                            func.nullif(Host.display_name, "").is_(None),
+                        ),
+                        excluded.hostname,
+                    ),
+                    else_=Host.hostname,
+                ),
+                # Only update location if not manually set
+                "location_id": func.coalesce(Host.location_id, excluded.location_id),
+                "updated_at": utc_now(),
+            },
         )
-        online = online_result.scalar_one()
 
-        static_result = await self.db.execute(
-            select(func.count(Host.id)).where(Host.is_static_lease == True)  # noqa: E712
+    def _dialect_insert(self):
+        """INSERT construct with ON CONFLICT support for the bound database."""
+        if self.db.get_bind().dialect.name == "postgresql":
+            return postgresql_insert
+        return sqlite_insert
+
+    async def get_stats(self) -> dict:
+        """Get host statistics (one aggregate query, using FILTER for each count)."""
+        result = await self.db.execute(
+            select(
+                func.count(Host.id),
+                func.count(Host.id).filter(Host.status == HostStatus.ONLINE),
+                func.count(Host.id).filter(Host.is_static_lease.is_(True)),
+            )
         )
-        static = static_result.scalar_one()
+        total, online, static = result.one()
 
         return {
             "total": total,
@@ -175,9 +362,26 @@ class HostService:
         }
 
     @staticmethod
+    def _relationship_loads() -> tuple:
+        """Loader options for relationships that templates render.
+
+        selectinload batches each relationship into one IN query for the whole page,
+        rather than a lazy load per row (which also fails under AsyncSession).
+        """
+        options = (selectinload(Host.location), selectinload(Host.virtual_machine))
+        if get_settings().server.debug:
+            # In development, fail loudly on any relationship not loaded above
+            options += (raiseload("*"),)
+        return options
+
+    @staticmethod
+    @lru_cache(maxsize=4096)
     def _normalize_mac(mac: str) -> str:
         """Normalize MAC address to lowercase with colons.
 
+        Discovery sees the same MAC strings on every sync, so results are
+        cached; invalid input raises and is never cached.
+
         Args:
             mac: MAC address in any common format
 
@@ -187,20 +391,13 @@ class HostService:
         Raises:
             ValueError: If MAC address format is invalid
         """
-        mac = mac.lower().replace("-", ":").replace(".", ":")
-        parts = mac.split(":")
-
-        if len(parts) != 6:
-            # Try removing all separators and rebuilding
-            clean = mac.replace(":", "")
-            if len(clean) == 12:
-                parts = [clean[i : i + 2] for i in range(0, 12, 2)]
-            else:
-                raise ValueError(f"Invalid MAC address format: {mac}")
-
-        # Validate each part is valid hex
-        for part in parts:
-            if len(part) != 2 or not all(c in "0123456789abcdef" for c in part):
-                raise ValueError(f"Invalid MAC address format: {mac}")
-
-        return ":".join(parts)
+        lowered = mac.lower()
+        if _MAC_PAIRS_RE.fullmatch(lowered):
+            return lowered.translate(_MAC_TO_COLONS)
+
+        # Six groups must be pairs; anything else may be 12 hex digits grouped
+        # arbitrarily (e.g. Cisco's aabb.ccdd.eeff)
+        clean = lowered.translate(_MAC_STRIP_SEPARATORS)
+        if len(lowered) - len(clean) == 5 or not _MAC_HEX_RE.fullmatch(clean):
+            raise ValueError(f"Invalid MAC address format: {mac}")
+        return ":".join([clean[i : i + 2] for i in range(0, 12, 2)])
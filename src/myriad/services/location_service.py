@@ -1,11 +1,50 @@
 """Location service for managing network locations."""
 
-from sqlalchemy import func, select
+import time
+from dataclasses import dataclass
+
+from sqlalchemy import event, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
 
 from myriad.models import Host, Location
 from myriad.schemas import LocationCreate, LocationUpdate
 
+# Locations only change when config is applied at startup, so list pages share
+# one snapshot per process for a short while. The TTL bounds how stale other
+# workers' copies get after a change.
+LOCATIONS_CACHE_TTL_SECONDS = 60.0
+
+# Session.info flag set by location writes, so their commit drops the cache
+_LOCATIONS_WRITTEN = "locations_written"
+
+
+@dataclass(frozen=True, slots=True)
+class LocationOption:
+    """A location as a filter dropdown shows it."""
+
+    id: str
+    name: str
+
+
+_locations_cache: tuple[float, tuple[LocationOption, ...]] | None = None
+# Bumped on every invalidation, so a read that raced a commit doesn't store its result
+_locations_generation = 0
+
+
+def invalidate_locations_cache() -> None:
+    """Drop the cached location list so the next read queries again."""
+    global _locations_cache, _locations_generation
+    _locations_cache = None
+    _locations_generation += 1
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_after_commit(session: Session) -> None:
+    """Drop the cached list once a session's location writes are committed."""
+    if session.info.pop(_LOCATIONS_WRITTEN, False):
+        invalidate_locations_cache()
+
 
 class LocationService:
     """Service for location CRUD operations."""
@@ -18,10 +57,39 @@ class LocationService:
         result = await self.db.execute(select(Location).order_by(Location.name))
         return list(result.scalars().all())
 
+    async def get_all_cached(self) -> tuple[LocationOption, ...]:
+        """Get every location's id and name, reusing a recent result from any session.
+
+        The cache is dropped when a location write commits. Until then, a
+        session holding uncommitted location writes reads around it, so a
+        rolled-back change is never cached.
+        """
+        global _locations_cache
+        if self.db.sync_session.info.get(_LOCATIONS_WRITTEN):
+            return await self._location_options()
+
+        now = time.monotonic()
+        if _locations_cache is not None and now - _locations_cache[0] < LOCATIONS_CACHE_TTL_SECONDS:
+            return _locations_cache[1]
+
+        generation = _locations_generation
+        options = await self._location_options()
+        if generation == _locations_generation:
+            _locations_cache = (now, options)
+        return options
+
+    async def _location_options(self) -> tuple[LocationOption, ...]:
+        """Every location's id and name, ordered by name."""
+        result = await self.db.execute(select(Location.id, Location.name).order_by(Location.name))
+        return tuple(LocationOption(row.id, row.name) for row in result)
+
+    def _locations_changed(self) -> None:
+        """Invalidate the cached list when this session commits."""
+        self.db.sync_session.info[_LOCATIONS_WRITTEN] = True
+
     async def get_by_id(self, location_id: str) -> Location | None:
-        """Get a location by ID."""
-        result = await self.db.execute(select(Location).where(Location.id == location_id))
-        return result.scalar_one_or_none()
+        """Get a location by ID (from the identity map when already loaded)."""
+        return await self.db.get(Location, location_id)
 
     async def create(self, data: LocationCreate) -> Location:
         """Create a new location."""
@@ -33,32 +101,46 @@ class LocationService:
         )
         self.db.add(location)
         await self.db.flush()
+        self._locations_changed()
         return location
 
     async def update(self, location: Location, data: LocationUpdate) -> Location:
-        """Update an existing location."""
-        update_data = data.model_dump(exclude_unset=True)
-
-        for field, value in update_data.items():
-            setattr(location, field, value)
+        """Update an existing location (only changed fields set on data are written)."""
+        changed = {
+            field
+            for field in data.model_fields_set
+            if getattr(location, field) != getattr(data, field)
+        }
+        if not changed:
+            return location
+
+        for field in changed:
+            setattr(location, field, getattr(data, field))
 
         await self.db.flush()
+        self._locations_changed()
         return location
 
     async def delete(self, location: Location) -> None:
         """Delete a location."""
         self.db.delete(location)  # delete() is sync in SQLAlchemy 2.0
         await self.db.flush()
+        self._locations_changed()
 
     async def get_with_host_counts(self) -> list[dict]:
-        """Get all locations with their host counts."""
-        # Query locations with host counts
-        query = (
-            select(Location, func.count(Host.id).label("host_count"))
-            .outerjoin(Host, Location.id == Host.location_id)
-            .group_by(Location.id)
-            .order_by(Location.name)
+        """Get all locations with their host counts.
+
+        Each count is a correlated subquery, answered from the index that
+        leads with hosts.location_id, rather than a join that aggregates
+        every host row.
+        """
+        host_count = (
+            select(func.count())
+            .where(Host.location_id == Location.id)
+            .correlate(Location)
+            .scalar_subquery()
         )
+        query = select(Location, host_count.label("host_count")).order_by(Location.name)
 
         result = await self.db.execute(query)
         rows = result.all()
@@ -83,6 +165,7 @@ class LocationService:
                 location.name = name
                 location.network_cidr = network_cidr
                 await self.db.flush()
+                self._locations_changed()
         else:
             # Create new
             location = Location(
@@ -92,5 +175,6 @@ class LocationService:
             )
             self.db.add(location)
             await self.db.flush()
+            self._locations_changed()
 
         return location
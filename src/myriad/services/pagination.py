@@ -0,0 +1,140 @@
+"""Keyset (cursor) pagination helpers for list queries."""
+
+import base64
+import binascii
+import json
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any
+
+from sqlalchemy import ColumnElement, Select, and_, false, or_
+from sqlalchemy.orm import InstrumentedAttribute
+
+
+@dataclass(frozen=True)
+class SortKey:
+    """One column of a list ordering.
+
+    The last key of an ordering must be unique and non-null (the primary key)
+    so a cursor identifies exactly one position.
+    """
+
+    column: InstrumentedAttribute
+    descending: bool = False
+    nulls_last: bool = False
+
+    def reversed(self) -> "SortKey":
+        """The same key walked in the opposite direction."""
+        return SortKey(self.column, not self.descending, not self.nulls_last)
+
+    def order_by(self) -> ColumnElement:
+        """ORDER BY clause with explicit null placement on every dialect."""
+        expr = self.column.desc() if self.descending else self.column.asc()
+        if not self.column.nullable:
+            # Nothing to place, and a bare key matches a plain index on every dialect
+            return expr
+        return expr.nulls_last() if self.nulls_last else expr.nulls_first()
+
+    def equal_to(self, value: Any) -> ColumnElement[bool]:
+        """Rows with the same value on this key."""
+        return self.column.is_(None) if value is None else self.column == value
+
+    def after(self, value: Any) -> ColumnElement[bool]:
+        """Rows sorted strictly after value on this key."""
+        if value is None:
+            return false() if self.nulls_last else self.column.is_not(None)
+        beyond = self.column < value if self.descending else self.column > value
+        return or_(beyond, self.column.is_(None)) if self.nulls_last else beyond
+
+
+def encode_cursor(row: object, keys: tuple[SortKey, ...]) -> str:
+    """Encode a row's sort key values as an opaque URL-safe cursor."""
+    values = [getattr(row, key.column.key) for key in keys]
+    raw = json.dumps(values, default=datetime.isoformat, separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, keys: tuple[SortKey, ...]) -> list[Any]:
+    """Decode a cursor back into sort key values.
+
+    Raises:
+        ValueError: If the cursor is malformed or doesn't match the keys
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        values = json.loads(raw)
+    except (binascii.Error, UnicodeDecodeError, json.JSONDecodeError) as e:
+        raise ValueError("Invalid pagination cursor") from e
+    if not isinstance(values, list) or len(values) != len(keys):
+        raise ValueError("Invalid pagination cursor")
+
+    try:
+        return [_decode_value(key, value) for key, value in zip(keys, values, strict=True)]
+    except (TypeError, ValueError) as e:
+        raise ValueError("Invalid pagination cursor") from e
+
+
+def _decode_value(key: SortKey, value: Any) -> Any:
+    """Check one cursor value against its column's type, parsing datetimes.
+
+    Raises:
+        TypeError: If the value's type doesn't match the column
+        ValueError: If a datetime value isn't ISO formatted
+    """
+    if value is None:
+        return None
+    python_type = key.column.type.python_type
+    if python_type is datetime:
+        return datetime.fromisoformat(value)
+    # bool is an int subclass, but True is no row id
+    if not isinstance(value, python_type) or (isinstance(value, bool) and python_type is not bool):
+        raise TypeError(f"Expected {python_type.__name__} for {key.column.key}")
+    return value
+
+
+def keyset_filter(keys: tuple[SortKey, ...], values: list[Any]) -> ColumnElement[bool]:
+    """Rows sorted strictly after the position given by values."""
+    key, *rest = keys
+    value, *rest_values = values
+    if not rest:
+        return key.after(value)
+    return or_(
+        key.after(value),
+        and_(key.equal_to(value), keyset_filter(tuple(rest), rest_values)),
+    )
+
+
+def paginate(
+    query: Select,
+    keys: tuple[SortKey, ...],
+    limit: int,
+    offset: int = 0,
+    after: str | None = None,
+    before: str | None = None,
+) -> tuple[Select, bool]:
+    """Apply ordering and a page window to a query.
+
+    With a cursor the page is an index seek from that position instead of an
+    OFFSET scan. A before cursor walks the ordering backwards, so its rows
+    come back reversed; the returned flag says to flip them.
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    if before is not None:
+        reverse_keys = tuple(key.reversed() for key in keys)
+        query = query.where(keyset_filter(reverse_keys, decode_cursor(before, keys)))
+        return query.order_by(*(key.order_by() for key in reverse_keys)).limit(limit), True
+
+    if after is not None:
+        query = query.where(keyset_filter(keys, decode_cursor(after, keys)))
+    else:
+        query = query.offset(offset)
+    return query.order_by(*(key.order_by() for key in keys)).limit(limit), False
+
+
+def page_cursors(items: list, keys: tuple[SortKey, ...]) -> tuple[str | None, str | None]:
+    """Cursors for the pages before and after a page of items."""
+    if not items:
+        return None, None
+    return encode_cursor(items[0], keys), encode_cursor(items[-1], keys)
@@ -1,15 +1,16 @@
 """Proxmox service for VM synchronization."""
 
-import json
+import asyncio
 import logging
+from collections import defaultdict
 from dataclasses import dataclass
 from datetime import datetime
 
-from sqlalchemy import select
+from sqlalchemy import delete, insert, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import defer, raiseload, selectinload
 
-from myriad.config import Settings
+from myriad.config import ProxmoxCredentials, ProxmoxIntegrationConfig, Settings
 from myriad.integrations.proxmox import ProxmoxClient, ProxmoxVM
 from myriad.models import (
     Host,
@@ -17,13 +18,35 @@ from myriad.models import (
     HypervisorStatus,
     HypervisorType,
     VirtualMachine,
+    VMMacAddress,
     VMSnapshot,
     VMState,
+    VMTag,
     VMType,
 )
+from myriad.services.pagination import SortKey, paginate
 
 logger = logging.getLogger(__name__)
 
+# VM list ordering, id breaks ties for cursors
+VM_LIST_ORDER = (SortKey(VirtualMachine.name), SortKey(VirtualMachine.id))
+
+# Proxmox instances fetched at once by sync_all_proxmox
+MAX_CONCURRENT_SYNCS = 8
+
+# Per-VM snapshot requests in flight against one Proxmox API
+MAX_CONCURRENT_SNAPSHOT_FETCHES = 16
+
+
+@dataclass
+class ProxmoxInventory:
+    """Data fetched from one Proxmox instance, ready to be written."""
+
+    pve_version: str | None
+    vms: list[ProxmoxVM]
+    # Per VM, in the same order; None where the snapshot list couldn't be fetched
+    snapshots: list[list[dict] | None]
+
 
 @dataclass
 class ProxmoxSyncResult:
@@ -42,9 +65,13 @@ class ProxmoxSyncResult:
 class ProxmoxService:
     """Service for syncing VMs from Proxmox hypervisors."""
 
+    # Built per request and per sync, so skip the per-instance __dict__
+    __slots__ = ("db", "settings", "_proxmox_by_id")
+
     def __init__(self, db: AsyncSession, settings: Settings):
         self.db = db
         self.settings = settings
+        self._proxmox_by_id = {config.id: config for config in settings.integrations.proxmox}
 
     async def sync_proxmox(self, integration_id: str) -> ProxmoxSyncResult:
         """Sync VMs from a specific Proxmox integration.
@@ -55,13 +82,53 @@ class ProxmoxService:
         Returns:
             ProxmoxSyncResult with counts of changes made
         """
-        # Find the integration config
-        config = None
-        for proxmox_config in self.settings.integrations.proxmox:
-            if proxmox_config.id == integration_id:
-                config = proxmox_config
-                break
+        config, credentials = self._get_integration(integration_id)
+        timestamp = datetime.utcnow()
+
+        try:
+            inventory = await self._fetch_inventory(config, credentials)
+            return await self._apply_inventory(config, inventory, timestamp)
+        except Exception as e:
+            return await self._sync_failed(integration_id, timestamp, e)
 
+    async def sync_all_proxmox(self) -> list[ProxmoxSyncResult]:
+        """Sync from all configured Proxmox instances.
+
+        The API calls for each instance run concurrently (bounded); the fetched
+        inventories are then written one at a time, as they share this session.
+        """
+        integrations = [
+            self._get_integration(config.id) for config in self.settings.integrations.proxmox
+        ]
+        timestamp = datetime.utcnow()
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_SYNCS)
+
+        async def fetch(config, credentials) -> ProxmoxInventory | Exception:
+            async with semaphore:
+                try:
+                    return await self._fetch_inventory(config, credentials)
+                except Exception as e:
+                    return e
+
+        inventories = await asyncio.gather(*(fetch(*integration) for integration in integrations))
+
+        results = []
+        for (config, _), inventory in zip(integrations, inventories, strict=True):
+            if isinstance(inventory, Exception):
+                results.append(await self._sync_failed(config.id, timestamp, inventory))
+                continue
+            try:
+                results.append(await self._apply_inventory(config, inventory, timestamp))
+            except Exception as e:
+                results.append(await self._sync_failed(config.id, timestamp, e))
+
+        return results
+
+    def _get_integration(
+        self, integration_id: str
+    ) -> tuple[ProxmoxIntegrationConfig, ProxmoxCredentials]:
+        """Look up a Proxmox integration's config and credentials."""
+        config = self._proxmox_by_id.get(integration_id)
         if not config:
             raise ValueError(f"Proxmox integration '{integration_id}' not found")
 
@@ -75,113 +142,131 @@ class ProxmoxService:
         if not credentials:
             raise ValueError(f"Credentials '{config.credential_ref}' not found")
 
-        timestamp = datetime.utcnow()
+        return config, credentials
 
-        try:
-            async with ProxmoxClient(config, credentials) as client:
-                # Test connection
-                if not await client.test_connection():
-                    raise ConnectionError(f"Failed to connect to Proxmox at {config.base_url}")
-
-                # Get Proxmox version
-                pve_version = await client.get_version()
-
-                # Ensure hypervisor record exists
-                hypervisor = await self._ensure_hypervisor(
-                    integration_id=integration_id,
-                    name=integration_id,
-                    api_url=config.base_url,
-                    credential_ref=config.credential_ref,
-                    location_id=config.location_id,
-                    pve_version=pve_version,
-                    node_name=config.node,
-                )
-
-                # Get all VMs
-                pve_vms = await client.get_all_vms()
-                logger.info(f"Found {len(pve_vms)} VMs from Proxmox {integration_id}")
-
-                vms_created = 0
-                vms_updated = 0
-                hosts_linked = 0
-                snapshots_synced = 0
-                active_vm_ids = set()
-
-                for pve_vm in pve_vms:
-                    # Upsert VM
-                    vm, created = await self._upsert_vm(hypervisor, pve_vm)
-                    active_vm_ids.add(vm.id)
-
-                    if created:
-                        vms_created += 1
-                    else:
-                        vms_updated += 1
-
-                    # Link to hosts via MAC addresses
-                    for mac in pve_vm.mac_addresses:
-                        linked = await self._link_vm_to_host(vm, mac, config.location_id)
-                        if linked:
-                            hosts_linked += 1
-
-                    # Sync snapshots
-                    snap_count = await self._sync_snapshots(client, vm, pve_vm)
-                    snapshots_synced += snap_count
-
-                # Clean up stale VMs
-                vms_removed = await self._cleanup_stale_vms(hypervisor.id, active_vm_ids)
-
-                # Update hypervisor status
-                hypervisor.status = HypervisorStatus.ONLINE
-                hypervisor.last_sync = timestamp
-                hypervisor.last_error = None
-
-                await self.db.commit()
-
-                return ProxmoxSyncResult(
-                    hypervisor_id=integration_id,
-                    vms_created=vms_created,
-                    vms_updated=vms_updated,
-                    vms_removed=vms_removed,
-                    hosts_linked=hosts_linked,
-                    snapshots_synced=snapshots_synced,
-                    timestamp=timestamp,
-                )
+    async def _fetch_inventory(
+        self, config: ProxmoxIntegrationConfig, credentials: ProxmoxCredentials
+    ) -> ProxmoxInventory:
+        """Fetch everything a sync needs from the Proxmox API, without touching the DB."""
+        async with ProxmoxClient(config, credentials) as client:
+            # Test connection
+            if not await client.test_connection():
+                raise ConnectionError(f"Failed to connect to Proxmox at {config.base_url}")
 
-        except Exception as e:
-            logger.error(f"Proxmox sync failed for {integration_id}: {e}")
-
-            # Update hypervisor status to error
-            hypervisor = await self._get_hypervisor(integration_id)
-            if hypervisor:
-                hypervisor.status = HypervisorStatus.ERROR
-                hypervisor.last_error = str(e)
-                await self.db.commit()
-
-            return ProxmoxSyncResult(
-                hypervisor_id=integration_id,
-                vms_created=0,
-                vms_updated=0,
-                vms_removed=0,
-                hosts_linked=0,
-                snapshots_synced=0,
-                timestamp=timestamp,
-                error=str(e),
-            )
+            # Get Proxmox version
+            pve_version = await client.get_version()
 
-    async def sync_all_proxmox(self) -> list[ProxmoxSyncResult]:
-        """Sync from all configured Proxmox instances."""
-        results = []
+            # Get all VMs
+            pve_vms = await client.get_all_vms()
+            logger.info(f"Found {len(pve_vms)} VMs from Proxmox {config.id}")
 
-        for config in self.settings.integrations.proxmox:
-            result = await self.sync_proxmox(config.id)
-            results.append(result)
+            # Fetch snapshots concurrently (bounded to spare the API)
+            semaphore = asyncio.Semaphore(MAX_CONCURRENT_SNAPSHOT_FETCHES)
 
-        return results
+            async def fetch_snapshots(pve_vm: ProxmoxVM) -> list[dict] | None:
+                async with semaphore:
+                    try:
+                        return await client.get_vm_snapshots(
+                            pve_vm.node, pve_vm.vmid, pve_vm.vm_type
+                        )
+                    except Exception as e:
+                        logger.debug(f"Failed to get snapshots for VM {pve_vm.name}: {e}")
+                        return None
+
+            snapshots = await asyncio.gather(*(fetch_snapshots(pve_vm) for pve_vm in pve_vms))
+
+        return ProxmoxInventory(pve_version=pve_version, vms=pve_vms, snapshots=list(snapshots))
+
+    async def _apply_inventory(
+        self,
+        config: ProxmoxIntegrationConfig,
+        inventory: ProxmoxInventory,
+        timestamp: datetime,
+    ) -> ProxmoxSyncResult:
+        """Write a fetched Proxmox inventory to the database."""
+        # Ensure hypervisor record exists
+        hypervisor = await self._ensure_hypervisor(
+            integration_id=config.id,
+            name=config.id,
+            api_url=config.base_url,
+            credential_ref=config.credential_ref,
+            location_id=config.location_id,
+            pve_version=inventory.pve_version,
+            node_name=config.node,
+        )
+
+        vms_created = 0
+        vms_updated = 0
+        active_vm_ids = set()
+        fetched_snapshots = []
+
+        # One write-time timestamp for every VM and snapshot change below
+        now = datetime.utcnow()
+        upserted = await self._upsert_vms(hypervisor, inventory.vms, now=now)
+        for (vm, created), snapshots in zip(upserted, inventory.snapshots, strict=True):
+            active_vm_ids.add(vm.id)
+
+            if created:
+                vms_created += 1
+            else:
+                vms_updated += 1
+
+            if snapshots:
+                fetched_snapshots.append((vm, snapshots))
+
+        # Sync snapshots
+        snapshots_synced = await self._sync_snapshots(fetched_snapshots, now=now)
+
+        # Link to hosts via MAC addresses
+        hosts_linked = await self._link_vms_to_hosts(hypervisor.id)
+
+        # Clean up stale VMs
+        vms_removed = await self._cleanup_stale_vms(hypervisor.id, active_vm_ids)
+
+        # Update hypervisor status
+        hypervisor.status = HypervisorStatus.ONLINE
+        hypervisor.last_sync = timestamp
+        hypervisor.last_error = None
+
+        await self.db.commit()
+
+        return ProxmoxSyncResult(
+            hypervisor_id=config.id,
+            vms_created=vms_created,
+            vms_updated=vms_updated,
+            vms_removed=vms_removed,
+            hosts_linked=hosts_linked,
+            snapshots_synced=snapshots_synced,
+            timestamp=timestamp,
+        )
+
+    async def _sync_failed(
+        self, integration_id: str, timestamp: datetime, error: Exception
+    ) -> ProxmoxSyncResult:
+        """Record a failed sync on the hypervisor and build its result."""
+        logger.error(f"Proxmox sync failed for {integration_id}: {error}")
+
+        # Update hypervisor status to error
+        hypervisor = await self._get_hypervisor(integration_id)
+        if hypervisor:
+            hypervisor.status = HypervisorStatus.ERROR
+            hypervisor.last_error = str(error)
+            await self.db.commit()
+
+        return ProxmoxSyncResult(
+            hypervisor_id=integration_id,
+            vms_created=0,
+            vms_updated=0,
+            vms_removed=0,
+            hosts_linked=0,
+            snapshots_synced=0,
+            timestamp=timestamp,
+            error=str(error),
+        )
 
     async def _get_hypervisor(self, hypervisor_id: str) -> Hypervisor | None:
-        """Get hypervisor by ID."""
-        result = await self.db.execute(select(Hypervisor).where(Hypervisor.id == hypervisor_id))
-        return result.scalar_one_or_none()
+        """Get hypervisor by ID (from the identity map when already loaded)."""
+        return await self.db.get(Hypervisor, hypervisor_id)
 
     async def _ensure_hypervisor(
         self,
@@ -219,181 +304,249 @@ class ProxmoxService:
             )
             self.db.add(hypervisor)
 
-        await self.db.flush()
+        # Written by the next statement's autoflush or the commit
         return hypervisor
 
     async def _upsert_vm(
         self, hypervisor: Hypervisor, pve_vm: ProxmoxVM
     ) -> tuple[VirtualMachine, bool]:
-        """Create or update a VM record.
+        """Create or update a single VM record.
 
         Returns (vm, created) where created is True if a new VM was created.
         """
-        # Look up by UUID (which we generate from node+vmid)
-        uuid = pve_vm.uuid
-        result = await self.db.execute(select(VirtualMachine).where(VirtualMachine.uuid == uuid))
-        vm = result.scalar_one_or_none()
-
-        # Map Proxmox status to VMState
-        state = self._map_status_to_state(pve_vm.status)
-        vm_type = VMType.LXC if pve_vm.vm_type == "lxc" else VMType.QEMU
-
-        # Serialize MAC addresses as JSON
-        mac_json = json.dumps(pve_vm.mac_addresses) if pve_vm.mac_addresses else None
-
-        # Calculate memory in MB
-        memory_mb = None
-        if pve_vm.maxmem:
-            memory_mb = pve_vm.maxmem // (1024 * 1024)
-
-        # Calculate disk in GB
-        disk_gb = None
-        if pve_vm.maxdisk:
-            disk_gb = pve_vm.maxdisk / (1024 * 1024 * 1024)
+        [upserted] = await self._upsert_vms(hypervisor, [pve_vm])
+        return upserted
 
-        if vm:
-            # Update existing
-            old_state = vm.state
-            vm.name = pve_vm.name
-            vm.vmid = pve_vm.vmid
-            vm.vm_type = vm_type
-            vm.state = state
-            vm.vcpus = None  # Proxmox doesn't expose this in cluster/resources
-            vm.memory_mb = memory_mb
-            vm.disk_gb = disk_gb
-            vm.mac_addresses = mac_json
-            vm.uptime_seconds = pve_vm.uptime
-            vm.tags = pve_vm.tags
-
-            # Track state changes
-            if old_state != state:
-                vm.last_state_change = datetime.utcnow()
-
-            await self.db.flush()
-            return vm, False
-
-        # Create new
-        vm = VirtualMachine(
-            uuid=uuid,
-            name=pve_vm.name,
-            vmid=pve_vm.vmid,
-            vm_type=vm_type,
-            hypervisor_id=hypervisor.id,
-            state=state,
-            memory_mb=memory_mb,
-            disk_gb=disk_gb,
-            mac_addresses=mac_json,
-            uptime_seconds=pve_vm.uptime,
-            tags=pve_vm.tags,
-        )
-        self.db.add(vm)
-        await self.db.flush()
-        return vm, True
-
-    async def _link_vm_to_host(
-        self, vm: VirtualMachine, mac_address: str, location_id: str | None
-    ) -> bool:
-        """Link a VM to a Host by MAC address.
-
-        Returns True if a new link was created.
+    async def _upsert_vms(
+        self,
+        hypervisor: Hypervisor,
+        pve_vms: list[ProxmoxVM],
+        *,
+        now: datetime | None = None,
+    ) -> list[tuple[VirtualMachine, bool]]:
+        """Create or update VM records for a fetched inventory.
+
+        Existing VMs are looked up in one query and every change is written
+        in one flush, instead of a SELECT and a flush per VM. State changes
+        and child-row changes are all stamped with now (default: the current
+        UTC time).
+
+        Returns (vm, created) pairs in the order of pve_vms.
         """
-        # Normalize MAC
-        mac = mac_address.lower()
-
-        # Find host with this MAC
-        result = await self.db.execute(select(Host).where(Host.mac_address == mac))
-        host = result.scalar_one_or_none()
-
-        if not host:
-            return False
+        now = now or datetime.utcnow()
+        # Look up by UUID (which we generate from node+vmid)
+        result = await self.db.execute(
+            select(VirtualMachine)
+            .where(VirtualMachine.uuid.in_({v.uuid for v in pve_vms}))
+            .options(
+                selectinload(VirtualMachine.macs),
+                selectinload(VirtualMachine.tag_entries),
+                *self._strict_loading(),
+            )
+        )
+        vms_by_uuid = {vm.uuid: vm for vm in result.scalars()}
+
+        upserted = []
+        for pve_vm in pve_vms:
+            vm = vms_by_uuid.get(pve_vm.uuid)
+            if vm:
+                self._update_vm(vm, pve_vm, now)
+                upserted.append((vm, False))
+                continue
 
-        # Check if already linked
-        if vm.host_id == host.id:
-            return False
+            vm = VirtualMachine(
+                uuid=pve_vm.uuid,
+                name=pve_vm.name,
+                vmid=pve_vm.vmid,
+                vm_type=self._map_vm_type(pve_vm.vm_type),
+                hypervisor_id=hypervisor.id,
+                state=self._map_status_to_state(pve_vm.status),
+                memory_mb=self._memory_mb(pve_vm),
+                disk_gb=self._disk_gb(pve_vm),
+                mac_addresses=pve_vm.mac_addresses,
+                uptime_seconds=pve_vm.uptime,
+                tags=pve_vm.tag_list,
+            )
+            self.db.add(vm)
+            vms_by_uuid[vm.uuid] = vm
+            upserted.append((vm, True))
 
-        # Link the VM to the host
-        vm.host_id = host.id
         await self.db.flush()
+        return upserted
 
-        logger.debug(f"Linked VM {vm.name} to host {host.effective_name} via MAC {mac}")
-        return True
+    def _update_vm(self, vm: VirtualMachine, pve_vm: ProxmoxVM, now: datetime) -> None:
+        """Copy fetched Proxmox fields onto an existing VM record."""
+        state = self._map_status_to_state(pve_vm.status)
+        old_state = vm.state
+        vm.name = pve_vm.name
+        vm.vmid = pve_vm.vmid
+        vm.vm_type = self._map_vm_type(pve_vm.vm_type)
+        vm.state = state
+        vm.vcpus = None  # Proxmox doesn't expose this in cluster/resources
+        vm.memory_mb = self._memory_mb(pve_vm)
+        vm.disk_gb = self._disk_gb(pve_vm)
+        vm.uptime_seconds = pve_vm.uptime
+
+        # Only rewrite the child rows when something actually changed. They
+        # have no timestamps, so bump the VM's for detail-page Last-Modified.
+        if list(vm.mac_addresses) != pve_vm.mac_addresses:
+            vm.mac_addresses = pve_vm.mac_addresses
+            vm.updated_at = now
+        tags = pve_vm.tag_list
+        if set(vm.tags) != set(tags):
+            vm.tags = tags
+            vm.updated_at = now
+
+        # Track state changes
+        if old_state != state:
+            vm.last_state_change = now
+
+    async def _link_vms_to_hosts(self, hypervisor_id: str) -> int:
+        """Link a hypervisor's VMs to Hosts by MAC address.
+
+        A single UPDATE joins vm_mac_addresses to hosts, rather than a host
+        lookup per VM interface. The first matching interface wins, and VMs
+        with no matching host keep their current link.
+
+        Returns the number of VMs whose link changed.
+        """
+        matched_host_id = (
+            select(Host.id)
+            .join(VMMacAddress, VMMacAddress.mac_address == Host.mac_address)
+            .where(VMMacAddress.vm_id == VirtualMachine.id)
+            .order_by(VMMacAddress.id)
+            .limit(1)
+            .correlate(VirtualMachine)
+            .scalar_subquery()
+        )
+        result = await self.db.execute(
+            update(VirtualMachine)
+            .where(
+                VirtualMachine.hypervisor_id == hypervisor_id,
+                matched_host_id.is_not(None),
+                VirtualMachine.host_id.is_distinct_from(matched_host_id),
+            )
+            .values(host_id=matched_host_id)
+            .execution_options(synchronize_session="fetch")
+        )
+        return result.rowcount
 
     async def _sync_snapshots(
-        self, client: ProxmoxClient, vm: VirtualMachine, pve_vm: ProxmoxVM
+        self,
+        fetched: list[tuple[VirtualMachine, list[dict]]],
+        *,
+        now: datetime | None = None,
     ) -> int:
-        """Sync snapshots for a VM.
+        """Sync VMs' snapshots from the lists fetched from Proxmox.
+
+        Existing snapshots for every VM are read in one query, new ones go into
+        one bulk INSERT, and the updates and removals are left pending for the
+        caller's next flush (the host-linking UPDATE autoflushes them).
 
         Returns the number of snapshots synced.
         """
-        try:
-            snapshots = await client.get_vm_snapshots(pve_vm.node, pve_vm.vmid, pve_vm.vm_type)
-        except Exception as e:
-            logger.debug(f"Failed to get snapshots for VM {vm.name}: {e}")
-            return 0
-
-        if not snapshots:
+        if not fetched:
             return 0
+        now = now or datetime.utcnow()
 
-        synced = 0
-
-        # Get existing snapshots for this VM
-        result = await self.db.execute(select(VMSnapshot).where(VMSnapshot.vm_id == vm.id))
-        existing_by_name = {s.name: s for s in result.scalars().all()}
-
-        seen_names = set()
-
-        for snap_data in snapshots:
-            name = snap_data.get("name")
-            if not name:
-                continue
-
-            seen_names.add(name)
-
-            if name in existing_by_name:
-                # Update existing
-                existing = existing_by_name[name]
-                existing.description = snap_data.get("description")
-                existing.parent_snapshot_name = snap_data.get("parent")
-            else:
-                # Create new
-                snapshot = VMSnapshot(
-                    name=name,
-                    vm_id=vm.id,
-                    description=snap_data.get("description"),
-                    parent_snapshot_name=snap_data.get("parent"),
-                )
-                self.db.add(snapshot)
-                synced += 1
-
-        # Remove snapshots that no longer exist
-        for name, snapshot in existing_by_name.items():
-            if name not in seen_names:
-                await self.db.delete(snapshot)
-
-        await self.db.flush()
-        return synced
+        # Get existing snapshots for all of these VMs in one query
+        result = await self.db.execute(
+            select(VMSnapshot)
+            .where(VMSnapshot.vm_id.in_([vm.id for vm, _ in fetched]))
+            .options(*self._strict_loading())
+        )
+        existing_by_vm: dict[int, dict[str, VMSnapshot]] = defaultdict(dict)
+        for snapshot in result.scalars():
+            existing_by_vm[snapshot.vm_id][snapshot.name] = snapshot
+
+        new_rows = []
+
+        for vm, snapshots in fetched:
+            existing_by_name = existing_by_vm[vm.id]
+            seen_names = set()
+
+            for snap_data in snapshots:
+                name = snap_data.get("name")
+                if not name:
+                    continue
+
+                seen_names.add(name)
+
+                if name in existing_by_name:
+                    # Update existing
+                    existing = existing_by_name[name]
+                    existing.description = snap_data.get("description")
+                    existing.parent_snapshot_name = snap_data.get("parent")
+                else:
+                    new_rows.append(
+                        {
+                            "name": name,
+                            "vm_id": vm.id,
+                            "description": snap_data.get("description"),
+                            "parent_snapshot_name": snap_data.get("parent"),
+                        }
+                    )
+
+            # Remove snapshots that no longer exist; a deleted row leaves no
+            # timestamp behind, so bump the VM's for detail-page Last-Modified
+            for name, snapshot in existing_by_name.items():
+                if name not in seen_names:
+                    await self.db.delete(snapshot)
+                    vm.updated_at = now
+
+        # Create new snapshots with one bulk INSERT rather than an ORM add per row
+        if new_rows:
+            await self.db.execute(insert(VMSnapshot), new_rows)
+
+        return len(new_rows)
 
     async def _cleanup_stale_vms(self, hypervisor_id: str, active_vm_ids: set[int]) -> int:
         """Remove VMs that are no longer present on the hypervisor.
 
+        Bulk DELETEs remove the stale VMs and their child rows without loading
+        them. The children are deleted explicitly because SQLite doesn't
+        enforce ON DELETE CASCADE here.
+
         Returns the number of VMs removed.
         """
+        stale_vm_ids = select(VirtualMachine.id).where(
+            VirtualMachine.hypervisor_id == hypervisor_id,
+            VirtualMachine.id.not_in(active_vm_ids),
+        )
+        for child in (VMSnapshot, VMMacAddress, VMTag):
+            await self.db.execute(delete(child).where(child.vm_id.in_(stale_vm_ids)))
+
         result = await self.db.execute(
-            select(VirtualMachine)
-            .where(VirtualMachine.hypervisor_id == hypervisor_id)
-            .options(selectinload(VirtualMachine.snapshots))
+            delete(VirtualMachine)
+            .where(VirtualMachine.id.in_(stale_vm_ids))
+            .returning(VirtualMachine.name)
         )
-        all_vms = list(result.scalars().all())
+        removed = result.scalars().all()
+        for name in removed:
+            logger.info(f"Removing stale VM: {name} (no longer on hypervisor)")
 
-        removed = 0
-        for vm in all_vms:
-            if vm.id not in active_vm_ids:
-                logger.info(f"Removing stale VM: {vm.name} (no longer on hypervisor)")
-                await self.db.delete(vm)
-                removed += 1
+        return len(removed)
 
-        await self.db.flush()
-        return removed
+    def _strict_loading(self) -> tuple:
+        """In debug mode, make unloaded relationships raise instead of lazy loading."""
+        if self.settings.server.debug:
+            return (raiseload("*"),)
+        return ()
+
+    @staticmethod
+    def _map_vm_type(vm_type: str) -> VMType:
+        """Map Proxmox resource type to VMType enum."""
+        return VMType.LXC if vm_type == "lxc" else VMType.QEMU
+
+    @staticmethod
+    def _memory_mb(pve_vm: ProxmoxVM) -> int | None:
+        """Configured memory in MB."""
+        return pve_vm.maxmem // (1024 * 1024) if pve_vm.maxmem else None
+
+    @staticmethod
+    def _disk_gb(pve_vm: ProxmoxVM) -> float | None:
+        """Configured disk size in GB."""
+        return pve_vm.maxdisk / (1024 * 1024 * 1024) if pve_vm.maxdisk else None
 
     @staticmethod
     def _map_status_to_state(status: str) -> VMState:
@@ -413,13 +566,27 @@ class ProxmoxService:
         vm_type: VMType | None = None,
         limit: int = 100,
         offset: int = 0,
+        after: str | None = None,
+        before: str | None = None,
     ) -> tuple[list[VirtualMachine], int]:
-        """Get all VMs with optional filtering."""
+        """Get all VMs with optional filtering.
+
+        Pages are selected by an after/before cursor (see VM_LIST_ORDER) when
+        given, otherwise by offset. Descriptions are deferred, as list views
+        don't show them.
+
+        Raises:
+            ValueError: If a cursor is malformed
+        """
         from sqlalchemy import func
 
         query = select(VirtualMachine).options(
+            defer(VirtualMachine.description),
             selectinload(VirtualMachine.hypervisor),
             selectinload(VirtualMachine.host),
+            selectinload(VirtualMachine.macs),
+            selectinload(VirtualMachine.tag_entries),
+            *self._strict_loading(),
         )
 
         # Build filters
@@ -443,11 +610,12 @@ class ProxmoxService:
         total = total_result.scalar_one()
 
         # Get paginated results
-        query = query.order_by(VirtualMachine.name)
-        query = query.limit(limit).offset(offset)
+        query, backwards = paginate(query, VM_LIST_ORDER, limit, offset, after, before)
 
         result = await self.db.execute(query)
         vms = list(result.scalars().all())
+        if backwards:
+            vms.reverse()
 
         return vms, total
 
@@ -460,6 +628,9 @@ class ProxmoxService:
                 selectinload(VirtualMachine.hypervisor),
                 selectinload(VirtualMachine.host),
                 selectinload(VirtualMachine.snapshots),
+                selectinload(VirtualMachine.macs),
+                selectinload(VirtualMachine.tag_entries),
+                *self._strict_loading(),
             )
         )
         return result.scalar_one_or_none()
@@ -470,26 +641,18 @@ class ProxmoxService:
         return list(result.scalars().all())
 
     async def get_vm_stats(self) -> dict:
-        """Get VM statistics."""
+        """Get VM statistics (one aggregate query, using FILTER for each count)."""
         from sqlalchemy import func
 
-        total_result = await self.db.execute(select(func.count(VirtualMachine.id)))
-        total = total_result.scalar_one()
-
-        running_result = await self.db.execute(
-            select(func.count(VirtualMachine.id)).where(VirtualMachine.state == VMState.RUNNING)
-        )
-        running = running_result.scalar_one()
-
-        qemu_result = await self.db.execute(
-            select(func.count(VirtualMachine.id)).where(VirtualMachine.vm_type == VMType.QEMU)
-        )
-        qemu = qemu_result.scalar_one()
-
-        lxc_result = await self.db.execute(
-            select(func.count(VirtualMachine.id)).where(VirtualMachine.vm_type == VMType.LXC)
+        result = await self.db.execute(
+            select(
+                func.count(VirtualMachine.id),
+                func.count(VirtualMachine.id).filter(VirtualMachine.state == VMState.RUNNING),
+                func.count(VirtualMachine.id).filter(VirtualMachine.vm_type == VMType.QEMU),
+                func.count(VirtualMachine.id).filter(VirtualMachine.vm_type == VMType.LXC),
+            )
         )
-        lxc = lxc_result.scalar_one()
+        total, running, qemu, lxc = result.one()
 
         return {
             "total": total,
@@ -1,18 +1,22 @@
 """Sync service for integrating with external sources."""
 
+import asyncio
 import logging
 from datetime import datetime
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from myriad.config import Settings
-from myriad.integrations.opnsense import OPNsenseClient
+from myriad.config import OPNsenseCredentials, OPNsenseIntegrationConfig, Settings
+from myriad.integrations.opnsense import DHCPLease, OPNsenseClient
 from myriad.models import DiscoverySource
 from myriad.schemas import HostSyncResult
 from myriad.services.host_service import HostService
 
 logger = logging.getLogger(__name__)
 
+# OPNsense instances fetched at once by sync_all_opnsense
+MAX_CONCURRENT_SYNCS = 8
+
 
 class SyncService:
     """Service for syncing hosts from external sources."""
@@ -20,6 +24,7 @@ class SyncService:
     def __init__(self, db: AsyncSession, settings: Settings):
         self.db = db
         self.settings = settings
+        self._opnsense_by_id = {config.id: config for config in settings.integrations.opnsense}
         self.host_service = HostService(db)
 
     async def sync_opnsense(self, integration_id: str) -> HostSyncResult:
@@ -31,13 +36,55 @@ class SyncService:
         Returns:
             HostSyncResult with counts of created and updated hosts
         """
-        # Find the integration config
-        config = None
-        for opnsense_config in self.settings.integrations.opnsense:
-            if opnsense_config.id == integration_id:
-                config = opnsense_config
-                break
+        config, credentials = self._get_integration(integration_id)
+        hosts = await self._fetch_hosts(config, credentials)
+        return await self._apply_hosts(config, hosts)
+
+    async def sync_all_opnsense(self) -> list[HostSyncResult]:
+        """Sync from all configured OPNsense instances.
+
+        The API calls for each instance run concurrently (bounded); the hosts are
+        then written one instance at a time, as they share this session.
+        """
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_SYNCS)
+
+        async def fetch(config: OPNsenseIntegrationConfig) -> list[DHCPLease] | Exception:
+            async with semaphore:
+                try:
+                    _, credentials = self._get_integration(config.id)
+                    return await self._fetch_hosts(config, credentials)
+                except Exception as e:
+                    return e
+
+        configs = self.settings.integrations.opnsense
+        fetched = await asyncio.gather(*(fetch(config) for config in configs))
+
+        # One timestamp for the whole run, however long the writes take
+        now = datetime.utcnow()
+        results = []
+        for config, hosts in zip(configs, fetched, strict=True):
+            try:
+                if isinstance(hosts, Exception):
+                    raise hosts
+                results.append(await self._apply_hosts(config, hosts, now))
+            except Exception as e:
+                logger.error(f"Failed to sync from OPNsense {config.id}: {e}")
+                results.append(
+                    HostSyncResult(
+                        created=0,
+                        updated=0,
+                        source=f"opnsense:{config.id}",
+                        timestamp=now,
+                    )
+                )
+
+        return results
 
+    def _get_integration(
+        self, integration_id: str
+    ) -> tuple[OPNsenseIntegrationConfig, OPNsenseCredentials]:
+        """Look up an OPNsense integration's config and credentials."""
+        config = self._opnsense_by_id.get(integration_id)
         if not config:
             raise ValueError(f"OPNsense integration '{integration_id}' not found")
 
@@ -51,9 +98,12 @@ class SyncService:
         if not credentials:
             raise ValueError(f"Credentials '{config.credential_ref}' not found")
 
-        created = 0
-        updated = 0
+        return config, credentials
 
+    async def _fetch_hosts(
+        self, config: OPNsenseIntegrationConfig, credentials: OPNsenseCredentials
+    ) -> list[DHCPLease]:
+        """Fetch leases and static mappings from the OPNsense API."""
         async with OPNsenseClient(config, credentials) as client:
             # Test connection first
             if not await client.test_connection():
@@ -61,49 +111,36 @@ class SyncService:
 
             # Get all hosts (leases + static mappings)
             hosts = await client.get_all_hosts()
-            logger.info(f"Found {len(hosts)} hosts from OPNsense {integration_id}")
-
-            for lease in hosts:
-                host, was_created = await self.host_service.upsert_from_discovery(
-                    mac_address=lease.mac_address,
-                    ip_address=lease.ip_address,
-                    hostname=lease.hostname,
-                    source=DiscoverySource.OPNSENSE_DHCP,
-                    is_static=lease.is_static,
-                    lease_expires=lease.ends,
-                    location_id=config.location_id,
-                )
-
-                if was_created:
-                    created += 1
-                    logger.debug(f"Created host: {host.mac_address} ({host.hostname})")
-                else:
-                    updated += 1
+            logger.info(f"Found {len(hosts)} hosts from OPNsense {config.id}")
+            return hosts
+
+    async def _apply_hosts(
+        self,
+        config: OPNsenseIntegrationConfig,
+        hosts: list[DHCPLease],
+        now: datetime | None = None,
+    ) -> HostSyncResult:
+        """Write fetched OPNsense hosts to the database, stamped with now."""
+        now = now or datetime.utcnow()
+        created, updated = await self.host_service.bulk_upsert_from_discovery(
+            [
+                {
+                    "mac_address": lease.mac_address,
+                    "ip_address": lease.ip_address,
+                    "hostname": lease.hostname,
+                    "is_static": lease.is_static,
+                    "lease_expires": lease.ends,
+                }
+                for lease in hosts
+            ],
+            source=DiscoverySource.OPNSENSE_DHCP,
+            location_id=config.location_id,
+            now=now,
+        )
 
         return HostSyncResult(
             created=created,
             updated=updated,
-            source=f"opnsense:{integration_id}",
-            timestamp=datetime.utcnow(),
+            source=f"opnsense:{config.id}",
+            timestamp=now,
         )
-
-    async def sync_all_opnsense(self) -> list[HostSyncResult]:
-        """Sync from all configured OPNsense instances."""
-        results = []
-
-        for config in self.settings.integrations.opnsense:
-            try:
-                result = await self.sync_opnsense(config.id)
-                results.append(result)
-            except Exception as e:
-                logger.error(f"Failed to sync from OPNsense {config.id}: {e}")
-                results.append(
-                    HostSyncResult(
-                        created=0,
-                        updated=0,
-                        source=f"opnsense:{config.id}",
-                        timestamp=datetime.utcnow(),
-                    )
-                )
-
-        return results
@@ -1,10 +1,13 @@
 """Pytest configuration and fixtures."""
 
-import asyncio
-from collections.abc import AsyncGenerator
+from collections.abc import AsyncGenerator, Callable, Iterator
+from contextlib import AbstractContextManager, contextmanager
+from typing import Any
 
 import pytest
+from fastapi import FastAPI
 from httpx import ASGITransport, AsyncClient
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 
 from myriad.core.database import Base
@@ -14,14 +17,6 @@ from myriad.main import create_app
 TEST_DATABASE_URL = "sqlite+aiosqlite:///:memory:"
 
 
-@pytest.fixture(scope="session")
-def event_loop():
-    """Create an event loop for the test session."""
-    loop = asyncio.get_event_loop_policy().new_event_loop()
-    yield loop
-    loop.close()
-
-
 @pytest.fixture(scope="session")
 async def test_engine():
     """Create a test database engine."""
@@ -43,18 +38,22 @@ async def test_engine():
     await engine.dispose()
 
 
-@pytest.fixture
-async def db(test_engine) -> AsyncGenerator[AsyncSession, None]:
-    """Get a test database session.
-
-    Each test gets a fresh session that is rolled back after the test.
-    """
-    session_factory = async_sessionmaker(
+@pytest.fixture(scope="session")
+def session_factory(test_engine) -> async_sessionmaker[AsyncSession]:
+    """Session factory for the test engine, built once per test run."""
+    return async_sessionmaker(
         test_engine,
         class_=AsyncSession,
         expire_on_commit=False,
     )
 
+
+@pytest.fixture
+async def db(session_factory) -> AsyncGenerator[AsyncSession, None]:
+    """Get a test database session.
+
+    Each test gets a fresh session that is rolled back after the test.
+    """
     async with session_factory() as session:
         yield session
         # Rollback any changes made during the test
@@ -62,33 +61,66 @@ async def db(test_engine) -> AsyncGenerator[AsyncSession, None]:
 
 
 @pytest.fixture
-async def db_with_commit(test_engine) -> AsyncGenerator[AsyncSession, None]:
+async def db_with_commit(session_factory) -> AsyncGenerator[AsyncSession, None]:
     """Get a test database session that commits changes.
 
     Use this when you need changes to persist across multiple operations
     in a single test (e.g., testing queries after inserts).
     """
-    session_factory = async_sessionmaker(
-        test_engine,
-        class_=AsyncSession,
-        expire_on_commit=False,
-    )
-
     async with session_factory() as session:
         yield session
         await session.commit()
 
 
+class ExecutedStatements(list[str]):
+    """SQL run on the test engine, in order, with each one's parameters alongside."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.parameters: list[Any] = []
+
+
 @pytest.fixture
-async def client(test_engine) -> AsyncGenerator[AsyncClient, None]:
+def count_statements(test_engine) -> Callable[[], AbstractContextManager[ExecutedStatements]]:
+    """Record the statements a block runs on the test engine.
+
+    Usage: ``with count_statements() as statements: ...``
+    """
+
+    @contextmanager
+    def recorder() -> Iterator[ExecutedStatements]:
+        statements = ExecutedStatements()
+
+        def record(conn, cursor, statement, parameters, context, executemany) -> None:
+            statements.append(statement)
+            statements.parameters.append(parameters)
+
+        event.listen(test_engine.sync_engine, "before_cursor_execute", record)
+        try:
+            yield statements
+        finally:
+            event.remove(test_engine.sync_engine, "before_cursor_execute", record)
+
+    return recorder
+
+
+@pytest.fixture(scope="session")
+def app() -> FastAPI:
+    """The FastAPI app, built once per test run.
+
+    Tests that change app.state or dependency_overrides must undo it.
+    """
+    return create_app()
+
+
+@pytest.fixture
+async def client(app: FastAPI, test_engine) -> AsyncGenerator[AsyncClient, None]:
     """Get an async test client for the FastAPI app.
 
     Note: This requires proper app setup with dependency overrides
     for the database session. For now, this is a placeholder.
     """
     # TODO: Set up proper dependency overrides for the app
-    app = create_app()
-
     async with AsyncClient(
         transport=ASGITransport(app=app),
         base_url="http://test",
@@ -0,0 +1,142 @@
+"""Tests for conditional GET handling."""
+
+from datetime import UTC, datetime
+from types import SimpleNamespace
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import PlainTextResponse
+from starlette.routing import Route
+
+from myriad.core.caching import (
+    CACHE_REVALIDATE,
+    ConditionalGetMiddleware,
+    etag_matches,
+    http_date,
+    latest_update,
+    not_modified,
+    not_modified_since,
+    timestamp_etag,
+)
+
+
+async def cacheable(request):
+    return PlainTextResponse("hosts table", headers={"Cache-Control": CACHE_REVALIDATE})
+
+
+async def uncached(request):
+    return PlainTextResponse("dashboard")
+
+
+@pytest.fixture
+async def client():
+    app = Starlette(routes=[Route("/cacheable", cacheable), Route("/uncached", uncached)])
+    app.add_middleware(ConditionalGetMiddleware)
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        yield client
+
+
+class TestConditionalGet:
+    """Tests for ConditionalGetMiddleware."""
+
+    @pytest.mark.asyncio
+    async def test_matching_etag_returns_not_modified(self, client: AsyncClient):
+        """A repeated request with the returned ETag gets an empty 304."""
+        first = await client.get("/cacheable")
+        etag = first.headers["etag"]
+
+        second = await client.get("/cacheable", headers={"If-None-Match": etag})
+
+        assert first.status_code == 200
+        assert first.text == "hosts table"
+        assert second.status_code == 304
+        assert second.content == b""
+        assert second.headers["etag"] == etag
+        assert second.headers["cache-control"] == CACHE_REVALIDATE
+
+    @pytest.mark.asyncio
+    async def test_stale_etag_returns_body(self, client: AsyncClient):
+        """A different ETag gets the full response."""
+        response = await client.get("/cacheable", headers={"If-None-Match": '"stale"'})
+
+        assert response.status_code == 200
+        assert response.text == "hosts table"
+
+    @pytest.mark.asyncio
+    async def test_endpoints_without_cache_control_are_untouched(self, client: AsyncClient):
+        """Only endpoints that opt in get an ETag."""
+        response = await client.get("/uncached")
+
+        assert response.status_code == 200
+        assert "etag" not in response.headers
+
+    def test_etag_matches_lists_and_weak_tags(self):
+        """If-None-Match may list several tags, weak or strong, or '*'."""
+        assert etag_matches('"b"', '"a", W/"b"')
+        assert etag_matches('"b"', "*")
+        assert not etag_matches('"b"', '"a"')
+
+
+def make_request(**headers: str) -> Request:
+    """Request carrying only the given headers."""
+    raw = [(name.replace("_", "-").encode(), value.encode()) for name, value in headers.items()]
+    return Request({"type": "http", "method": "GET", "headers": raw})
+
+
+class TestLastModified:
+    """Tests for Last-Modified validation of detail pages."""
+
+    def test_latest_update_skips_missing_rows(self):
+        """The newest related row dates the page; naive timestamps are UTC."""
+        older = SimpleNamespace(updated_at=datetime(2026, 1, 1))
+        newer = SimpleNamespace(updated_at=datetime(2026, 1, 2, 8, 30))
+
+        assert latest_update(older, None, newer) == datetime(2026, 1, 2, 8, 30, tzinfo=UTC)
+        assert http_date(newer.updated_at) == "Fri, 02 Jan 2026 08:30:00 GMT"
+
+    def test_not_modified_since_compares_whole_seconds(self):
+        """A page changed within the header's second is still not modified."""
+        modified = datetime(2026, 1, 2, 8, 30, 0, 500000)
+        request = make_request(if_modified_since="Fri, 02 Jan 2026 08:30:00 GMT")
+
+        assert not_modified_since(request, modified)
+        assert not not_modified_since(request, datetime(2026, 1, 2, 8, 30, 1))
+
+    def test_not_modified_since_ignores_bad_or_superseded_headers(self):
+        """Unparseable dates and requests with If-None-Match get a full response."""
+        modified = datetime(2026, 1, 1)
+
+        assert not not_modified_since(make_request(), modified)
+        assert not not_modified_since(make_request(if_modified_since="yesterday"), modified)
+        assert not not_modified_since(
+            make_request(if_modified_since="Fri, 02 Jan 2026 08:30:00 GMT", if_none_match='"a"'),
+            modified,
+        )
+
+    def test_timestamp_etag_tracks_sub_second_edits(self):
+        """Two edits within one second get different ETags but one Last-Modified."""
+        host = SimpleNamespace(updated_at=datetime(2026, 1, 2, 8, 30, 0, 100000))
+        edited = SimpleNamespace(updated_at=datetime(2026, 1, 2, 8, 30, 0, 200000))
+
+        assert timestamp_etag(host, None) == timestamp_etag(host, None)
+        assert timestamp_etag(host, None) != timestamp_etag(edited, None)
+        assert http_date(host.updated_at) == http_date(edited.updated_at)
+
+    def test_not_modified_prefers_etag(self):
+        """If-None-Match decides when sent, even if If-Modified-Since would match."""
+        rendered = SimpleNamespace(updated_at=datetime(2026, 1, 2, 8, 30, 0, 100000))
+        edited = SimpleNamespace(updated_at=datetime(2026, 1, 2, 8, 30, 0, 200000))
+        request = make_request(
+            if_modified_since=http_date(rendered.updated_at),
+            if_none_match=timestamp_etag(rendered),
+        )
+
+        assert not_modified(request, timestamp_etag(rendered), rendered.updated_at)
+        assert not not_modified(request, timestamp_etag(edited), edited.updated_at)
+        assert not_modified(
+            make_request(if_modified_since=http_date(rendered.updated_at)),
+            timestamp_etag(edited),
+            edited.updated_at,
+        )
@@ -0,0 +1,39 @@
+"""Tests for database engine setup."""
+
+from pathlib import Path
+
+import pytest
+from sqlalchemy import text
+
+from myriad.config import init_settings, invalidate_settings_cache
+from myriad.core.database import close_db, get_engine
+
+
+@pytest.fixture
+async def sqlite_file_engine(tmp_path: Path):
+    """Point the app engine at a temporary file-backed SQLite database."""
+    (tmp_path / "myriad.toml").write_text(
+        f'[database]\nurl = "sqlite+aiosqlite:///{tmp_path / "test.db"}"\n'
+    )
+    await close_db()
+    init_settings(tmp_path)
+    yield get_engine()
+    await close_db()
+    invalidate_settings_cache()
+    init_settings(Path("config"))
+
+
+class TestSQLitePragmas:
+    """Tests for per-connection SQLite tuning."""
+
+    @pytest.mark.asyncio
+    async def test_pragmas_applied_on_connect(self, sqlite_file_engine):
+        """New SQLite connections should use WAL with relaxed fsync."""
+        async with sqlite_file_engine.connect() as conn:
+            journal_mode = (await conn.execute(text("PRAGMA journal_mode"))).scalar_one()
+            synchronous = (await conn.execute(text("PRAGMA synchronous"))).scalar_one()
+            temp_store = (await conn.execute(text("PRAGMA temp_store"))).scalar_one()
+
+        assert journal_mode == "wal"
+        assert synchronous == 1  # NORMAL
+        assert temp_store == 2  # MEMORY
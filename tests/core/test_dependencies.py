@@ -0,0 +1,43 @@
+"""Tests for FastAPI dependencies."""
+
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from myriad.core.dependencies import is_setup_complete
+from myriad.core.security import create_user
+
+
+def make_request() -> SimpleNamespace:
+    """Minimal stand-in for a Request with app.state."""
+    return SimpleNamespace(app=SimpleNamespace(state=SimpleNamespace(setup_complete=False)))
+
+
+class TestSetupComplete:
+    """Tests for the cached first-user check."""
+
+    @pytest.mark.asyncio
+    async def test_false_until_user_exists(self, db: AsyncSession):
+        """Setup is incomplete until the first user is created."""
+        request = make_request()
+
+        assert await is_setup_complete(request, db) is False
+        assert request.app.state.setup_complete is False
+
+        await create_user(db, "admin", "password123")
+
+        assert await is_setup_complete(request, db) is True
+        assert request.app.state.setup_complete is True
+
+    @pytest.mark.asyncio
+    async def test_cached_result_skips_query(self, db: AsyncSession, count_statements):
+        """Once setup is known to be complete no further SELECT is issued."""
+        await create_user(db, "admin", "password123")
+        request = make_request()
+        await is_setup_complete(request, db)
+
+        with count_statements() as statements:
+            assert await is_setup_complete(request, db) is True
+
+        assert statements == []
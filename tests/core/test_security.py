@@ -0,0 +1,210 @@
+"""Tests for password hashing and session helpers."""
+
+import threading
+from datetime import datetime, timedelta
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from sqlalchemy import inspect
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from myriad.config import get_settings
+from myriad.core import security
+from myriad.core.security import (
+    any_user_exists,
+    authenticate_user,
+    cleanup_expired_sessions,
+    create_session,
+    create_user,
+    get_session_with_user,
+    hash_password,
+    password_needs_rehash,
+    verify_password,
+)
+
+
+class TestPasswordHashing:
+    """Tests for bcrypt password hashing."""
+
+    @pytest.mark.asyncio
+    async def test_hash_and_verify(self):
+        """A hashed password should verify, and a wrong one should not."""
+        hashed = await hash_password("password123")
+
+        assert hashed.startswith("$2b$")
+        assert await verify_password("password123", hashed) is True
+        assert await verify_password("wrong-password", hashed) is False
+
+    @pytest.mark.asyncio
+    async def test_long_password_truncated(self):
+        """Passwords longer than bcrypt's 72-byte limit should still hash."""
+        long_password = "a" * 100
+        hashed = await hash_password(long_password)
+
+        assert await verify_password(long_password, hashed) is True
+        assert await verify_password("a" * 72, hashed) is True
+
+    @pytest.mark.asyncio
+    async def test_malformed_hash_does_not_verify(self):
+        """A non-bcrypt hash should fail verification instead of raising."""
+        assert await verify_password("password123", "not-a-bcrypt-hash") is False
+
+    @pytest.mark.asyncio
+    async def test_hashing_runs_in_bcrypt_pool(self, monkeypatch):
+        """bcrypt work should run on the dedicated pool, not the loop's default executor."""
+        thread_names = []
+        real_hash = security._hash_password_sync
+
+        def spy(password: str) -> str:
+            thread_names.append(threading.current_thread().name)
+            return real_hash(password)
+
+        monkeypatch.setattr(security, "_hash_password_sync", spy)
+        await hash_password("password123")
+
+        assert thread_names[0].startswith("bcrypt")
+
+
+class TestAuthenticateUser:
+    """Tests for username/password authentication."""
+
+    @pytest.mark.asyncio
+    async def test_valid_credentials(self, db: AsyncSession):
+        """Correct credentials should return the user and record the login."""
+        await create_user(db, "alice", "password123")
+
+        user = await authenticate_user(db, "alice", "password123")
+
+        assert user is not None
+        assert user.username == "alice"
+        assert user.last_login is not None
+
+    @pytest.mark.asyncio
+    async def test_wrong_password(self, db: AsyncSession):
+        """A wrong password should not authenticate."""
+        await create_user(db, "bob", "password123")
+
+        assert await authenticate_user(db, "bob", "wrong-password") is None
+
+    @pytest.mark.asyncio
+    async def test_unknown_user(self, db: AsyncSession):
+        """An unknown username should not authenticate."""
+        assert await authenticate_user(db, "nobody", "password123") is None
+
+    @pytest.mark.asyncio
+    async def test_rehash_on_cost_change(self, db: AsyncSession, monkeypatch):
+        """A successful login should upgrade a hash made at an old cost."""
+        settings = get_settings()
+        monkeypatch.setattr(settings, "bcrypt_rounds", 4)
+        user = await create_user(db, "admin", "password123")
+        assert user.password_hash.startswith("$2b$04$")
+
+        monkeypatch.setattr(settings, "bcrypt_rounds", 5)
+        assert password_needs_rehash(user.password_hash) is True
+        assert await authenticate_user(db, "admin", "password123") is user
+
+        assert user.password_hash.startswith("$2b$05$")
+        assert password_needs_rehash(user.password_hash) is False
+        assert await verify_password("password123", user.password_hash)
+
+
+class TestSessionLookup:
+    """Tests for session validation."""
+
+    @pytest.mark.asyncio
+    async def test_valid_session(self, db: AsyncSession):
+        """A live session should return both the session and its user."""
+        user = await create_user(db, "admin", "password123")
+        session = await create_session(db, user)
+
+        result = await get_session_with_user(db, session.id)
+
+        assert result is not None
+        found_session, found_user = result
+        assert found_session.id == session.id
+        assert found_user.id == user.id
+
+    @pytest.mark.asyncio
+    async def test_lookup_skips_user_agent(self, db: AsyncSession):
+        """The per-request lookup shouldn't fetch the stored user agent."""
+        user = await create_user(db, "admin", "password123")
+        session = await create_session(db, user, user_agent="Mozilla/5.0 " * 40)
+        db.expunge_all()
+
+        found_session, _ = await get_session_with_user(db, session.id)
+
+        assert "user_agent" in inspect(found_session).unloaded
+
+    @pytest.mark.asyncio
+    async def test_expired_session(self, db: AsyncSession):
+        """An expired session should not be returned."""
+        user = await create_user(db, "admin", "password123")
+        session = await create_session(db, user)
+        session.expires_at = datetime.utcnow() - timedelta(minutes=1)
+        await db.flush()
+
+        assert await get_session_with_user(db, session.id) is None
+
+    @pytest.mark.asyncio
+    async def test_inactive_user(self, db: AsyncSession):
+        """A session for a deactivated user should not be returned."""
+        user = await create_user(db, "admin", "password123")
+        session = await create_session(db, user)
+        user.is_active = False
+        await db.flush()
+
+        assert await get_session_with_user(db, session.id) is None
+
+    @pytest.mark.asyncio
+    async def test_cleanup_removes_only_expired(self, db: AsyncSession):
+        """Cleanup should delete expired sessions and keep live ones."""
+        user = await create_user(db, "admin", "password123")
+        live = await create_session(db, user)
+        expired = await create_session(db, user)
+        expired.expires_at = datetime.utcnow() - timedelta(minutes=1)
+        await db.flush()
+
+        # Flush instead of committing so the fixture's rollback still cleans up
+        with patch.object(db, "commit", db.flush):
+            assert await cleanup_expired_sessions(db) == 1
+        assert await get_session_with_user(db, live.id) is not None
+
+    @pytest.mark.asyncio
+    async def test_cleanup_in_batches(self, db: AsyncSession):
+        """Cleanup should keep deleting until fewer than a full batch remain."""
+        user = await create_user(db, "admin", "password123")
+        for _ in range(5):
+            session = await create_session(db, user)
+            session.expires_at = datetime.utcnow() - timedelta(minutes=1)
+        await db.flush()
+
+        commit = AsyncMock(side_effect=db.flush)
+        with patch.object(db, "commit", commit):
+            assert await cleanup_expired_sessions(db, batch_size=2) == 5
+
+        # Each batch (2, 2, then the final 1) commits on its own
+        assert commit.await_count == 3
+
+
+class TestAnyUserExists:
+    """Tests for setup detection."""
+
+    @pytest.mark.asyncio
+    async def test_no_users(self, db: AsyncSession):
+        """An empty users table should report no users."""
+        assert await any_user_exists(db) is False
+
+    @pytest.mark.asyncio
+    async def test_with_user(self, db: AsyncSession):
+        """Any existing user should be detected."""
+        await create_user(db, "admin", "password123")
+
+        assert await any_user_exists(db) is True
+
+    @pytest.mark.asyncio
+    async def test_with_plain_connection(self, db: AsyncSession):
+        """A Core connection should work as well as an ORM session."""
+        await create_user(db, "admin", "password123")
+        conn = await db.connection()
+
+        assert await any_user_exists(conn) is True
@@ -0,0 +1,40 @@
+"""Tests for the shared templates cache."""
+
+from pathlib import Path
+
+from myriad.core.templates import get_templates
+
+
+class TestGetTemplates:
+    """Tests for get_templates."""
+
+    def test_equivalent_paths_share_instance(self, tmp_path: Path):
+        """Different spellings of the same directory should reuse one instance."""
+        templates_dir = tmp_path / "templates"
+        templates_dir.mkdir()
+
+        first = get_templates(str(templates_dir))
+        second = get_templates(str(templates_dir / ".." / "templates"))
+
+        assert first is second
+
+    def test_auto_reload_kept_separate(self, tmp_path: Path):
+        """Debug and production settings should not share an environment."""
+        reloading = get_templates(str(tmp_path), auto_reload=True)
+        static = get_templates(str(tmp_path), auto_reload=False)
+
+        assert reloading is not static
+        assert reloading.env.auto_reload is True
+        assert static.env.auto_reload is False
+
+    def test_compiled_templates_written_to_bytecode_cache(self, tmp_path: Path):
+        """Rendering a template should leave its compiled form in the cache directory."""
+        templates_dir = tmp_path / "templates"
+        templates_dir.mkdir()
+        (templates_dir / "hello.html").write_text("Hello {{ name }}")
+        cache_dir = tmp_path / "cache"
+
+        templates = get_templates(str(templates_dir), bytecode_cache_dir=str(cache_dir))
+
+        assert templates.get_template("hello.html").render(name="Ada") == "Hello Ada"
+        assert list(cache_dir.iterdir())
@@ -0,0 +1 @@
+"""OPNsense integration tests."""
@@ -0,0 +1,62 @@
+"""Tests for the OPNsense API client."""
+
+from datetime import UTC, datetime
+
+import httpx
+import pytest
+
+from myriad.config import OPNsenseCredentials, OPNsenseIntegrationConfig
+from myriad.integrations.opnsense import OPNsenseClient
+
+
+class TestGetAllHosts:
+    """Tests for combined lease and static mapping discovery."""
+
+    @pytest.mark.asyncio
+    async def test_static_mapping_overrides_lease(self):
+        """A static mapping should replace a dynamic lease for the same MAC."""
+        responses = {
+            "/api/dhcpv4/leases/searchLease": [
+                {"mac": "AA-BB-CC-DD-EE-01", "address": "10.0.0.10", "hostname": "laptop"},
+                {"mac": "aa:bb:cc:dd:ee:02", "address": "10.0.0.11", "hostname": "phone"},
+            ],
+            "/api/dhcpv4/reservations/searchReservation": [
+                {"mac": "aa:bb:cc:dd:ee:01", "ipaddr": "10.0.0.2", "hostname": "laptop"},
+            ],
+        }
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(200, json={"rows": responses[request.url.path]})
+
+        client = OPNsenseClient(
+            OPNsenseIntegrationConfig(
+                id="test", base_url="https://localhost", credential_ref="opnsense.test"
+            ),
+            OPNsenseCredentials(api_key="key", api_secret="secret"),
+        )
+        client._client = httpx.AsyncClient(
+            base_url="https://localhost", transport=httpx.MockTransport(handler)
+        )
+
+        hosts = await client.get_all_hosts()
+        await client._client.aclose()
+
+        assert [(h.mac_address, h.ip_address, h.is_static) for h in hosts] == [
+            ("aa:bb:cc:dd:ee:01", "10.0.0.2", True),
+            ("aa:bb:cc:dd:ee:02", "10.0.0.11", False),
+        ]
+
+
+class TestParseTimestamp:
+    """Tests for lease timestamp parsing."""
+
+    def test_zulu_suffix(self):
+        """A trailing Z should parse as UTC."""
+        result = OPNsenseClient._parse_timestamp("2024-01-15T10:30:00Z")
+        assert result == datetime(2024, 1, 15, 10, 30, tzinfo=UTC)
+
+    def test_missing_or_invalid(self):
+        """Missing or malformed values should be ignored."""
+        assert OPNsenseClient._parse_timestamp(None) is None
+        assert OPNsenseClient._parse_timestamp("not a date") is None
+        assert OPNsenseClient._parse_timestamp(1705314600) is None
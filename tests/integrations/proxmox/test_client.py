@@ -1,5 +1,6 @@
 """Tests for the Proxmox API client."""
 
+import httpx
 import pytest
 
 from myriad.config import ProxmoxCredentials, ProxmoxIntegrationConfig
@@ -41,6 +42,25 @@ class TestProxmoxVM:
 
         assert vm1.uuid != vm2.uuid
 
+    def test_uuid_format_stable(self):
+        """UUIDs are stored on VM rows, so the derivation must not change."""
+        vm = ProxmoxVM(vmid=100, name="vm1", node="pve", vm_type="qemu", status="running")
+
+        assert vm.uuid == "00000000-0000-0000-0100-ae4fa14f5710"
+
+    def test_tag_list_splits_and_dedupes(self):
+        """Proxmox tags may be separated by ; , or spaces."""
+        vm = ProxmoxVM(
+            vmid=100,
+            name="vm1",
+            node="pve",
+            vm_type="qemu",
+            status="running",
+            tags="web;prod, web db",
+        )
+
+        assert vm.tag_list == ["web", "prod", "db"]
+
 
 class TestMacAddressExtraction:
     """Tests for MAC address extraction from Proxmox config."""
@@ -159,6 +179,52 @@ class TestMacNormalization:
         result = self.client._normalize_mac("aa-bb-cc-dd-ee-ff")
         assert result == "aa:bb:cc:dd:ee:ff"
 
+    def test_normalize_cisco_format(self):
+        """MAC in Cisco dotted format should be rebuilt with colons."""
+        result = self.client._normalize_mac("AABB.CCDD.EEFF")
+        assert result == "aa:bb:cc:dd:ee:ff"
+
+
+class TestGetAllVMs:
+    """Tests for VM listing."""
+
+    @pytest.mark.asyncio
+    async def test_macs_matched_to_vms(self):
+        """Concurrently fetched configs should be attached to the right VMs."""
+        resources = [
+            {"vmid": 100, "name": "web", "node": "pve", "type": "qemu", "status": "running"},
+            {"vmid": 101, "name": "tmpl", "node": "pve", "type": "qemu", "template": 1},
+            {"vmid": 200, "name": "db", "node": "pve", "type": "lxc", "status": "stopped"},
+        ]
+        configs = {
+            "/api2/json/nodes/pve/qemu/100/config": {"net0": "virtio=BC:24:11:00:00:01"},
+            "/api2/json/nodes/pve/lxc/200/config": {"net0": "name=eth0,hwaddr=BC:24:11:00:00:02"},
+        }
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            if request.url.path == "/api2/json/cluster/resources":
+                return httpx.Response(200, json={"data": resources})
+            return httpx.Response(200, json={"data": configs[request.url.path]})
+
+        client = ProxmoxClient(
+            ProxmoxIntegrationConfig(
+                id="test", base_url="https://localhost:8006", credential_ref="proxmox.test"
+            ),
+            ProxmoxCredentials(token_id="test@pam!test", token_secret="test-secret"),
+        )
+        client._client = httpx.AsyncClient(
+            base_url="https://localhost:8006/api2/json",
+            transport=httpx.MockTransport(handler),
+        )
+
+        vms = await client.get_all_vms()
+        await client._client.aclose()
+
+        assert [(vm.vmid, vm.mac_addresses) for vm in vms] == [
+            (100, ["bc:24:11:00:00:01"]),
+            (200, ["bc:24:11:00:00:02"]),
+        ]
+
 
 class TestStatusMapping:
     """Tests for status to state mapping."""
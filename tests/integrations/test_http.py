@@ -0,0 +1,84 @@
+"""Tests for the shared integration HTTP client."""
+
+import asyncio
+import ssl
+
+import httpx
+import pytest
+
+from myriad.integrations import http
+from myriad.integrations.http import (
+    close_shared_http_clients,
+    create_http_client,
+    parse_json,
+    shared_http_client,
+)
+
+
+class TestCreateHttpClient:
+    """Tests for create_http_client."""
+
+    def test_verify_reaches_transport(self):
+        """TLS verification must follow the integration's verify_ssl setting."""
+        verified = create_http_client(base_url="https://localhost", verify=True)
+        unverified = create_http_client(base_url="https://localhost", verify=False)
+
+        assert verified._transport._pool._ssl_context.verify_mode == ssl.CERT_REQUIRED
+        assert unverified._transport._pool._ssl_context.verify_mode == ssl.CERT_NONE
+
+    def test_http2_enabled(self):
+        """The transport should negotiate HTTP/2 when the server offers it."""
+        client = create_http_client(base_url="https://localhost", verify=True)
+
+        assert client._transport._pool._http2 is True
+
+
+class TestSharedHttpClient:
+    """Tests for the long-lived per-endpoint clients."""
+
+    @pytest.mark.asyncio
+    async def test_reused_per_endpoint_and_credentials(self):
+        """The same endpoint and credentials should get the same open client."""
+        first = shared_http_client(base_url="https://localhost", verify=True, auth=("a", "b"))
+        again = shared_http_client(base_url="https://localhost", verify=True, auth=("a", "b"))
+        other = shared_http_client(base_url="https://localhost", verify=True, auth=("a", "c"))
+
+        try:
+            assert again is first
+            assert other is not first
+        finally:
+            await close_shared_http_clients()
+
+        assert first.is_closed and other.is_closed
+        assert shared_http_client(base_url="https://localhost", verify=True) is not first
+        await close_shared_http_clients()
+
+    def test_separate_per_event_loop(self):
+        """A later asyncio.run() shouldn't reuse a client bound to a closed loop."""
+
+        async def get_client() -> httpx.AsyncClient:
+            return shared_http_client(base_url="https://localhost", verify=True)
+
+        first = asyncio.run(get_client())
+        second = asyncio.run(get_client())
+
+        assert second is not first
+        # The first loop's client was dropped once its loop closed
+        assert first not in http._shared_clients.values()
+
+
+class TestParseJson:
+    """Tests for parse_json."""
+
+    def test_parses_body(self):
+        """The response body should decode to Python objects."""
+        response = httpx.Response(200, json={"data": [{"vmid": 100, "name": "web"}]})
+
+        assert parse_json(response) == {"data": [{"vmid": 100, "name": "web"}]}
+
+    def test_invalid_body_raises_value_error(self):
+        """Malformed JSON should raise a ValueError like response.json() does."""
+        response = httpx.Response(200, content=b"<html>")
+
+        with pytest.raises(ValueError):
+            parse_json(response)
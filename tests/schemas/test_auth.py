@@ -15,15 +15,18 @@ class TestLoginRequest:
         assert login.username == "testuser"
         assert login.password == "password123"
 
-    def test_empty_username_fails(self):
-        """Empty username should fail validation."""
+    @pytest.mark.parametrize(
+        "data",
+        [
+            {"username": "", "password": "password123"},
+            {"username": "testuser", "password": ""},
+        ],
+        ids=["empty_username", "empty_password"],
+    )
+    def test_invalid_login_fails(self, data):
+        """Empty credentials should fail validation."""
         with pytest.raises(ValidationError):
-            LoginRequest(username="", password="password123")
-
-    def test_empty_password_fails(self):
-        """Empty password should fail validation."""
-        with pytest.raises(ValidationError):
-            LoginRequest(username="testuser", password="")
+            LoginRequest(**data)
 
 
 class TestUserCreate:
@@ -45,20 +48,22 @@ class TestUserCreate:
         )
         assert user.display_name == "Test User"
 
-    def test_username_too_short(self):
-        """Username less than 3 chars should fail."""
+    @pytest.mark.parametrize(
+        "data",
+        [
+            # Username less than 3 chars
+            {"username": "ab", "password": "password123"},
+            # Username with special characters
+            {"username": "test@user", "password": "password123"},
+            # Password less than 8 chars
+            {"username": "testuser", "password": "short"},
+        ],
+        ids=["username_too_short", "username_invalid_chars", "password_too_short"],
+    )
+    def test_invalid_user_fails(self, data):
+        """Usernames and passwords outside the rules should fail."""
         with pytest.raises(ValidationError):
-            UserCreate(username="ab", password="password123")
-
-    def test_username_invalid_chars(self):
-        """Username with special characters should fail."""
-        with pytest.raises(ValidationError):
-            UserCreate(username="test@user", password="password123")
-
-    def test_password_too_short(self):
-        """Password less than 8 chars should fail."""
-        with pytest.raises(ValidationError):
-            UserCreate(username="testuser", password="short")
+            UserCreate(**data)
 
 
 class TestSetupRequest:
@@ -87,23 +92,18 @@ class TestSetupRequest:
         errors = exc_info.value.errors()
         assert any("match" in str(e["msg"]).lower() for e in errors)
 
-    def test_username_validation_applied(self):
-        """Username validation from UserCreate should apply."""
-        with pytest.raises(ValidationError):
-            SetupRequest(
-                username="ab",  # Too short
-                password="password123",
-                password_confirm="password123",
-            )
-
-    def test_password_validation_applied(self):
-        """Password length validation should apply."""
+    @pytest.mark.parametrize(
+        "data",
+        [
+            {"username": "ab", "password": "password123", "password_confirm": "password123"},
+            {"username": "testuser", "password": "short", "password_confirm": "short"},
+        ],
+        ids=["username_too_short", "password_too_short"],
+    )
+    def test_user_validation_applied(self, data):
+        """Username and password validation from UserCreate should apply."""
         with pytest.raises(ValidationError):
-            SetupRequest(
-                username="testuser",
-                password="short",  # Too short
-                password_confirm="short",
-            )
+            SetupRequest(**data)
 
     def test_with_display_name(self):
         """Setup with display name should pass."""
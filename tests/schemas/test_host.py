@@ -0,0 +1,26 @@
+"""Tests for host schemas."""
+
+from myriad.models import HostType
+from myriad.schemas import HostEditForm
+
+
+class TestHostEditForm:
+    """Tests for the host edit form model."""
+
+    def test_blank_inputs_become_none(self):
+        """Empty text inputs clear the field rather than storing ''."""
+        form = HostEditForm(display_name="", host_type="server", location_id="", notes="")
+
+        assert form.model_dump() == {
+            "display_name": None,
+            "host_type": HostType.SERVER,
+            "location_id": None,
+            "notes": None,
+        }
+
+    def test_missing_fields_default_to_none(self):
+        """Fields the form doesn't send are None."""
+        form = HostEditForm(display_name="nas")
+
+        assert form.display_name == "nas"
+        assert form.location_id is None
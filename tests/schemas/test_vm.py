@@ -0,0 +1,150 @@
+"""Tests for VM schemas."""
+
+from datetime import datetime
+
+import pytest
+
+from myriad.models import (
+    Hypervisor,
+    HypervisorStatus,
+    HypervisorType,
+    VirtualMachine,
+    VMSnapshot,
+    VMState,
+    VMType,
+)
+from myriad.schemas.vm import (
+    HYPERVISOR_LIST_ADAPTER,
+    VM_SYNC_LIST_ADAPTER,
+    VMDetailResponse,
+    VMResponse,
+    VMSyncResult,
+)
+from myriad.services.proxmox_service import ProxmoxSyncResult
+
+
+class TestListAdapters:
+    """Tests for whole-list response validation."""
+
+    def test_hypervisors_from_orm_objects(self):
+        """ORM rows should validate straight into a response list."""
+        now = datetime(2026, 1, 1)
+        hypervisor = Hypervisor(
+            id="pve",
+            name="PVE",
+            hypervisor_type=HypervisorType.PROXMOX,
+            status=HypervisorStatus.ONLINE,
+            created_at=now,
+            updated_at=now,
+        )
+
+        [response] = HYPERVISOR_LIST_ADAPTER.validate_python([hypervisor])
+
+        assert response.id == "pve"
+        assert response.status == HypervisorStatus.ONLINE
+
+    def test_sync_results_from_service_dataclass(self):
+        """Service sync results should convert by attribute."""
+        result = ProxmoxSyncResult(
+            hypervisor_id="pve",
+            vms_created=1,
+            vms_updated=2,
+            vms_removed=0,
+            hosts_linked=1,
+            snapshots_synced=3,
+            timestamp=datetime(2026, 1, 1),
+            error="boom",
+        )
+
+        responses = VM_SYNC_LIST_ADAPTER.validate_python([result])
+
+        assert VMSyncResult.model_validate(result) == responses[0]
+        assert responses == [
+            VMSyncResult(
+                hypervisor_id="pve",
+                vms_created=1,
+                vms_updated=2,
+                vms_removed=0,
+                hosts_linked=1,
+                snapshots_synced=3,
+                timestamp=datetime(2026, 1, 1),
+                error="boom",
+            )
+        ]
+
+
+class TestVMDetailResponse:
+    """Tests for the VM detail API response."""
+
+    def test_from_orm_object_with_relationships(self):
+        """A loaded VM row should validate with its hypervisor, snapshots, MACs and tags."""
+        now = datetime(2026, 1, 1)
+        vm = VirtualMachine(
+            id=1,
+            uuid="pve-100",
+            name="web",
+            vmid=100,
+            vm_type=VMType.QEMU,
+            hypervisor_id="pve",
+            state=VMState.RUNNING,
+            memory_mb=2048,
+            created_at=now,
+            updated_at=now,
+        )
+        vm.hypervisor = Hypervisor(
+            id="pve",
+            name="PVE",
+            hypervisor_type=HypervisorType.PROXMOX,
+            status=HypervisorStatus.ONLINE,
+            created_at=now,
+            updated_at=now,
+        )
+        vm.snapshots.append(VMSnapshot(id=1, name="nightly", is_current=False, created_at=now))
+        vm.mac_addresses.append("aa:bb:cc:dd:ee:ff")
+        vm.tags.append("prod")
+
+        response = VMDetailResponse.model_validate(vm)
+
+        assert response.hypervisor.id == "pve"
+        assert [s.name for s in response.snapshots] == ["nightly"]
+        assert response.mac_addresses == ["aa:bb:cc:dd:ee:ff"]
+        assert response.tags == ["prod"]
+        assert response.memory_gb == 2.0
+
+
+class TestVMResponse:
+    """Tests for VM response computed fields."""
+
+    @pytest.mark.parametrize(
+        ("uptime_seconds", "expected"),
+        [
+            (None, None),
+            (0, "0m"),
+            (59 * 60 + 59, "59m"),
+            (3600 + 5 * 60, "1h 5m"),
+            (86400 * 3 + 3600 * 4 + 60, "3d 4h"),
+        ],
+    )
+    def test_uptime_display(self, uptime_seconds: int | None, expected: str | None):
+        """Uptime shows the two most significant units."""
+        now = datetime(2026, 1, 1)
+        vm = VMResponse(
+            id=1,
+            uuid="pve-100",
+            name="web",
+            vmid=100,
+            vm_type=VMType.QEMU,
+            hypervisor_id="pve",
+            host_id=None,
+            state=VMState.RUNNING,
+            vcpus=None,
+            memory_mb=None,
+            disk_gb=None,
+            uptime_seconds=uptime_seconds,
+            last_state_change=None,
+            description=None,
+            created_at=now,
+            updated_at=now,
+        )
+
+        assert vm.uptime_display == expected
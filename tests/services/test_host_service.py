@@ -1,55 +1,46 @@
 """Tests for the HostService."""
 
+import base64
+from datetime import datetime, timedelta
+
 import pytest
+from sqlalchemy import inspect
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from myriad.models import DiscoverySource, Host, HostStatus
+from myriad.models import DiscoverySource, Host, HostStatus, Location
 from myriad.schemas import HostCreate, HostUpdate
 from myriad.services import HostService
+from myriad.services.host_service import HOST_LIST_ORDER
+from myriad.services.pagination import page_cursors
 
 
 class TestMacNormalization:
     """Tests for MAC address normalization."""
 
-    def test_normalize_lowercase_colons(self):
-        """MAC already in correct format should be unchanged."""
-        result = HostService._normalize_mac("aa:bb:cc:dd:ee:ff")
-        assert result == "aa:bb:cc:dd:ee:ff"
-
-    def test_normalize_uppercase_colons(self):
-        """Uppercase MAC should be lowercased."""
-        result = HostService._normalize_mac("AA:BB:CC:DD:EE:FF")
-        assert result == "aa:bb:cc:dd:ee:ff"
-
-    def test_normalize_dashes(self):
-        """MAC with dashes should use colons."""
-        result = HostService._normalize_mac("aa-bb-cc-dd-ee-ff")
-        assert result == "aa:bb:cc:dd:ee:ff"
-
-    def test_normalize_no_separators(self):
-        """MAC without separators should be split correctly."""
-        result = HostService._normalize_mac("aabbccddeeff")
-        assert result == "aa:bb:cc:dd:ee:ff"
-
-    def test_normalize_cisco_format(self):
-        """MAC in Cisco format (dots) should be normalized."""
-        result = HostService._normalize_mac("aabb.ccdd.eeff")
-        assert result == "aa:bb:cc:dd:ee:ff"
-
-    def test_invalid_mac_too_short(self):
-        """MAC that's too short should raise ValueError."""
-        with pytest.raises(ValueError, match="Invalid MAC address"):
-            HostService._normalize_mac("aa:bb:cc")
-
-    def test_invalid_mac_too_long(self):
-        """MAC that's too long should raise ValueError."""
+    @pytest.mark.parametrize(
+        "mac",
+        [
+            "aa:bb:cc:dd:ee:ff",
+            "AA:BB:CC:DD:EE:FF",
+            "aa-bb-cc-dd-ee-ff",
+            "aabbccddeeff",
+            "aabb.ccdd.eeff",  # Cisco format
+        ],
+        ids=["lowercase_colons", "uppercase_colons", "dashes", "no_separators", "cisco_format"],
+    )
+    def test_normalize(self, mac):
+        """Common MAC formats should normalize to lowercase with colons."""
+        assert HostService._normalize_mac(mac) == "aa:bb:cc:dd:ee:ff"
+
+    @pytest.mark.parametrize(
+        "mac",
+        ["aa:bb:cc", "aa:bb:cc:dd:ee:ff:00", "gg:hh:ii:jj:kk:ll"],
+        ids=["too_short", "too_long", "bad_hex"],
+    )
+    def test_invalid_mac(self, mac):
+        """Malformed MACs should raise ValueError."""
         with pytest.raises(ValueError, match="Invalid MAC address"):
-            HostService._normalize_mac("aa:bb:cc:dd:ee:ff:00")
-
-    def test_invalid_mac_bad_hex(self):
-        """MAC with invalid hex characters should raise ValueError."""
-        with pytest.raises(ValueError, match="Invalid MAC address"):
-            HostService._normalize_mac("gg:hh:ii:jj:kk:ll")
+            HostService._normalize_mac(mac)
 
 
 class TestHostServiceCRUD:
@@ -69,6 +60,18 @@ class TestHostServiceCRUD:
         assert host.first_seen is not None
         assert host.last_seen is not None
 
+    @pytest.mark.asyncio
+    async def test_create_duplicate_mac_returns_none(self, db: AsyncSession):
+        """Creating a host whose MAC already exists leaves the existing host alone."""
+        service = HostService(db)
+        original = await service.create(HostCreate(mac_address="aa:bb:cc:dd:ee:01", hostname="a"))
+
+        duplicate = await service.create(HostCreate(mac_address="AA:BB:CC:DD:EE:01", hostname="b"))
+
+        assert duplicate is None
+        assert (await service.get_by_mac("aa:bb:cc:dd:ee:01")).id == original.id
+        assert original.hostname == "a"
+
     @pytest.mark.asyncio
     async def test_create_host_normalizes_mac(self, db: AsyncSession):
         """Test that MAC is normalized on create."""
@@ -85,7 +88,6 @@ class TestHostServiceCRUD:
         service = HostService(db)
         data = HostCreate(mac_address="11:22:33:44:55:66")
         created = await service.create(data)
-        await db.flush()
 
         found = await service.get_by_id(created.id)
 
@@ -108,7 +110,6 @@ class TestHostServiceCRUD:
         service = HostService(db)
         data = HostCreate(mac_address="aa:11:bb:22:cc:33")
         await service.create(data)
-        await db.flush()
 
         # Should find with same format
         found = await service.get_by_mac("aa:11:bb:22:cc:33")
@@ -125,7 +126,6 @@ class TestHostServiceCRUD:
         service = HostService(db)
         data = HostCreate(mac_address="aa:bb:cc:dd:ee:ff")
         host = await service.create(data)
-        await db.flush()
 
         update_data = HostUpdate(
             display_name="My Server",
@@ -153,6 +153,190 @@ class TestHostServiceCRUD:
         assert found is None
 
 
+class TestHostServiceLoading:
+    """Tests for eager loading of relationships rendered by templates."""
+
+    @pytest.mark.asyncio
+    async def test_get_all_loads_relationships(self, db: AsyncSession):
+        """Listed hosts should come back with location and VM already loaded."""
+        db.add(Location(id="lan", name="LAN"))
+        service = HostService(db)
+        await service.create(HostCreate(mac_address="aa:bb:cc:00:00:01", location_id="lan"))
+        db.expunge_all()
+
+        hosts, _ = await service.get_all()
+
+        unloaded = inspect(hosts[0]).unloaded
+        assert "location" not in unloaded
+        assert "virtual_machine" not in unloaded
+        assert hosts[0].location.name == "LAN"
+
+    @pytest.mark.asyncio
+    async def test_get_all_defers_notes(self, db: AsyncSession):
+        """Listing hosts shouldn't fetch notes; fetching one host should."""
+        service = HostService(db)
+        host = await service.create(HostCreate(mac_address="aa:bb:cc:00:00:01", notes="long"))
+        db.expunge_all()
+
+        hosts, _ = await service.get_all()
+        assert "notes" in inspect(hosts[0]).unloaded
+
+        db.expunge_all()
+        fetched = await service.get_by_id(host.id)
+        assert fetched.notes == "long"
+
+    @pytest.mark.asyncio
+    async def test_get_all_query_count_independent_of_rows(
+        self, db: AsyncSession, count_statements
+    ):
+        """Listing hosts should issue the same number of statements for 1 or 5 hosts."""
+        db.add(Location(id="lan", name="LAN"))
+        service = HostService(db)
+
+        async def list_statement_count() -> int:
+            db.expunge_all()
+            with count_statements() as statements:
+                await service.get_all()
+            return len(statements)
+
+        await service.create(HostCreate(mac_address="aa:bb:cc:00:01:00", location_id="lan"))
+        single = await list_statement_count()
+        for i in range(1, 5):
+            await service.create(HostCreate(mac_address=f"aa:bb:cc:00:01:0{i}", location_id="lan"))
+        several = await list_statement_count()
+
+        assert single == several
+
+    @pytest.mark.asyncio
+    async def test_update_location_refreshes_relationship(self, db: AsyncSession):
+        """Changing location_id should be reflected in host.location."""
+        db.add_all([Location(id="lan", name="LAN"), Location(id="dmz", name="DMZ")])
+        service = HostService(db)
+        created = await service.create(
+            HostCreate(mac_address="aa:bb:cc:00:00:02", location_id="lan")
+        )
+        host = await service.get_by_id(created.id)
+        assert host.location.name == "LAN"
+
+        await service.update(host, HostUpdate(location_id="dmz"))
+
+        assert host.location.name == "DMZ"
+
+    @pytest.mark.asyncio
+    async def test_noop_update_issues_no_statements(self, db: AsyncSession, count_statements):
+        """Updating a host with its current values shouldn't touch the database."""
+        db.add(Location(id="lan", name="LAN"))
+        service = HostService(db)
+        host = await service.create(
+            HostCreate(mac_address="aa:bb:cc:00:00:03", display_name="nas", location_id="lan")
+        )
+        await db.flush()
+
+        with count_statements() as statements:
+            await service.update(host, HostUpdate(display_name="nas", location_id="lan"))
+
+        assert statements == []
+
+
+class TestHostServicePagination:
+    """Tests for cursor pagination of the host list."""
+
+    @pytest.mark.asyncio
+    async def test_cursor_pages_match_offset_order(self, db: AsyncSession):
+        """Walking after/before cursors visits hosts in list order, ties and NULLs included."""
+        seen = datetime(2026, 1, 1, 12, 0)
+        rows = [
+            (seen, "beta"),
+            (seen, "alpha"),
+            (seen, None),
+            (seen + timedelta(hours=1), "gamma"),
+            (None, "delta"),
+            (None, None),
+            (seen - timedelta(days=1), "alpha"),
+        ]
+        for i, (last_seen, hostname) in enumerate(rows):
+            db.add(Host(mac_address=f"aa:bb:cc:00:02:0{i}", hostname=hostname, last_seen=last_seen))
+        await db.flush()
+        service = HostService(db)
+        hosts, _ = await service.get_all()
+        expected = [host.id for host in hosts]
+
+        forward = []
+        after = None
+        while True:
+            page, total = await service.get_all(limit=3, after=after)
+            if not page:
+                break
+            forward.extend(host.id for host in page)
+            after = page_cursors(page, HOST_LIST_ORDER)[1]
+
+        # Start from the last host and page back to the first
+        backward = [hosts[-1].id]
+        before = page_cursors(hosts[-1:], HOST_LIST_ORDER)[0]
+        while True:
+            page, _ = await service.get_all(limit=3, before=before)
+            if not page:
+                break
+            backward[:0] = [host.id for host in page]
+            before = page_cursors(page, HOST_LIST_ORDER)[0]
+
+        assert total == len(rows)
+        assert forward == expected
+        assert backward == expected
+
+    @pytest.mark.asyncio
+    async def test_cursor_pages_read_the_list_order_index(self, db: AsyncSession, count_statements):
+        """Cursor pages walk ix_hosts_list_order instead of sorting the rows past the cursor."""
+        seen = datetime(2026, 1, 1, 12, 0)
+        for i in range(20):
+            db.add(
+                Host(
+                    mac_address=f"aa:bb:cc:00:03:{i:02x}",
+                    hostname=None if i % 3 == 0 else f"host-{i % 4}",
+                    last_seen=None if i % 5 == 0 else seen + timedelta(minutes=i % 4),
+                )
+            )
+        await db.flush()
+        service = HostService(db)
+        page, _ = await service.get_all(limit=5, offset=5)
+        before, after = page_cursors(page, HOST_LIST_ORDER)
+
+        with count_statements() as statements:
+            await service.get_all(limit=5, after=after)
+            await service.get_all(limit=5, before=before)
+
+        pages = [
+            (statement, parameters)
+            for statement, parameters in zip(statements, statements.parameters, strict=True)
+            if "ORDER BY hosts.last_seen" in statement
+        ]
+        conn = await db.connection()
+        for statement, parameters in pages:
+            plan = await conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters)
+            details = [row[3] for row in plan]
+            assert "ix_hosts_list_order" in " ".join(details)
+            assert not any("TEMP B-TREE" in detail for detail in details)
+        assert len(pages) == 2
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "cursor",
+        [
+            "not-a-cursor",
+            # Well-formed JSON whose values don't fit the columns
+            base64.urlsafe_b64encode(b"[1,1,1]").decode(),
+            base64.urlsafe_b64encode(b'[null,"x","1"]').decode(),
+            base64.urlsafe_b64encode(b'[null,"x",true]').decode(),
+            base64.urlsafe_b64encode(b'["yesterday","x",1]').decode(),
+        ],
+        ids=["undecodable", "int_datetime", "str_id", "bool_id", "bad_datetime"],
+    )
+    async def test_malformed_cursor_raises(self, db: AsyncSession, cursor: str):
+        """A tampered cursor is a ValueError, not a database error."""
+        with pytest.raises(ValueError, match="Invalid pagination cursor"):
+            await HostService(db).get_all(after=cursor)
+
+
 class TestHostServiceUpsert:
     """Tests for HostService upsert operations."""
 
@@ -187,7 +371,6 @@ class TestHostServiceUpsert:
             hostname="old-host",
             source=DiscoverySource.OPNSENSE_DHCP,
         )
-        await db.flush()
         assert created1 is True
 
         # Upsert same MAC with new IP
@@ -202,6 +385,47 @@ class TestHostServiceUpsert:
         assert host1.id == host2.id
         assert host2.ip_address == "192.168.1.200"
 
+    @pytest.mark.asyncio
+    async def test_upsert_with_shared_now_reports_update(self, db: AsyncSession):
+        """A second upsert stamped with the same sync time is not a create."""
+        service = HostService(db)
+        now = datetime.utcnow()
+        kwargs = {
+            "mac_address": "aa:bb:cc:dd:ee:ff",
+            "ip_address": "192.168.1.100",
+            "hostname": "host",
+            "source": DiscoverySource.OPNSENSE_DHCP,
+            "now": now,
+        }
+
+        _, created1 = await service.upsert_from_discovery(**kwargs)
+        _, created2 = await service.upsert_from_discovery(**kwargs)
+
+        assert created1 is True
+        assert created2 is False
+
+    @pytest.mark.asyncio
+    async def test_upsert_is_one_statement(self, db: AsyncSession, count_statements):
+        """Upserting an existing host issues a single INSERT ... ON CONFLICT."""
+        service = HostService(db)
+        await service.upsert_from_discovery(
+            mac_address="aa:bb:cc:dd:ee:ff",
+            ip_address="192.168.1.100",
+            hostname="host",
+            source=DiscoverySource.OPNSENSE_DHCP,
+        )
+
+        with count_statements() as statements:
+            await service.upsert_from_discovery(
+                mac_address="aa:bb:cc:dd:ee:ff",
+                ip_address="192.168.1.101",
+                hostname="host",
+                source=DiscoverySource.OPNSENSE_DHCP,
+            )
+
+        assert len(statements) == 1
+        assert "ON CONFLICT" in statements[0]
+
     @pytest.mark.asyncio
     async def test_upsert_preserves_display_name(self, db: AsyncSession):
         """Test upsert doesn't overwrite display_name with hostname."""
@@ -214,7 +438,6 @@ class TestHostServiceUpsert:
             hostname="dhcp-hostname",
             source=DiscoverySource.OPNSENSE_DHCP,
         )
-        await db.flush()
 
         # Set display name manually
         host1.display_name = "My Custom Name"
@@ -233,6 +456,86 @@ class TestHostServiceUpsert:
         # Hostname should NOT be updated since display_name is set
         assert host2.hostname == "dhcp-hostname"
 
+    @pytest.mark.asyncio
+    async def test_bulk_upsert_creates_and_updates(self, db: AsyncSession):
+        """Bulk upsert applies the same merge rules as upsert_from_discovery."""
+        db.add_all([Location(id="home-lan", name="Home"), Location(id="dmz", name="DMZ")])
+        service = HostService(db)
+        named, _ = await service.upsert_from_discovery(
+            mac_address="aa:bb:cc:dd:ee:01",
+            ip_address="192.168.1.1",
+            hostname="dhcp-name",
+            source=DiscoverySource.OPNSENSE_DHCP,
+            location_id="home-lan",
+        )
+        named.display_name = "Custom Name"
+        await db.flush()
+
+        created, updated = await service.bulk_upsert_from_discovery(
+            [
+                {"mac_address": "AA-BB-CC-DD-EE-01", "ip_address": "192.168.1.10", "hostname": "x"},
+                {"mac_address": "aa:bb:cc:dd:ee:02", "ip_address": "192.168.1.2", "hostname": "y"},
+            ],
+            source=DiscoverySource.OPNSENSE_DHCP,
+            location_id="dmz",
+        )
+
+        assert (created, updated) == (1, 1)
+        db.expire_all()
+        hosts = {h.mac_address: h for h in (await service.get_all())[0]}
+        assert hosts["aa:bb:cc:dd:ee:01"].ip_address == "192.168.1.10"
+        assert hosts["aa:bb:cc:dd:ee:01"].hostname == "dhcp-name"
+        assert hosts["aa:bb:cc:dd:ee:01"].location_id == "home-lan"
+        assert hosts["aa:bb:cc:dd:ee:02"].hostname == "y"
+        assert hosts["aa:bb:cc:dd:ee:02"].location_id == "dmz"
+        assert hosts["aa:bb:cc:dd:ee:02"].status == HostStatus.ONLINE
+        assert hosts["aa:bb:cc:dd:ee:02"].first_seen is not None
+
+    @pytest.mark.asyncio
+    async def test_bulk_upsert_stamps_one_timestamp(self, db: AsyncSession):
+        """Every host in a bulk upsert gets the caller's timestamp."""
+        now = datetime(2024, 1, 1, 12, 0, 0)
+        service = HostService(db)
+
+        created, _ = await service.bulk_upsert_from_discovery(
+            [
+                {"mac_address": "aa:bb:cc:dd:ee:01", "ip_address": "192.168.1.1"},
+                {"mac_address": "aa:bb:cc:dd:ee:02", "ip_address": "192.168.1.2"},
+            ],
+            source=DiscoverySource.OPNSENSE_DHCP,
+            now=now,
+        )
+
+        assert created == 2
+        db.expire_all()
+        for host in (await service.get_all())[0]:
+            assert host.first_seen == now
+            assert host.last_seen == now
+
+    @pytest.mark.asyncio
+    async def test_bulk_upsert_treats_empty_strings_as_unset(self, db: AsyncSession):
+        """An empty hostname keeps the old one, and an empty display_name doesn't block."""
+        service = HostService(db)
+
+        async def upsert(mac: str, hostname: str) -> None:
+            await service.bulk_upsert_from_discovery(
+                [{"mac_address": mac, "ip_address": "192.168.1.1", "hostname": hostname}],
+                source=DiscoverySource.OPNSENSE_DHCP,
+            )
+
+        await upsert("aa:bb:cc:dd:ee:01", "nas")
+        await upsert("aa:bb:cc:dd:ee:01", "")
+        await upsert("aa:bb:cc:dd:ee:02", "old")
+        blank = await service.get_by_mac("aa:bb:cc:dd:ee:02")
+        blank.display_name = ""
+        await db.flush()
+        await upsert("aa:bb:cc:dd:ee:02", "new")
+
+        db.expire_all()
+        hosts = {h.mac_address: h for h in (await service.get_all())[0]}
+        assert hosts["aa:bb:cc:dd:ee:01"].hostname == "nas"
+        assert hosts["aa:bb:cc:dd:ee:02"].hostname == "new"
+
 
 class TestHostServiceStats:
     """Tests for HostService statistics."""
@@ -0,0 +1,138 @@
+"""Tests for the LocationService."""
+
+from collections.abc import Generator
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from myriad.models import Base, Host, Location
+from myriad.schemas import LocationCreate, LocationUpdate
+from myriad.services import LocationService, location_service
+from myriad.services.location_service import LocationOption, invalidate_locations_cache
+
+
+@pytest.fixture(autouse=True)
+def clear_locations_cache() -> Generator[None, None, None]:
+    """Keep cached locations from leaking between tests."""
+    invalidate_locations_cache()
+    yield
+    invalidate_locations_cache()
+
+
+class TestLocationCache:
+    """Tests for the cached location list used by filter dropdowns."""
+
+    @pytest.mark.asyncio
+    async def test_repeat_reads_skip_query(self, db: AsyncSession, count_statements):
+        """A second read within the TTL issues no SELECT."""
+        db.add(Location(id="lan", name="LAN"))
+        await db.flush()
+        service = LocationService(db)
+        first = await service.get_all_cached()
+
+        with count_statements() as statements:
+            second = await service.get_all_cached()
+
+        assert second is first
+        assert first == (LocationOption("lan", "LAN"),)
+        assert statements == []
+
+    @pytest.mark.asyncio
+    async def test_uncommitted_writes_are_not_cached(self, db: AsyncSession):
+        """A session with pending location writes reads around the cache."""
+        service = LocationService(db)
+        await service.create(LocationCreate(id="lan", name="LAN"))
+        assert [loc.name for loc in await service.get_all_cached()] == ["LAN"]
+
+        await db.rollback()
+
+        assert await LocationService(db).get_all_cached() == ()
+
+    @pytest.mark.asyncio
+    async def test_commit_invalidates_cache(self, tmp_path: Path):
+        """Creating or renaming a location is visible once it commits."""
+        # Its own database, since this test has to really commit
+        engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'locations.db'}")
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        try:
+            async with AsyncSession(engine, expire_on_commit=False) as session:
+                service = LocationService(session)
+                assert await service.get_all_cached() == ()
+
+                location = await service.create(LocationCreate(id="lan", name="LAN"))
+                await session.commit()
+                cached = await service.get_all_cached()
+                assert [loc.name for loc in cached] == ["LAN"]
+                # The commit cleared the pending-write flag, so reads use the cache again
+                assert await service.get_all_cached() is cached
+
+                await service.update(location, LocationUpdate(name="Home"))
+                await service.create(LocationCreate(id="dmz", name="DMZ"))
+                await session.commit()
+                assert [loc.name for loc in await service.get_all_cached()] == ["DMZ", "Home"]
+        finally:
+            await engine.dispose()
+
+    @pytest.mark.asyncio
+    async def test_read_racing_a_commit_is_not_cached(self, db: AsyncSession):
+        """A result read before another session's commit shouldn't be stored after it."""
+        service = LocationService(db)
+        read = service._location_options
+
+        async def read_then_commit_elsewhere():
+            options = await read()
+            invalidate_locations_cache()
+            return options
+
+        with patch.object(
+            LocationService, "_location_options", lambda self: read_then_commit_elsewhere()
+        ):
+            await service.get_all_cached()
+
+        assert location_service._locations_cache is None
+
+
+class TestLocationHostCounts:
+    """Tests for per-location host counts."""
+
+    @pytest.mark.asyncio
+    async def test_counts_include_empty_locations(self, db: AsyncSession):
+        """Every location is listed, including ones with no hosts."""
+        service = LocationService(db)
+        await service.create(LocationCreate(id="lan", name="LAN"))
+        await service.create(LocationCreate(id="dmz", name="DMZ"))
+        db.add_all(
+            [
+                Host(mac_address="aa:bb:cc:00:00:01", location_id="lan"),
+                Host(mac_address="aa:bb:cc:00:00:02", location_id="lan"),
+                Host(mac_address="aa:bb:cc:00:00:03"),
+            ]
+        )
+        await db.flush()
+
+        counts = await service.get_with_host_counts()
+
+        assert [(row["location"].id, row["host_count"]) for row in counts] == [
+            ("dmz", 0),
+            ("lan", 2),
+        ]
+
+
+class TestLocationLookup:
+    """Tests for looking up a single location."""
+
+    @pytest.mark.asyncio
+    async def test_get_loaded_location_skips_query(self, db: AsyncSession, count_statements):
+        """A location already in the session is returned without a SELECT."""
+        service = LocationService(db)
+        created = await service.create(LocationCreate(id="lan", name="LAN"))
+
+        with count_statements() as statements:
+            found = await service.get_by_id("lan")
+
+        assert found is created
+        assert statements == []
+        assert await service.get_by_id("missing") is None
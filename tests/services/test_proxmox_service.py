@@ -1,9 +1,12 @@
 """Tests for the ProxmoxService."""
 
+from dataclasses import replace
 from datetime import datetime
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
+from sqlalchemy import select
+from sqlalchemy.exc import InvalidRequestError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from myriad.config import (
@@ -20,15 +23,23 @@ from myriad.models import (
     HypervisorStatus,
     HypervisorType,
     VirtualMachine,
+    VMMacAddress,
+    VMSnapshot,
     VMState,
+    VMTag,
     VMType,
 )
 from myriad.services import ProxmoxService
+from myriad.services.pagination import page_cursors
+from myriad.services.proxmox_service import VM_LIST_ORDER, ProxmoxInventory
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_settings() -> Settings:
-    """Create mock settings with Proxmox integration."""
+    """Create mock settings with Proxmox integration.
+
+    Shared by every test, so tests that need a variation take a model_copy.
+    """
     return Settings(
         integrations=IntegrationsConfig(
             proxmox=[
@@ -52,6 +63,53 @@ def mock_settings() -> Settings:
     )
 
 
+@pytest.fixture
+async def hypervisor(db: AsyncSession, mock_settings: Settings) -> Hypervisor:
+    """A Proxmox hypervisor row for VM tests, written before the test runs."""
+    hypervisor = await ProxmoxService(db, mock_settings)._ensure_hypervisor(
+        integration_id="test-proxmox",
+        name="Test Proxmox",
+        api_url="https://192.168.1.10:8006",
+        credential_ref="proxmox.test",
+        location_id=None,
+        pve_version="8.4.14",
+        node_name=None,
+    )
+    await db.flush()
+    return hypervisor
+
+
+# Frozen, so tests derive variations with dataclasses.replace
+TEST_VM = ProxmoxVM(vmid=100, name="test-vm", node="pve", vm_type="qemu", status="running")
+
+
+def _settings_without_secrets(credential_ref: str) -> Settings:
+    """Settings with one Proxmox integration and no stored credentials."""
+    return Settings(
+        integrations=IntegrationsConfig(
+            proxmox=[
+                ProxmoxIntegrationConfig(
+                    id="proxmox-test",
+                    base_url="https://localhost:8006",
+                    credential_ref=credential_ref,
+                )
+            ]
+        ),
+        secrets=SecretsConfig(),
+    )
+
+
+INVALID_CREDENTIAL_REF_SETTINGS = _settings_without_secrets("invalid.format.ref")
+MISSING_CREDENTIALS_SETTINGS = _settings_without_secrets("proxmox.missing")
+
+
+def _debug_settings(settings: Settings) -> Settings:
+    """A copy of settings with debug mode on."""
+    return settings.model_copy(
+        update={"server": settings.server.model_copy(update={"debug": True})}
+    )
+
+
 class TestProxmoxServiceConfig:
     """Tests for ProxmoxService configuration handling."""
 
@@ -66,19 +124,7 @@ class TestProxmoxServiceConfig:
     @pytest.mark.asyncio
     async def test_sync_invalid_credential_ref(self, db: AsyncSession):
         """Test sync with invalid credential reference raises error."""
-        settings = Settings(
-            integrations=IntegrationsConfig(
-                proxmox=[
-                    ProxmoxIntegrationConfig(
-                        id="proxmox-test",
-                        base_url="https://localhost:8006",
-                        credential_ref="invalid.format.ref",  # Invalid format
-                    )
-                ]
-            ),
-            secrets=SecretsConfig(),
-        )
-        service = ProxmoxService(db, settings)
+        service = ProxmoxService(db, INVALID_CREDENTIAL_REF_SETTINGS)
 
         with pytest.raises(ValueError, match="Invalid credential reference"):
             await service.sync_proxmox("proxmox-test")
@@ -86,19 +132,7 @@ class TestProxmoxServiceConfig:
     @pytest.mark.asyncio
     async def test_sync_missing_credentials(self, db: AsyncSession):
         """Test sync with missing credentials raises error."""
-        settings = Settings(
-            integrations=IntegrationsConfig(
-                proxmox=[
-                    ProxmoxIntegrationConfig(
-                        id="proxmox-test",
-                        base_url="https://localhost:8006",
-                        credential_ref="proxmox.missing",
-                    )
-                ]
-            ),
-            secrets=SecretsConfig(),
-        )
-        service = ProxmoxService(db, settings)
+        service = ProxmoxService(db, MISSING_CREDENTIALS_SETTINGS)
 
         with pytest.raises(ValueError, match="not found"):
             await service.sync_proxmox("proxmox-test")
@@ -146,7 +180,6 @@ class TestProxmoxServiceHypervisor:
             pve_version="8.4.0",
             node_name=None,
         )
-        await db.flush()
 
         # Update
         hypervisor2 = await service._ensure_hypervisor(
@@ -168,32 +201,19 @@ class TestProxmoxServiceVM:
     """Tests for ProxmoxService VM management."""
 
     @pytest.mark.asyncio
-    async def test_upsert_vm_creates_new(self, db: AsyncSession, mock_settings: Settings):
+    async def test_upsert_vm_creates_new(
+        self, db: AsyncSession, mock_settings: Settings, hypervisor: Hypervisor
+    ):
         """Test that upsert_vm creates a new VM."""
         service = ProxmoxService(db, mock_settings)
 
-        # Create hypervisor first
-        hypervisor = await service._ensure_hypervisor(
-            integration_id="test-proxmox",
-            name="Test Proxmox",
-            api_url="https://192.168.1.10:8006",
-            credential_ref="proxmox.test",
-            location_id="home-lan",
-            pve_version="8.4.14",
-            node_name=None,
-        )
-        await db.flush()
-
-        pve_vm = ProxmoxVM(
-            vmid=100,
-            name="test-vm",
-            node="pve",
-            vm_type="qemu",
-            status="running",
+        pve_vm = replace(
+            TEST_VM,
             maxmem=2147483648,  # 2GB
             maxdisk=10737418240,  # 10GB
             uptime=3600,
             mac_addresses=["bc:24:11:aa:bb:cc"],
+            tags="web;prod",
         )
 
         vm, created = await service._upsert_vm(hypervisor, pve_vm)
@@ -205,62 +225,94 @@ class TestProxmoxServiceVM:
         assert vm.state == VMState.RUNNING
         assert vm.memory_mb == 2048
         assert vm.uptime_seconds == 3600
+        assert list(vm.mac_addresses) == ["bc:24:11:aa:bb:cc"]
+        assert sorted(vm.tags) == ["prod", "web"]
 
     @pytest.mark.asyncio
-    async def test_upsert_vm_updates_existing(self, db: AsyncSession, mock_settings: Settings):
+    async def test_upsert_vm_updates_existing(
+        self, db: AsyncSession, mock_settings: Settings, hypervisor: Hypervisor
+    ):
         """Test that upsert_vm updates an existing VM."""
         service = ProxmoxService(db, mock_settings)
 
-        # Create hypervisor
-        hypervisor = await service._ensure_hypervisor(
-            integration_id="test-proxmox",
-            name="Test Proxmox",
-            api_url="https://192.168.1.10:8006",
-            credential_ref="proxmox.test",
-            location_id="home-lan",
-            pve_version="8.4.14",
-            node_name=None,
-        )
-        await db.flush()
-
         # Create initial VM
-        pve_vm = ProxmoxVM(
-            vmid=100,
-            name="test-vm",
-            node="pve",
-            vm_type="qemu",
-            status="running",
+        pve_vm = replace(
+            TEST_VM,
             maxmem=2147483648,
         )
         vm1, created1 = await service._upsert_vm(hypervisor, pve_vm)
-        await db.flush()
         assert created1 is True
 
         # Update VM
-        pve_vm.status = "stopped"
-        pve_vm.maxmem = 4294967296  # 4GB
+        pve_vm = replace(
+            pve_vm,
+            status="stopped",
+            maxmem=4294967296,  # 4GB
+            mac_addresses=["bc:24:11:aa:bb:cc", "bc:24:11:aa:bb:dd"],
+            tags="web",
+        )
         vm2, created2 = await service._upsert_vm(hypervisor, pve_vm)
 
         assert created2 is False
         assert vm1.id == vm2.id
         assert vm2.state == VMState.STOPPED
         assert vm2.memory_mb == 4096
+        assert list(vm2.mac_addresses) == ["bc:24:11:aa:bb:cc", "bc:24:11:aa:bb:dd"]
+        assert list(vm2.tags) == ["web"]
 
     @pytest.mark.asyncio
-    async def test_upsert_lxc_container(self, db: AsyncSession, mock_settings: Settings):
-        """Test creating an LXC container."""
+    async def test_upsert_vms_stamps_changes_with_now(
+        self, db: AsyncSession, mock_settings: Settings, hypervisor: Hypervisor
+    ):
+        """State and tag changes should carry the caller's timestamp."""
+        now = datetime(2026, 1, 1, 12, 0, 0)
         service = ProxmoxService(db, mock_settings)
+        pve_vm = ProxmoxVM(vmid=100, name="vm", node="pve", vm_type="qemu", status="running")
+        await service._upsert_vms(hypervisor, [pve_vm])
 
-        hypervisor = await service._ensure_hypervisor(
-            integration_id="test-proxmox",
-            name="Test Proxmox",
-            api_url="https://192.168.1.10:8006",
-            credential_ref="proxmox.test",
-            location_id="home-lan",
-            pve_version="8.4.14",
-            node_name=None,
+        [(vm, created)] = await service._upsert_vms(
+            hypervisor, [replace(pve_vm, status="stopped", tags="web")], now=now
         )
-        await db.flush()
+
+        assert created is False
+        assert vm.last_state_change == now
+        assert vm.updated_at == now
+
+    @pytest.mark.asyncio
+    async def test_upsert_vms_statement_count_independent_of_vms(
+        self, db: AsyncSession, mock_settings: Settings, hypervisor: Hypervisor, count_statements
+    ):
+        """Re-syncing an inventory should issue the same statements for 1 or 4 VMs."""
+        service = ProxmoxService(db, mock_settings)
+
+        def inventory(vmids: range, status: str) -> list[ProxmoxVM]:
+            return [
+                ProxmoxVM(vmid=vmid, name=f"vm-{vmid}", node="pve", vm_type="qemu", status=status)
+                for vmid in vmids
+            ]
+
+        async def resync_statement_count(vmids: range) -> int:
+            with count_statements() as statements:
+                upserted = await service._upsert_vms(hypervisor, inventory(vmids, "stopped"))
+            assert [(vm.vmid, created) for vm, created in upserted] == [
+                (vmid, False) for vmid in vmids
+            ]
+            return len(statements)
+
+        upserted = await service._upsert_vms(hypervisor, inventory(range(100, 105), "running"))
+        assert all(created for _, created in upserted)
+
+        single = await resync_statement_count(range(100, 101))
+        several = await resync_statement_count(range(101, 105))
+
+        assert single == several
+
+    @pytest.mark.asyncio
+    async def test_upsert_lxc_container(
+        self, db: AsyncSession, mock_settings: Settings, hypervisor: Hypervisor
+    ):
+        """Test creating an LXC container."""
+        service = ProxmoxService(db, mock_settings)
 
         pve_vm = ProxmoxVM(
             vmid=101,
@@ -275,12 +327,187 @@ class TestProxmoxServiceVM:
         assert created is True
         assert vm.vm_type == VMType.LXC
 
+    @pytest.mark.asyncio
+    async def test_sync_snapshots_inserts_new_and_removes_stale(
+        self, db: AsyncSession, mock_settings: Settings, hypervisor: Hypervisor
+    ):
+        """Test that snapshot sync adds new snapshots and drops ones no longer present."""
+        service = ProxmoxService(db, mock_settings)
+        pve_vm = TEST_VM
+        vm, _ = await service._upsert_vm(hypervisor, pve_vm)
+
+        snapshots = [{"name": "before-upgrade"}, {"name": "nightly", "parent": "x"}]
+        assert await service._sync_snapshots([(vm, snapshots)]) == 2
+        vm.updated_at = datetime(2000, 1, 1)
+        await db.flush()
+
+        assert await service._sync_snapshots([(vm, [{"name": "nightly", "description": "d"}])]) == 0
+
+        result = await db.execute(select(VMSnapshot).where(VMSnapshot.vm_id == vm.id))
+        snapshots = result.scalars().all()
+        assert [(s.name, s.description) for s in snapshots] == [("nightly", "d")]
+        # The removal leaves no snapshot row to date it, so the VM row records it
+        assert vm.updated_at > datetime(2000, 1, 1)
+
+    @pytest.mark.asyncio
+    async def test_sync_snapshots_inserts_all_vms_at_once(
+        self, db: AsyncSession, mock_settings: Settings, hypervisor: Hypervisor, count_statements
+    ):
+        """New snapshots across several VMs should be written by one INSERT."""
+        service = ProxmoxService(db, mock_settings)
+        upserted = await service._upsert_vms(
+            hypervisor,
+            [
+                ProxmoxVM(
+                    vmid=vmid, name=f"vm-{vmid}", node="pve", vm_type="qemu", status="running"
+                )
+                for vmid in (100, 101)
+            ],
+        )
+
+        with count_statements() as statements:
+            synced = await service._sync_snapshots(
+                [(vm, [{"name": "nightly"}, {"name": "weekly"}]) for vm, _ in upserted]
+            )
+
+        assert synced == 4
+        assert len([s for s in statements if s.startswith("INSERT INTO vm_snapshots")]) == 1
+
+    @pytest.mark.asyncio
+    async def test_cleanup_stale_vms_removes_only_missing(
+        self, db: AsyncSession, mock_settings: Settings, hypervisor: Hypervisor
+    ):
+        """Test that cleanup deletes VMs the hypervisor no longer reports, with their snapshots."""
+        service = ProxmoxService(db, mock_settings)
+        kept, _ = await service._upsert_vm(
+            hypervisor,
+            ProxmoxVM(vmid=100, name="kept", node="pve", vm_type="qemu", status="running"),
+        )
+        stale, _ = await service._upsert_vm(
+            hypervisor,
+            ProxmoxVM(
+                vmid=101,
+                name="stale",
+                node="pve",
+                vm_type="qemu",
+                status="stopped",
+                tags="old",
+                mac_addresses=["bc:24:11:00:00:01"],
+            ),
+        )
+        await service._sync_snapshots([(stale, [{"name": "nightly"}])])
+
+        assert await service._cleanup_stale_vms(hypervisor.id, {kept.id}) == 1
+
+        result = await db.execute(select(VirtualMachine.name))
+        assert result.scalars().all() == ["kept"]
+        result = await db.execute(select(VMSnapshot))
+        assert result.scalars().all() == []
+        for child in (VMMacAddress, VMTag):
+            result = await db.execute(select(child))
+            assert result.scalars().all() == []
+
+    @pytest.mark.asyncio
+    async def test_vm_list_pages_read_the_list_order_index(
+        self, db: AsyncSession, mock_settings: Settings, hypervisor: Hypervisor, count_statements
+    ):
+        """Offset and cursor pages walk ix_virtual_machines_name_id instead of sorting."""
+        db.add_all(
+            VirtualMachine(
+                uuid=f"00000000-0000-0000-0002-{i:012d}",
+                name=f"vm-{i % 4}",
+                vm_type=VMType.QEMU,
+                hypervisor_id=hypervisor.id,
+            )
+            for i in range(12)
+        )
+        await db.flush()
+        service = ProxmoxService(db, mock_settings)
+        page, _ = await service.get_all_vms(limit=4, offset=4)
+        before, after = page_cursors(page, VM_LIST_ORDER)
+
+        with count_statements() as statements:
+            await service.get_all_vms(limit=4, offset=4)
+            await service.get_all_vms(limit=4, after=after)
+            await service.get_all_vms(limit=4, before=before)
+
+        pages = [
+            (statement, parameters)
+            for statement, parameters in zip(statements, statements.parameters, strict=True)
+            if "ORDER BY virtual_machines.name" in statement
+        ]
+        conn = await db.connection()
+        for statement, parameters in pages:
+            plan = await conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters)
+            details = [row[3] for row in plan]
+            assert "ix_virtual_machines_name_id" in " ".join(details)
+            assert not any("TEMP B-TREE" in detail for detail in details)
+        assert len(pages) == 3
+
+
+class TestProxmoxServiceLoading:
+    """Tests for relationship loading on VM queries."""
+
+    @pytest.mark.asyncio
+    async def test_debug_raises_on_unloaded_relationship(
+        self, db: AsyncSession, mock_settings: Settings, hypervisor: Hypervisor
+    ):
+        """In debug mode, touching a relationship the query didn't load should raise."""
+        service = ProxmoxService(db, _debug_settings(mock_settings))
+        await service._upsert_vm(
+            hypervisor,
+            TEST_VM,
+        )
+        await db.flush()
+        db.expunge_all()
+
+        vms, _ = await service.get_all_vms()
+
+        assert vms[0].hypervisor.name == "Test Proxmox"
+        with pytest.raises(InvalidRequestError):
+            _ = vms[0].snapshots
+
+    @pytest.mark.asyncio
+    async def test_debug_resync_loads_everything_it_touches(
+        self, db: AsyncSession, mock_settings: Settings
+    ):
+        """A repeat sync in debug mode shouldn't hit an unloaded relationship."""
+        service = ProxmoxService(db, _debug_settings(mock_settings))
+        vm = ProxmoxVM(vmid=100, name="vm", node="pve", vm_type="qemu", status="running")
+        first = ProxmoxInventory(
+            pve_version="8.4.14",
+            vms=[vm],
+            snapshots=[[{"name": "nightly"}, {"name": "weekly"}]],
+        )
+        second = ProxmoxInventory(
+            pve_version="8.4.14",
+            vms=[replace(vm, status="stopped", tags="web")],
+            snapshots=[[{"name": "nightly", "description": "kept"}]],
+        )
+
+        # Flush instead of committing so the fixture's rollback still cleans up
+        with (
+            patch.object(
+                ProxmoxService, "_fetch_inventory", AsyncMock(side_effect=[first, second])
+            ),
+            patch.object(db, "commit", db.flush),
+        ):
+            await service.sync_proxmox("proxmox-test")
+            db.expunge_all()
+            result = await service.sync_proxmox("proxmox-test")
+
+        assert (result.vms_updated, result.snapshots_synced, result.error) == (1, 0, None)
+        snapshots = (await db.execute(select(VMSnapshot))).scalars().all()
+        assert [(s.name, s.description) for s in snapshots] == [("nightly", "kept")]
+
 
 class TestProxmoxServiceHostLinking:
     """Tests for VM-to-Host linking."""
 
     @pytest.mark.asyncio
-    async def test_link_vm_to_host(self, db: AsyncSession, mock_settings: Settings):
+    async def test_link_vm_to_host(
+        self, db: AsyncSession, mock_settings: Settings, hypervisor: Hypervisor
+    ):
         """Test linking a VM to a host by MAC address."""
         service = ProxmoxService(db, mock_settings)
 
@@ -292,68 +519,134 @@ class TestProxmoxServiceHostLinking:
         db.add(host)
         await db.flush()
 
-        # Create hypervisor and VM
-        hypervisor = await service._ensure_hypervisor(
-            integration_id="test-proxmox",
-            name="Test Proxmox",
-            api_url="https://192.168.1.10:8006",
-            credential_ref="proxmox.test",
-            location_id="home-lan",
-            pve_version="8.4.14",
-            node_name=None,
-        )
-        await db.flush()
-
-        pve_vm = ProxmoxVM(
-            vmid=100,
-            name="test-vm",
-            node="pve",
-            vm_type="qemu",
-            status="running",
+        # Create VM
+        pve_vm = replace(
+            TEST_VM,
             mac_addresses=["bc:24:11:aa:bb:cc"],
         )
         vm, _ = await service._upsert_vm(hypervisor, pve_vm)
-        await db.flush()
 
         # Link VM to host
-        linked = await service._link_vm_to_host(vm, "bc:24:11:aa:bb:cc", "home-lan")
+        linked = await service._link_vms_to_hosts(hypervisor.id)
 
-        assert linked is True
+        assert linked == 1
+        await db.refresh(vm)
         assert vm.host_id == host.id
 
+        # Already linked, so nothing changes on the next sync
+        assert await service._link_vms_to_hosts(hypervisor.id) == 0
+
     @pytest.mark.asyncio
-    async def test_link_vm_no_matching_host(self, db: AsyncSession, mock_settings: Settings):
+    async def test_link_vm_no_matching_host(
+        self, db: AsyncSession, mock_settings: Settings, hypervisor: Hypervisor
+    ):
         """Test linking when no host matches the MAC address."""
         service = ProxmoxService(db, mock_settings)
 
-        # Create hypervisor and VM (no host with matching MAC)
-        hypervisor = await service._ensure_hypervisor(
-            integration_id="test-proxmox",
-            name="Test Proxmox",
-            api_url="https://192.168.1.10:8006",
-            credential_ref="proxmox.test",
-            location_id="home-lan",
-            pve_version="8.4.14",
-            node_name=None,
-        )
-        await db.flush()
-
-        pve_vm = ProxmoxVM(
-            vmid=100,
-            name="test-vm",
-            node="pve",
-            vm_type="qemu",
-            status="running",
+        # Create VM (no host with matching MAC)
+        pve_vm = replace(
+            TEST_VM,
+            mac_addresses=["aa:bb:cc:dd:ee:ff"],
         )
         vm, _ = await service._upsert_vm(hypervisor, pve_vm)
-        await db.flush()
 
         # Try to link with non-existent MAC
-        linked = await service._link_vm_to_host(vm, "aa:bb:cc:dd:ee:ff", "home-lan")
+        linked = await service._link_vms_to_hosts(hypervisor.id)
 
-        assert linked is False
+        assert linked == 0
+        await db.refresh(vm)
         assert vm.host_id is None
 
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("vm_count", [1, 50])
+    async def test_link_many_vms_is_one_statement(
+        self,
+        db: AsyncSession,
+        mock_settings: Settings,
+        hypervisor: Hypervisor,
+        count_statements,
+        vm_count: int,
+    ):
+        """Linking a whole hypervisor's VMs should be one UPDATE however many there are."""
+        service = ProxmoxService(db, mock_settings)
+        # Every other VM has a matching host
+        hosts = {
+            vmid: Host(mac_address=f"bc:24:11:00:{vmid // 256:02x}:{vmid % 256:02x}")
+            for vmid in range(0, vm_count, 2)
+        }
+        db.add_all(hosts.values())
+        await db.flush()
+        await service._upsert_vms(
+            hypervisor,
+            [
+                ProxmoxVM(
+                    vmid=vmid,
+                    name=f"vm-{vmid}",
+                    node="pve",
+                    vm_type="qemu",
+                    status="running",
+                    mac_addresses=[f"bc:24:11:00:{vmid // 256:02x}:{vmid % 256:02x}"],
+                )
+                for vmid in range(vm_count)
+            ],
+        )
+
+        with count_statements() as statements:
+            linked = await service._link_vms_to_hosts(hypervisor.id)
+
+        assert len(statements) == 1
+        assert linked == len(hosts)
+        links = await db.execute(select(VirtualMachine.vmid, VirtualMachine.host_id))
+        assert {vmid: host_id for vmid, host_id in links} == {
+            vmid: hosts[vmid].id if vmid in hosts else None for vmid in range(vm_count)
+        }
+
+
+class TestProxmoxServiceSyncAll:
+    """Tests for syncing every configured Proxmox instance."""
+
+    @pytest.mark.asyncio
+    async def test_failed_instance_does_not_block_others(
+        self, db: AsyncSession, mock_settings: Settings
+    ):
+        """Each instance is fetched independently; a failure only affects its own result."""
+        down = ProxmoxIntegrationConfig(
+            id="proxmox-down",
+            base_url="https://192.168.1.11:8006",
+            credential_ref="proxmox.test",
+        )
+        integrations = mock_settings.integrations.model_copy(
+            update={"proxmox": [*mock_settings.integrations.proxmox, down]}
+        )
+        settings = mock_settings.model_copy(update={"integrations": integrations})
+        service = ProxmoxService(db, settings)
+        inventory = ProxmoxInventory(
+            pve_version="8.4.14",
+            vms=[ProxmoxVM(vmid=100, name="vm", node="pve", vm_type="qemu", status="running")],
+            snapshots=[[{"name": "nightly"}]],
+        )
+
+        async def fetch(config, credentials):
+            if config.id == "proxmox-down":
+                raise ConnectionError("unreachable")
+            return inventory
+
+        # Flush instead of committing so the fixture's rollback still cleans up
+        with (
+            patch.object(ProxmoxService, "_fetch_inventory", AsyncMock(side_effect=fetch)),
+            patch.object(db, "commit", db.flush),
+        ):
+            results = await service.sync_all_proxmox()
+
+        up, down = results
+        assert (up.hypervisor_id, up.vms_created, up.snapshots_synced, up.error) == (
+            "proxmox-test",
+            1,
+            1,
+            None,
+        )
+        assert (down.hypervisor_id, down.error) == ("proxmox-down", "unreachable")
+
 
 class TestProxmoxServiceStats:
     """Tests for VM statistics."""
@@ -372,22 +665,12 @@ class TestProxmoxServiceStats:
         assert stats["lxc"] == 0
 
     @pytest.mark.asyncio
-    async def test_get_vm_stats_with_vms(self, db: AsyncSession, mock_settings: Settings):
+    async def test_get_vm_stats_with_vms(
+        self, db: AsyncSession, mock_settings: Settings, hypervisor: Hypervisor
+    ):
         """Test stats with various VMs."""
         service = ProxmoxService(db, mock_settings)
 
-        # Create hypervisor
-        hypervisor = await service._ensure_hypervisor(
-            integration_id="test-proxmox",
-            name="Test Proxmox",
-            api_url="https://192.168.1.10:8006",
-            credential_ref="proxmox.test",
-            location_id="home-lan",
-            pve_version="8.4.14",
-            node_name=None,
-        )
-        await db.flush()
-
         # Create VMs
         vm1 = VirtualMachine(
             uuid="00000000-0000-0000-0001-000000000001",
@@ -0,0 +1,69 @@
+"""Tests for the SyncService."""
+
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from myriad.config import (
+    IntegrationsConfig,
+    OPNsenseCredentials,
+    OPNsenseIntegrationConfig,
+    SecretsConfig,
+    Settings,
+)
+from myriad.integrations.opnsense import DHCPLease
+from myriad.services import SyncService
+
+
+@pytest.fixture
+def mock_settings() -> Settings:
+    """Create mock settings with two OPNsense integrations."""
+    return Settings(
+        integrations=IntegrationsConfig(
+            opnsense=[
+                OPNsenseIntegrationConfig(
+                    id="opnsense-lan",
+                    base_url="https://192.168.1.1",
+                    credential_ref="opnsense.test",
+                ),
+                OPNsenseIntegrationConfig(
+                    id="opnsense-down",
+                    base_url="https://192.168.2.1",
+                    credential_ref="opnsense.test",
+                ),
+            ]
+        ),
+        secrets=SecretsConfig(
+            opnsense={"test": OPNsenseCredentials(api_key="key", api_secret="secret")}
+        ),
+    )
+
+
+class TestSyncAllOPNsense:
+    """Tests for syncing every configured OPNsense instance."""
+
+    @pytest.mark.asyncio
+    async def test_failed_instance_does_not_block_others(
+        self, db: AsyncSession, mock_settings: Settings
+    ):
+        """Each instance is fetched independently; a failure only affects its own result."""
+        service = SyncService(db, mock_settings)
+
+        async def fetch(config, credentials):
+            if config.id == "opnsense-down":
+                raise ConnectionError("unreachable")
+            return [
+                DHCPLease(
+                    mac_address="aa:bb:cc:dd:ee:01",
+                    ip_address="192.168.1.10",
+                    hostname="laptop",
+                    is_static=False,
+                )
+            ]
+
+        with patch.object(service, "_fetch_hosts", AsyncMock(side_effect=fetch)):
+            lan, down = await service.sync_all_opnsense()
+
+        assert (lan.source, lan.created, lan.updated) == ("opnsense:opnsense-lan", 1, 0)
+        assert (down.source, down.created, down.updated) == ("opnsense:opnsense-down", 0, 0)
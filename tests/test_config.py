@@ -0,0 +1,141 @@
+"""Tests for configuration loading."""
+
+import os
+from collections.abc import Generator
+from pathlib import Path
+
+import pytest
+from pydantic import BaseModel, ValidationError
+
+from myriad import config
+from myriad.config import invalidate_settings_cache, load_settings
+
+
+@pytest.fixture
+def config_dir(tmp_path: Path) -> Generator[Path, None, None]:
+    """Create a config directory with a minimal myriad.toml."""
+    (tmp_path / "myriad.toml").write_text(
+        '[server]\nport = 9000\n\n[[locations]]\nid = "home-lan"\nname = "Home LAN"\n'
+    )
+    invalidate_settings_cache()
+    yield tmp_path
+    invalidate_settings_cache()
+
+
+class TestSettingsCache:
+    """Tests for mtime-keyed settings caching."""
+
+    def test_unchanged_files_return_cached_settings(self, config_dir: Path):
+        """Loading the same unchanged directory twice should reuse the Settings."""
+        first = load_settings(config_dir)
+        second = load_settings(config_dir)
+
+        assert first is second
+        assert first.server.port == 9000
+        assert [loc.id for loc in first.locations] == ["home-lan"]
+
+    def test_modified_file_is_reloaded(self, config_dir: Path):
+        """Changing myriad.toml should produce fresh Settings."""
+        first = load_settings(config_dir)
+
+        config_path = config_dir / "myriad.toml"
+        config_path.write_text("[server]\nport = 9001\n")
+        stat = config_path.stat()
+        os.utime(config_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        second = load_settings(config_dir)
+
+        assert second is not first
+        assert second.server.port == 9001
+        assert second.locations == []
+
+    def test_new_secrets_file_is_picked_up(self, config_dir: Path):
+        """Adding secrets.toml should invalidate the cached Settings."""
+        first = load_settings(config_dir)
+        assert first.secrets.proxmox == {}
+
+        (config_dir / "secrets.toml").write_text(
+            '[proxmox.main]\ntoken_id = "root@pam!myriad"\ntoken_secret = "secret"\n'
+        )
+
+        second = load_settings(config_dir)
+
+        assert second.secrets.proxmox["main"].token_id == "root@pam!myriad"
+
+    def test_invalidate_forces_reload(self, config_dir: Path):
+        """invalidate_settings_cache() should drop the cached Settings."""
+        first = load_settings(config_dir)
+
+        invalidate_settings_cache()
+
+        assert load_settings(config_dir) is not first
+
+    def test_init_settings_overrides_stay_out_of_cache(
+        self, config_dir: Path, monkeypatch: pytest.MonkeyPatch
+    ):
+        """Mutating the app's settings shouldn't change later load_settings() results."""
+        monkeypatch.setattr(config, "_settings", None)
+        settings = config.init_settings(config_dir)
+
+        settings.server.debug = True
+
+        assert config.get_settings() is settings
+        assert load_settings(config_dir).server.debug is False
+
+
+class TestSectionParsing:
+    """Tests for validating TOML sections into config models."""
+
+    def test_integrations_parsed(self, config_dir: Path):
+        """Each integration list should be validated into its config model."""
+        (config_dir / "myriad.toml").write_text(
+            "[[integrations.proxmox]]\n"
+            'id = "pve"\n'
+            'base_url = "https://10.0.1.10:8006"\n'
+            'credential_ref = "proxmox.main"\n'
+        )
+
+        settings = load_settings(config_dir)
+
+        assert [p.id for p in settings.integrations.proxmox] == ["pve"]
+        assert settings.integrations.proxmox[0].verify_ssl is True
+        assert settings.integrations.opnsense == []
+
+    def test_invalid_entry_rejected(self, config_dir: Path):
+        """An entry missing required fields should fail validation."""
+        (config_dir / "myriad.toml").write_text('[[locations]]\nid = "no-name"\n')
+
+        with pytest.raises(ValidationError):
+            load_settings(config_dir)
+
+
+class TestSchemaBuild:
+    """Tests that config validators are compiled up front."""
+
+    def test_config_models_built_at_import(self):
+        """No config model should defer its schema build to the first load."""
+        models = [
+            obj
+            for obj in vars(config).values()
+            if isinstance(obj, type)
+            and issubclass(obj, BaseModel)
+            and obj.__module__ == config.__name__
+        ]
+
+        assert models
+        assert all(model.__pydantic_complete__ for model in models)
+
+
+class TestDerivedSettings:
+    """Tests for values computed from settings."""
+
+    def test_session_max_age_seconds(self):
+        """The cookie lifetime follows session_expire_hours."""
+        assert config.Settings(session_expire_hours=2).session_max_age_seconds == 7200
+
+    def test_integrations_summary(self):
+        """Dashboard integration counts are computed once per settings object."""
+        settings = config.Settings()
+
+        assert settings.integrations_summary == {"opnsense": 0, "unifi": 0}
+        assert settings.integrations_summary is settings.integrations_summary
@@ -0,0 +1,70 @@
+"""Tests for ORM model registration and column types."""
+
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import select, text
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.exc import StatementError
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import configure_mappers
+
+import myriad.models
+from myriad.models import Base, Host, HostStatus, utc_now
+
+
+def test_each_table_mapped_once():
+    """Every table should have exactly one mapped class."""
+    configure_mappers()
+
+    mapped_tables = [mapper.local_table.name for mapper in Base.registry.mappers]
+
+    assert sorted(mapped_tables) == sorted(Base.metadata.tables)
+
+
+def test_every_model_exported():
+    """Every mapped class should be importable from myriad.models."""
+    mapped_classes = {mapper.class_.__name__ for mapper in Base.registry.mappers}
+
+    assert mapped_classes <= set(myriad.models.__all__)
+
+
+class TestUtcNow:
+    """Tests for the dialect-aware UTC clock."""
+
+    def test_postgresql_converts_to_utc(self):
+        """PostgreSQL's now() is read in UTC, not the session TimeZone."""
+        sql = str(select(utc_now()).compile(dialect=postgresql.dialect()))
+
+        assert "timezone('UTC', now())" in sql
+
+    async def test_matches_utcnow_on_sqlite(self, db: AsyncSession):
+        """The database clock agrees with datetime.utcnow()."""
+        db_now = await db.scalar(select(utc_now()))
+
+        assert abs(db_now - datetime.utcnow()) < timedelta(minutes=1)
+
+
+class TestEnumColumns:
+    """Tests for str Enum columns."""
+
+    @pytest.mark.asyncio
+    async def test_stored_as_value_and_loaded_as_member(self, db: AsyncSession):
+        """Enums should be stored as their value and come back as enum members."""
+        db.add(Host(mac_address="aa:bb:cc:dd:ee:01", status=HostStatus.ONLINE))
+        await db.flush()
+
+        raw = await db.execute(text("SELECT status FROM hosts"))
+        assert raw.scalar_one() == "online"
+
+        db.expunge_all()
+        host = (await db.execute(select(Host))).scalar_one()
+        assert host.status is HostStatus.ONLINE
+
+    @pytest.mark.asyncio
+    async def test_unknown_value_rejected(self, db: AsyncSession):
+        """Strings that aren't enum values should not reach the database."""
+        db.add(Host(mac_address="aa:bb:cc:dd:ee:02", status="sleeping"))
+
+        with pytest.raises(StatementError):
+            await db.flush()